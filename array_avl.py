@@ -0,0 +1,927 @@
+""" AVL Tree stored as a struct of parallel arrays.
+
+Instead of one object per node, node number h keeps its key in
+key_array[h], its item in item_array[h], its children in left_array[h]
+and right_array[h] and its height in height_array[h]. Links are integer handles into these arrays, and
+handle 0 is a sentinel standing for an empty sub-tree with height 0.
+Slots of deleted nodes are chained through their left link into a free
+list and reused by later insertions.
+"""
+
+from __future__ import annotations
+
+__docformat__ = 'reStructuredText'
+
+from array import array
+from bst import TreeStatistics
+from typing import TypeVar, Generic, Iterable, Iterator, List
+from node import TreeNode
+import operator
+
+K = TypeVar('K')
+I = TypeVar('I')
+
+
+class ArrayAVLTree(TreeStatistics, Generic[K, I]):
+    """ Handle-based AVL map whose nodes are integer handles into parallel
+        arrays rather than objects. It halves the memory per node, but
+        lookups and scans are slower than in AVLTree, since every link is
+        read out of an array.
+
+        It offers the interface of AVLTree: the map operations, iteration,
+        range_between, the peek/pop methods, join, split, union, get_many,
+        update and statistics. peek_min, peek_max, pop_min and pop_max
+        return a detached TreeNode holding the key and item. get_root,
+        get_minimal and get_maximal take and return int handles, read with
+        get_key and get_item, so they cannot be used where AVLTree nodes
+        are expected.
+
+        Handles are only meaningful in the arrays of their own tree, so
+        join and union copy the nodes of one tree into the arrays of the
+        other, and split copies the smaller part out.
+    """
+
+    MIN_CAPACITY = 1
+    NIL = 0
+
+    def __init__(self, capacity: int = 1) -> None:
+        """
+            Initialises an empty tree with room for capacity nodes
+            before the arrays have to grow.
+            :complexity: O(capacity)
+        """
+        size = max(self.MIN_CAPACITY, capacity) + 1
+        self.key_array = [None] * size
+        self.item_array = [None] * size
+        self.left_array = array('i', bytes(4 * size))
+        self.right_array = array('i', bytes(4 * size))
+        self.height_array = array('b', bytes(size))
+        self.root = self.NIL
+        self.length = 0
+        self.used = 1  # slots handed out so far, including the sentinel
+        self.free = self.NIL  # head of the free list of deleted slots
+        self.min_handle = self.NIL
+        self.max_handle = self.NIL
+        if self.COLLECT_STATISTICS:
+            self.enable_statistics()
+
+    def enable_statistics(self) -> None:
+        """
+            Starts counting the operations on this tree from zero. find is
+            a loop rather than a recursion, so it is replaced by counted_find;
+            the recursive methods and rotations are wrapped as in AVLTree.
+            :complexity: O(1)
+        """
+        if self.statistics_enabled:
+            return
+        TreeStatistics.enable_statistics(self)
+        self.find = self.counted_find
+        self.counted_methods.append('find')
+        self.count_descent('insert_aux', operator.lt)
+        self.count_descent('delete_aux', operator.lt)
+        self.count_descent('pop_max_aux')
+        self.count_descent('pop_min_aux')
+        self.count_rotations()
+
+    def __len__(self) -> int:
+        """
+            Returns the number of nodes in the tree.
+            :complexity: O(1)
+        """
+        return self.length
+
+    def is_empty(self) -> bool:
+        """
+            Checks to see if the tree is empty
+            :complexity: O(1)
+        """
+        return self.root == self.NIL
+
+    def clear(self) -> None:
+        """
+            Makes the tree empty, keeping the arrays allocated.
+            :complexity: O(N) to release the references held in the slots
+        """
+        for handle in range(1, self.used):
+            self.key_array[handle] = self.item_array[handle] = None
+        self.root = self.NIL
+        self.length = 0
+        self.used = 1
+        self.free = self.NIL
+        self.min_handle = self.NIL
+        self.max_handle = self.NIL
+
+    def __contains__(self, key: K) -> bool:
+        """
+            Checks to see if the key is in the tree
+            :complexity: see find(self, key: K) -> int
+        """
+        return self.find(key) != self.NIL
+
+    def __getitem__(self, key: K) -> I:
+        """
+            Returns the item stored at key.
+            :complexity: see find(self, key: K) -> int
+            :raises KeyError: if the key is not in the tree
+        """
+        handle = self.find(key)
+        if handle == self.NIL:
+            raise KeyError('Key not found: {0}'.format(key))
+        return self.item_array[handle]
+
+    def find(self, key: K) -> int:
+        """
+            Returns the handle of the node holding key, or NIL if there is none.
+
+            :complexity best: O(CompK) finds the item in the root of the tree
+            :complexity worst: O(CompK * D) item is not found, where D is the depth of the tree
+            CompK is the complexity of comparing the keys
+        """
+        keys, left, right = self.key_array, self.left_array, self.right_array
+        current = self.root
+        while current != self.NIL:
+            current_key = keys[current]
+            if key == current_key:
+                return current
+            current = left[current] if key < current_key else right[current]
+        return self.NIL
+
+    def counted_find(self, key: K) -> int:
+        """
+            Same as find, but also counts the nodes it enters and its
+            comparisons, one for == and one more for < below every node
+            that does not hold key.
+
+            Complexity: see find(self, key: K) -> int
+        """
+        keys, left, right = self.key_array, self.left_array, self.right_array
+        current = self.root
+        visits = comparisons = 0
+        while current != self.NIL:
+            visits += 1
+            comparisons += 1
+            current_key = keys[current]
+            if key == current_key:
+                break
+            comparisons += 1
+            current = left[current] if key < current_key else right[current]
+        self.operation_count += 1
+        self.visit_total += visits
+        self.comparison_count += comparisons
+        self.depth_max = max(self.depth_max, visits)
+        return current
+
+    def get_root(self) -> int:
+        """
+            Returns the handle of the root of the tree
+            :complexity: O(1)
+        """
+        return self.root
+
+    def get_key(self, handle: int) -> K:
+        """
+            Returns the key of the node with the given handle.
+            :complexity: O(1)
+        """
+        return self.key_array[handle]
+
+    def get_item(self, handle: int) -> I:
+        """
+            Returns the item of the node with the given handle.
+            :complexity: O(1)
+        """
+        return self.item_array[handle]
+
+    def get_height(self, current: int) -> int:
+        """
+            Get the height of a node. The sentinel has height 0.
+            :complexity: O(1)
+        """
+        return self.height_array[current]
+
+    def get_balance(self, current: int) -> int:
+        """
+            Compute the balance factor for the current sub-tree as the value
+            (right.height - left.height).
+            :complexity: O(1)
+        """
+        return self.height_array[self.right_array[current]] - self.height_array[self.left_array[current]]
+
+    def update_height(self, current: int) -> None:
+        """
+            Recomputes the height of current from the heights of its children.
+            :complexity: O(1)
+        """
+        height = self.height_array
+        left_height, right_height = height[self.left_array[current]], height[self.right_array[current]]
+        height[current] = 1 + (left_height if left_height > right_height else right_height)
+
+    def allocate(self, key: K, item: I) -> int:
+        """
+            Returns a fresh leaf handle holding key and item, reusing a
+            deleted slot if there is one and growing the arrays otherwise.
+            :complexity: O(1) amortised
+        """
+        if self.free != self.NIL:
+            handle = self.free
+            self.free = self.left_array[handle]
+        else:
+            if self.used == len(self.key_array):
+                self.grow()
+            handle = self.used
+            self.used += 1
+        self.key_array[handle] = key
+        self.item_array[handle] = item
+        self.left_array[handle] = self.right_array[handle] = self.NIL
+        self.height_array[handle] = 1
+        return handle
+
+    def release(self, handle: int) -> None:
+        """
+            Puts the slot of a deleted node on the free list.
+            :complexity: O(1)
+        """
+        self.key_array[handle] = self.item_array[handle] = None
+        self.height_array[handle] = 0
+        self.left_array[handle] = self.free
+        self.free = handle
+
+    def grow(self) -> None:
+        """
+            Doubles the number of slots in every array.
+            :complexity: O(N) where N is the current number of slots
+        """
+        extra = len(self.key_array)
+        self.key_array.extend([None] * extra)
+        self.item_array.extend([None] * extra)
+        self.left_array.frombytes(bytes(4 * extra))
+        self.right_array.frombytes(bytes(4 * extra))
+        self.height_array.frombytes(bytes(extra))
+
+    def __setitem__(self, key: K, item: I) -> None:
+        """
+            Inserts the item at key.
+            :complexity: see insert_aux(self, current: int, key: K, item: I) -> int
+            :raises ValueError: if the key is already in the tree
+        """
+        self.root = self.insert_aux(self.root, key, item)
+
+    def insert_aux(self, current: int, key: K, item: I) -> int:
+        """
+            Attempts to insert an item into the sub-tree of current and
+            returns the new root handle of the sub-tree.
+
+            :complexity best: O(CompK) inserts the item at the root.
+            :complexity worst: O(CompK * D) inserting at the bottom of the tree
+            where D is the depth of the tree
+            CompK is the complexity of comparing the keys
+        """
+        if current == self.NIL:  # base case: at the leaf
+            self.length += 1
+            current = self.allocate(key, item)
+            # the cached extremes only change when the new node goes past them
+            if self.min_handle == self.NIL or key < self.key_array[self.min_handle]:
+                self.min_handle = current
+            if self.max_handle == self.NIL or key > self.key_array[self.max_handle]:
+                self.max_handle = current
+            return current
+        elif key < self.key_array[current]:
+            self.left_array[current] = self.insert_aux(self.left_array[current], key, item)
+        elif key > self.key_array[current]:
+            self.right_array[current] = self.insert_aux(self.right_array[current], key, item)
+        else:  # key == current key
+            raise ValueError('Inserting duplicate item')
+
+        self.update_height(current)
+        return self.rebalance(current)
+
+    def __delitem__(self, key: K) -> None:
+        """
+            Deletes the item at key, refreshing the cached minimum and
+            maximum if either was removed.
+            :complexity: see delete_aux(self, current: int, key: K) -> int
+            :raises ValueError: if the key is not in the tree
+        """
+        # the extremes have at most one child, so deleting their key always removes their slot
+        keys = self.key_array
+        removes_extreme = self.min_handle != self.NIL and \
+            (key == keys[self.min_handle] or key == keys[self.max_handle])
+        self.root = self.delete_aux(self.root, key)
+        if removes_extreme:
+            self.update_extremes()
+
+    def delete_aux(self, current: int, key: K) -> int:
+        """
+            Attempts to delete key from the sub-tree of current and returns
+            the new root handle of the sub-tree.
+
+            :complexity best: O(CompK) deletes the item at the root.
+            :complexity worst: O(CompK * D) deletes at the bottom of the tree
+            where D is the depth of the tree
+            CompK is the complexity of comparing the keys
+        """
+        if current == self.NIL:  # key not found
+            raise ValueError('Deleting non-existent item')
+        elif key < self.key_array[current]:
+            self.left_array[current] = self.delete_aux(self.left_array[current], key)
+        elif key > self.key_array[current]:
+            self.right_array[current] = self.delete_aux(self.right_array[current], key)
+        else:  # we found our key => do actual deletion
+            left, right = self.left_array[current], self.right_array[current]
+            if left == self.NIL or right == self.NIL:
+                self.length -= 1
+                self.release(current)
+                return right if left == self.NIL else left
+
+            # general case => move the successor into this slot
+            succ = self.get_minimal(right)
+            self.key_array[current] = self.key_array[succ]
+            self.item_array[current] = self.item_array[succ]
+            if succ == self.max_handle:  # the maximum moves into current
+                self.max_handle = current
+            self.right_array[current] = self.delete_aux(right, self.key_array[succ])
+
+        self.update_height(current)
+        return self.rebalance(current)
+
+    def get_minimal(self, current: int) -> int:
+        """
+            Get the handle of the node having the smallest key in the sub-tree of current.
+            :complexity: O(D) where D is the depth of the sub-tree
+        """
+        left = self.left_array
+        while left[current] != self.NIL:
+            current = left[current]
+        return current
+
+    def get_maximal(self, current: int) -> int:
+        """
+            Get the handle of the node having the largest key in the sub-tree of current.
+            :complexity: O(D) where D is the depth of the sub-tree
+        """
+        right = self.right_array
+        while right[current] != self.NIL:
+            current = right[current]
+        return current
+
+    def peek_min(self) -> TreeNode:
+        """
+            Returns a detached node holding the smallest key and its item.
+            :complexity: O(1)
+            :raises ValueError: if the tree is empty
+        """
+        if self.min_handle == self.NIL:
+            raise ValueError('Peeking into an empty tree')
+        return TreeNode(self.key_array[self.min_handle], self.item_array[self.min_handle])
+
+    def peek_max(self) -> TreeNode:
+        """
+            Returns a detached node holding the largest key and its item.
+            :complexity: O(1)
+            :raises ValueError: if the tree is empty
+        """
+        if self.max_handle == self.NIL:
+            raise ValueError('Peeking into an empty tree')
+        return TreeNode(self.key_array[self.max_handle], self.item_array[self.max_handle])
+
+    def update_extremes(self) -> None:
+        """
+            Recomputes the cached minimum and maximum handles from the root.
+            Called only when a cached node has been removed.
+            :complexity: O(D) where D is the depth of the tree
+        """
+        if self.root == self.NIL:
+            self.min_handle = self.max_handle = self.NIL
+        else:
+            self.min_handle = self.get_minimal(self.root)
+            self.max_handle = self.get_maximal(self.root)
+
+    def pop_min(self) -> TreeNode:
+        """
+            Removes the smallest key in a single descent and returns a
+            detached node holding it and its item.
+            :complexity: O(D) where D is the depth of the tree
+            :raises ValueError: if the tree is empty
+        """
+        if self.root == self.NIL:
+            raise ValueError('Popping from an empty tree')
+        popped = TreeNode(None)
+        self.root = self.pop_min_aux(self.root, popped)
+        if self.root == self.NIL:
+            self.max_handle = self.NIL
+        return popped
+
+    def pop_min_aux(self, current: int, popped: TreeNode) -> int:
+        """
+            Removes the smallest key of the sub-tree of current, recording it
+            in popped, and returns the new root handle of the sub-tree. The
+            new minimum is cached in min_handle on the way, as in
+            AVLTree.pop_min_aux.
+            :complexity: O(D) where D is the depth of the sub-tree
+        """
+        if self.left_array[current] == self.NIL:  # base case: current is the minimum
+            popped.key, popped.item = self.key_array[current], self.item_array[current]
+            right = self.right_array[current]
+            self.length -= 1
+            self.release(current)
+            self.min_handle = self.NIL if right == self.NIL else self.get_minimal(right)
+            return right
+
+        self.left_array[current] = self.pop_min_aux(self.left_array[current], popped)
+        if self.min_handle == self.NIL:
+            self.min_handle = current
+        self.update_height(current)
+        return self.rebalance(current)
+
+    def pop_max(self) -> TreeNode:
+        """
+            Removes the largest key in a single descent and returns a
+            detached node holding it and its item.
+            :complexity: O(D) where D is the depth of the tree
+            :raises ValueError: if the tree is empty
+        """
+        if self.root == self.NIL:
+            raise ValueError('Popping from an empty tree')
+        popped = TreeNode(None)
+        self.root = self.pop_max_aux(self.root, popped)
+        if self.root == self.NIL:
+            self.min_handle = self.NIL
+        return popped
+
+    def pop_max_aux(self, current: int, popped: TreeNode) -> int:
+        """
+            Removes the largest key of the sub-tree of current, recording it
+            in popped, and returns the new root handle of the sub-tree. The
+            new maximum is cached in max_handle on the way, as in
+            AVLTree.pop_max_aux.
+            :complexity: O(D) where D is the depth of the sub-tree
+        """
+        if self.right_array[current] == self.NIL:  # base case: current is the maximum
+            popped.key, popped.item = self.key_array[current], self.item_array[current]
+            left = self.left_array[current]
+            self.length -= 1
+            self.release(current)
+            self.max_handle = self.NIL if left == self.NIL else self.get_maximal(left)
+            return left
+
+        self.right_array[current] = self.pop_max_aux(self.right_array[current], popped)
+        if self.max_handle == self.NIL:
+            self.max_handle = current
+        self.update_height(current)
+        return self.rebalance(current)
+
+    def left_rotate(self, current: int) -> int:
+        """
+            Perform left rotation of the sub-tree rooted at current and
+            return the handle of the new root. See AVLTree.left_rotate.
+            :complexity: O(1)
+        """
+        new_root = self.right_array[current]
+        self.right_array[current] = self.left_array[new_root]
+        self.left_array[new_root] = current
+        self.update_height(current)
+        self.update_height(new_root)
+        return new_root
+
+    def right_rotate(self, current: int) -> int:
+        """
+            Perform right rotation of the sub-tree rooted at current and
+            return the handle of the new root. See AVLTree.right_rotate.
+            :complexity: O(1)
+        """
+        new_root = self.left_array[current]
+        self.left_array[current] = self.right_array[new_root]
+        self.right_array[new_root] = current
+        self.update_height(current)
+        self.update_height(new_root)
+        return new_root
+
+    def rebalance(self, current: int) -> int:
+        """
+            Rebalances the sub-tree of current by one or two rotations if
+            necessary and returns the handle of its new root.
+            :complexity: O(1)
+        """
+        height, left, right = self.height_array, self.left_array, self.right_array
+        balance = height[right[current]] - height[left[current]]
+        if balance >= 2:
+            child = right[current]
+            if height[left[child]] > height[right[child]]:
+                right[current] = self.right_rotate(child)
+            return self.left_rotate(current)
+
+        if balance <= -2:
+            child = left[current]
+            if height[right[child]] > height[left[child]]:
+                left[current] = self.left_rotate(child)
+            return self.right_rotate(current)
+
+        return current
+
+    def swap(self, other: ArrayAVLTree[K, I]) -> None:
+        """
+            Exchanges the arrays and contents of this tree with those of other.
+            :complexity: O(1)
+        """
+        for name in ('key_array', 'item_array', 'left_array', 'right_array', 'height_array',
+                     'root', 'length', 'used', 'free', 'min_handle', 'max_handle'):
+            mine, theirs = getattr(self, name), getattr(other, name)
+            setattr(self, name, theirs)
+            setattr(other, name, mine)
+
+    def copy_aux(self, source: ArrayAVLTree[K, I], current: int) -> int:
+        """
+            Copies the sub-tree of current in source into the arrays of this
+            tree, keeping its shape, and returns the handle of the copy.
+            :complexity: O(N) where N is the number of nodes in the sub-tree
+        """
+        if current == self.NIL:
+            return self.NIL
+        handle = self.allocate(source.key_array[current], source.item_array[current])
+        self.left_array[handle] = self.copy_aux(source, source.left_array[current])
+        self.right_array[handle] = self.copy_aux(source, source.right_array[current])
+        self.height_array[handle] = source.height_array[current]
+        return handle
+
+    def release_aux(self, current: int) -> None:
+        """
+            Puts the slots of every node in the sub-tree of current on the free list.
+            :complexity: O(N) where N is the number of nodes in the sub-tree
+        """
+        if current != self.NIL:
+            left, right = self.left_array[current], self.right_array[current]
+            self.release(current)
+            self.release_aux(left)
+            self.release_aux(right)
+
+    @classmethod
+    def join(cls, left: ArrayAVLTree[K, I], key: K, right: ArrayAVLTree[K, I], item: I = None) -> ArrayAVLTree[K, I]:
+        """
+            Creates a tree holding every key of left, then key, then every
+            key of right. All keys of left must be smaller than key and all
+            keys of right larger. The new tree takes over the arrays of the
+            larger tree and the nodes of the smaller one are copied into
+            them. Both trees are left empty.
+
+            :complexity: O(min(|left|, |right|) + log N) where N is the number of nodes
+            :raises ValueError: if the keys are not in order
+        """
+        if (not left.is_empty() and not left.peek_max().key < key) or \
+                (not right.is_empty() and not key < right.peek_min().key):
+            raise ValueError('Joining trees with overlapping keys')
+
+        tree = cls()
+        length = len(left) + len(right) + 1
+        if len(left) >= len(right):
+            tree.swap(left)
+            left_root, right_root = tree.root, tree.copy_aux(right, right.root)
+        else:
+            tree.swap(right)
+            left_root, right_root = tree.copy_aux(left, left.root), tree.root
+        tree.root = tree.join_nodes(left_root, tree.allocate(key, item), right_root)
+        tree.length = length
+        tree.update_extremes()
+        left.clear()
+        right.clear()
+        return tree
+
+    def join_nodes(self, left: int, middle: int, right: int) -> int:
+        """
+            Joins the sub-trees left and right using the detached node middle,
+            whose key lies between them. Returns the handle of the joined sub-tree.
+
+            :complexity: O(|h(left) - h(right)| + 1)
+        """
+        height = self.height_array
+        left_height, right_height = height[left], height[right]
+        if left_height > right_height + 1:
+            return self.join_right(left, middle, right)
+        if right_height > left_height + 1:
+            return self.join_left(left, middle, right)
+        self.left_array[middle] = left
+        self.right_array[middle] = right
+        self.update_height(middle)
+        return middle
+
+    def join_right(self, left: int, middle: int, right: int) -> int:
+        """
+            Joins when left is taller: walks down the right spine of left
+            until the heights match, attaches there and rebalances upwards.
+
+            :complexity: O(h(left) - h(right))
+        """
+        height = self.height_array
+        if height[self.right_array[left]] <= height[right] + 1:
+            self.left_array[middle] = self.right_array[left]
+            self.right_array[middle] = right
+            self.update_height(middle)
+            self.right_array[left] = middle
+        else:
+            self.right_array[left] = self.join_right(self.right_array[left], middle, right)
+        self.update_height(left)
+        return self.rebalance(left)
+
+    def join_left(self, left: int, middle: int, right: int) -> int:
+        """
+            Joins when right is taller: walks down the left spine of right
+            until the heights match, attaches there and rebalances upwards.
+
+            :complexity: O(h(right) - h(left))
+        """
+        height = self.height_array
+        if height[self.left_array[right]] <= height[left] + 1:
+            self.left_array[middle] = left
+            self.right_array[middle] = self.left_array[right]
+            self.update_height(middle)
+            self.left_array[right] = middle
+        else:
+            self.left_array[right] = self.join_left(left, middle, self.left_array[right])
+        self.update_height(right)
+        return self.rebalance(right)
+
+    def split(self, key: K) -> tuple[ArrayAVLTree[K, I], ArrayAVLTree[K, I]]:
+        """
+            Splits the tree into a tree of the keys smaller than key and a
+            tree of the keys greater than or equal to key. The key does not
+            need to be in the tree. The larger part takes over the arrays of
+            this tree and the smaller part is copied out, so this tree is
+            left empty.
+
+            :complexity: O(log N) to split, plus O(min(|left|, |right|)) to
+            count and copy the smaller part, where N is the number of nodes
+        """
+        left_root, found, right_root = self.split_aux(self.root, key)
+        if found != self.NIL:
+            right_root = self.join_nodes(self.NIL, found, right_root)
+
+        total = len(self)
+        left_length = self.count_left(left_root, right_root, total)
+        left, right = type(self)(), type(self)()
+        if left_length <= total - left_length:
+            left.root = left.copy_aux(self, left_root)
+            self.release_aux(left_root)
+            self.root = right_root
+            right.swap(self)
+        else:
+            right.root = right.copy_aux(self, right_root)
+            self.release_aux(right_root)
+            self.root = left_root
+            left.swap(self)
+        left.length, right.length = left_length, total - left_length
+        left.update_extremes()
+        right.update_extremes()
+        self.clear()
+        return left, right
+
+    def split_aux(self, current: int, key: K) -> tuple[int, int, int]:
+        """
+            Splits the sub-tree of current into the sub-tree of keys smaller
+            than key, the detached node holding key (or NIL) and the
+            sub-tree of keys larger than key.
+
+            :complexity: O(CompK * D) where D is the depth of the sub-tree
+        """
+        if current == self.NIL:
+            return self.NIL, self.NIL, self.NIL
+
+        left, right = self.left_array[current], self.right_array[current]
+        current_key = self.key_array[current]
+        if key == current_key:
+            self.left_array[current] = self.right_array[current] = self.NIL
+            self.update_height(current)
+            return left, current, right
+        elif key < current_key:
+            smaller, found, larger = self.split_aux(left, key)
+            return smaller, found, self.join_nodes(larger, current, right)
+        else:  # key > current key
+            smaller, found, larger = self.split_aux(right, key)
+            return self.join_nodes(left, current, smaller), found, larger
+
+    def count_left(self, left: int, right: int, total: int) -> int:
+        """
+            Returns the number of nodes in the sub-tree left, given that left
+            and right hold total nodes between them. Both sub-trees are walked
+            in step, so only the smaller one is walked to its end.
+
+            :complexity: O(min(|left|, |right|))
+        """
+        left_handles, right_handles = self.iter_handles(left), self.iter_handles(right)
+        seen = 0
+        while True:
+            if next(left_handles, None) is None:
+                return seen
+            if next(right_handles, None) is None:
+                return total - seen
+            seen += 1
+
+    def union(self, other: ArrayAVLTree[K, I]) -> None:
+        """
+            Merges every key of other into this tree. Where both trees have
+            the same key, the item from other is kept. The nodes of other are
+            copied into the arrays of this tree, and other is left empty.
+
+            :complexity: O(M * log(N / M + 1)) where M <= N are the sizes of the trees
+        """
+        other_root = self.copy_aux(other, other.root)
+        self.length += len(other)
+        self.root = self.union_aux(self.root, other_root)
+        self.update_extremes()
+        other.clear()
+
+    def union_aux(self, current: int, other: int) -> int:
+        """
+            Returns the handle of the union of the sub-trees current and
+            other, both in the arrays of this tree, preferring the items of
+            other for keys found in both.
+
+            :complexity: see union(self, other: ArrayAVLTree[K, I]) -> None
+        """
+        if current == self.NIL:
+            return other
+        if other == self.NIL:
+            return current
+
+        smaller, found, larger = self.split_aux(current, self.key_array[other])
+        other_left, other_right = self.left_array[other], self.right_array[other]
+        middle = other
+        if found != self.NIL:
+            # keep this tree's slot, so only other's duplicate is released
+            self.item_array[found] = self.item_array[other]
+            middle = found
+            self.release(other)
+            self.length -= 1
+        return self.join_nodes(self.union_aux(smaller, other_left), middle, self.union_aux(larger, other_right))
+
+    def get_many(self, sorted_keys: list[K]) -> list[I]:
+        """
+            Returns the items at the given keys, which must be in ascending
+            order. Each search restarts from the deepest sub-tree on the
+            previous search path that can hold the next key, as in
+            AVLTree.get_many.
+
+            :complexity: O(CompK * M * log(N / M + 1)) where M is the number of keys
+            and N the number of nodes
+            :raises KeyError: if one of the keys is not in the tree
+        """
+        keys, item_array, left, right = self.key_array, self.item_array, self.left_array, self.right_array
+        items = []
+        path = []  # (handle, upper bound of its sub-tree or None)
+        for key in sorted_keys:
+            # leave the sub-trees whose keys are all smaller than key
+            while path and path[-1][1] is not None and not key < path[-1][1]:
+                path.pop()
+            current, high = path.pop() if path else (self.root, None)
+            while current != self.NIL and key != keys[current]:
+                path.append((current, high))
+                if key < keys[current]:
+                    high = keys[current]
+                    current = left[current]
+                else:
+                    current = right[current]
+            if current == self.NIL:
+                raise KeyError('Key not found: {0}'.format(key))
+            path.append((current, high))
+            items.append(item_array[current])
+        return items
+
+    def update(self, pairs: Iterable[tuple[K, I]]) -> None:
+        """
+            Inserts a batch of (key, item) pairs. Keys already in the tree have
+            their item replaced, and the last pair wins for keys repeated in the
+            batch. The batch is sorted, built into a balanced sub-tree in the
+            arrays of this tree and merged in with union_aux.
+
+            :complexity: O(M * log M) to sort the batch, plus the complexity of
+            union(self, other: ArrayAVLTree[K, I]) -> None, where M is the size of the batch
+        """
+        keys, items = [], []
+        for key, item in sorted(pairs, key=lambda pair: pair[0]):
+            if keys and keys[-1] == key:
+                items[-1] = item
+            else:
+                keys.append(key)
+                items.append(item)
+
+        batch_root = self.build_aux(keys, items, 0, len(keys))
+        self.length += len(keys)
+        self.root = self.union_aux(self.root, batch_root)
+        self.update_extremes()
+
+    def build_aux(self, keys: list[K], items: list[I], lo: int, hi: int) -> int:
+        """
+            Returns the handle of a perfectly balanced sub-tree holding the
+            sorted keys[lo:hi] and their items.
+
+            :complexity: O(hi - lo)
+        """
+        if lo == hi:
+            return self.NIL
+        middle = (lo + hi) // 2
+        current = self.allocate(keys[middle], items[middle])
+        self.left_array[current] = self.build_aux(keys, items, lo, middle)
+        self.right_array[current] = self.build_aux(keys, items, middle + 1, hi)
+        self.update_height(current)
+        return current
+
+    def handles(self) -> Iterator[int]:
+        """
+            Generates the node handles in ascending key order.
+            :complexity: O(N) for the full traversal, where N is the number of nodes
+        """
+        return self.iter_handles(self.root)
+
+    def iter_handles(self, current: int) -> Iterator[int]:
+        """
+            Generates the handles of the sub-tree of current in key order.
+            :complexity: O(N) for the full traversal, where N is the number of nodes
+        """
+        left, right = self.left_array, self.right_array
+        stack = []
+        while current != self.NIL or stack:
+            while current != self.NIL:
+                stack.append(current)
+                current = left[current]
+            current = stack.pop()
+            yield current
+            current = right[current]
+
+    def __iter__(self) -> Iterator[K]:
+        """
+            Generates the keys in ascending order.
+            :complexity: O(N) for the full traversal
+        """
+        keys = self.key_array
+        for handle in self.handles():
+            yield keys[handle]
+
+    def items(self) -> Iterator[tuple[K, I]]:
+        """
+            Generates the (key, item) pairs in ascending key order.
+            :complexity: O(N) for the full traversal
+        """
+        keys, items = self.key_array, self.item_array
+        for handle in self.handles():
+            yield keys[handle], items[handle]
+
+    def values(self) -> Iterator[I]:
+        """
+            Generates the items in ascending key order.
+            :complexity: O(N) for the full traversal
+        """
+        items = self.item_array
+        for handle in self.handles():
+            yield items[handle]
+
+    def reversed(self) -> Iterator[tuple[K, I]]:
+        """
+            Generates the (key, item) pairs in descending key order.
+            :complexity: O(N) for the full traversal
+        """
+        keys, items, left, right = self.key_array, self.item_array, self.left_array, self.right_array
+        stack = []
+        current = self.root
+        while current != self.NIL or stack:
+            while current != self.NIL:
+                stack.append(current)
+                current = right[current]
+            current = stack.pop()
+            yield keys[current], items[current]
+            current = left[current]
+
+    def iter_from(self, key: K) -> Iterator[tuple[K, I]]:
+        """
+            Generates the (key, item) pairs in ascending key order, starting
+            at the smallest key greater than or equal to key.
+            :complexity: O(CompK * D) to find the start, then O(1) amortised per pair
+        """
+        keys, items, left, right = self.key_array, self.item_array, self.left_array, self.right_array
+        stack = []
+        current = self.root
+        while current != self.NIL:
+            if key <= keys[current]:
+                stack.append(current)
+                current = left[current]
+            else:
+                current = right[current]
+
+        while stack:
+            current = stack.pop()
+            yield keys[current], items[current]
+            current = right[current]
+            while current != self.NIL:
+                stack.append(current)
+                current = left[current]
+
+    def range_between(self, i: int, j: int) -> List:
+        """
+            Returns a sorted list of all keys in the tree between the ith and jth indices, inclusive.
+            :complexity: O(j + log(N)) where N is the number of nodes
+        """
+        ranged_list = []
+        if j < self.length:
+            for n, key in enumerate(self):
+                if n > j:
+                    break
+                if n >= i:
+                    ranged_list.append(key)
+        return ranged_list
@@ -111,6 +111,142 @@ class ASet(Set[T]):
             elems.append(str(self.array[i]) if type(self.array[i]) != str else "'{0}'".format(self.array[i]))
         return '{' + ', '.join(elems) + '}'
     
+class SortedASet(ASet[T]):
+    """Array-based implementation of the set ADT that keeps its array sorted.
+
+    Membership is a binary search, and union, intersection and difference
+    of two sorted sets merge the two arrays in a single pass. The array
+    doubles in size when an element is added to a full set, instead of
+    raising an exception. Elements must be comparable with each other.
+    """
+
+    def index_of(self, item: T) -> int:
+        """ Returns the position of item in the array, or the position
+        where it would have to be inserted to keep the array sorted.
+        :complexity: O(log n)
+        """
+        lo, hi = 0, self.size
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self.array[mid] < item:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    def __contains__(self, item: T) -> bool:
+        """ True if the set contains the item.
+        :complexity: O(log n)
+        """
+        i = self.index_of(item)
+        return i < self.size and self.array[i] == item
+
+    def grow(self) -> None:
+        """ Moves the elements into an array of twice the capacity.
+        :complexity: O(n)
+        """
+        new_array = ArrayR(2 * len(self.array))
+        for i in range(self.size):
+            new_array[i] = self.array[i]
+        self.array = new_array
+
+    def add(self, item: T) -> None:
+        """ Adds an element to the set, shifting the larger elements one
+        position to the right. An element already present is not added.
+        :complexity: O(n) for the shift, O(log n) if item is present
+        """
+        i = self.index_of(item)
+        if i < self.size and self.array[i] == item:
+            return
+        if self.is_full():
+            self.grow()
+        for j in range(self.size, i, -1):
+            self.array[j] = self.array[j - 1]
+        self.array[i] = item
+        self.size += 1
+
+    def remove(self, item: T) -> None:
+        """ Removes an element from the set, shifting the larger elements
+        one position to the left.
+        :pre: the element should be present in the set
+        :raises KeyError: if no such element is found.
+        :complexity: O(n)
+        """
+        i = self.index_of(item)
+        if i == self.size or self.array[i] != item:
+            raise KeyError(item)
+        for j in range(i, self.size - 1):
+            self.array[j] = self.array[j + 1]
+        self.size -= 1
+
+    def append(self, item: T) -> None:
+        """ Puts item after the current largest element.
+        :pre: item is larger than every element and the set is not full
+        """
+        self.array[self.size] = item
+        self.size += 1
+
+    def union(self, other: SortedASet[T]) -> SortedASet[T]:
+        """ Creates a new set equal to the union with another one by merging
+        the two sorted arrays.
+        :complexity: O(n + m)
+        """
+        res = SortedASet(len(self) + len(other))
+        i = j = 0
+        while i < self.size and j < other.size:
+            if self.array[i] < other.array[j]:
+                res.append(self.array[i])
+                i += 1
+            elif other.array[j] < self.array[i]:
+                res.append(other.array[j])
+                j += 1
+            else:
+                res.append(self.array[i])
+                i += 1
+                j += 1
+        for k in range(i, self.size):
+            res.append(self.array[k])
+        for k in range(j, other.size):
+            res.append(other.array[k])
+        return res
+
+    def intersection(self, other: SortedASet[T]) -> SortedASet[T]:
+        """ Creates a new set equal to the intersection with another one by
+        merging the two sorted arrays.
+        :complexity: O(n + m)
+        """
+        res = SortedASet(min(len(self), len(other)))
+        i = j = 0
+        while i < self.size and j < other.size:
+            if self.array[i] < other.array[j]:
+                i += 1
+            elif other.array[j] < self.array[i]:
+                j += 1
+            else:
+                res.append(self.array[i])
+                i += 1
+                j += 1
+        return res
+
+    def difference(self, other: SortedASet[T]) -> SortedASet[T]:
+        """ Creates a new set equal to the difference with another one by
+        merging the two sorted arrays.
+        :complexity: O(n + m)
+        """
+        res = SortedASet(len(self))
+        i = j = 0
+        while i < self.size:
+            if j == other.size or self.array[i] < other.array[j]:
+                res.append(self.array[i])
+                i += 1
+            elif other.array[j] < self.array[i]:
+                j += 1
+            else:
+                i += 1
+                j += 1
+        return res
+
+
 if __name__ == '__main__':
     s = ASet(3)
     s.add(1)
@@ -1,11 +1,13 @@
 """ AVL Tree implemented on top of the standard BST. """
 
+from __future__ import annotations
+
 __author__ = 'Alexey Ignatiev, with edits by Jackson Goerner'
 __docformat__ = 'reStructuredText'
 
 from platform import node
 from bst import BinarySearchTree, BSTInOrderIterator
-from typing import TypeVar, Generic, List
+from typing import TypeVar, Generic, Iterable, Iterator, List
 from node import AVLTreeNode
 
 K = TypeVar('K')
@@ -24,6 +26,29 @@ class AVLTree(BinarySearchTree, Generic[K, I]):
         """
 
         BinarySearchTree.__init__(self)
+        self.min_node = None
+        self.max_node = None
+
+    def create_node(self, key: K, item: I) -> AVLTreeNode:
+        """
+        Creates a new AVL node for the tree.
+
+        Complexity: O(1)
+        """
+        return AVLTreeNode(key, item)
+
+    def enable_statistics(self) -> None:
+        """
+            Starts counting the operations on this tree from zero, including
+            pops and rotations.
+            :complexity: O(1)
+        """
+        if self.statistics_enabled:
+            return
+        BinarySearchTree.enable_statistics(self)
+        self.count_descent('pop_max_aux')
+        self.count_descent('pop_min_aux')
+        self.count_rotations()
 
     def get_root(self) -> AVLTreeNode:
         """
@@ -33,6 +58,39 @@ class AVLTree(BinarySearchTree, Generic[K, I]):
         """
         return self.root
 
+    def peek_min(self) -> AVLTreeNode:
+        """
+            Returns the node having the smallest key in the tree without removing it.
+            :complexity: O(1)
+            :raises ValueError: if the tree is empty
+        """
+        if self.min_node is None:
+            raise ValueError('Peeking into an empty tree')
+        return self.min_node
+
+    def peek_max(self) -> AVLTreeNode:
+        """
+            Returns the node having the largest key in the tree without removing it.
+            :complexity: O(1)
+            :raises ValueError: if the tree is empty
+        """
+        if self.max_node is None:
+            raise ValueError('Peeking into an empty tree')
+        return self.max_node
+
+    def update_extremes(self) -> None:
+        """
+            Recomputes the cached minimum and maximum nodes from the root.
+            Called only when a cached node has been removed.
+            :complexity: O(D) where D is the depth of the tree
+        """
+        if self.root is None:
+            self.min_node = None
+            self.max_node = None
+        else:
+            self.min_node = self.get_minimal(self.root)
+            self.max_node = self.get_maximal(self.root)
+
     def get_height(self, current: AVLTreeNode) -> int:
         """
             Get the height of a node. Return current.height if current is
@@ -65,8 +123,13 @@ class AVLTree(BinarySearchTree, Generic[K, I]):
             CompK is the complexity of comparing the keys
         """
         if current is None:  # base case: at the leaf
-            current = AVLTreeNode(key, item)
+            current = self.create_node(key, item)
             self.length += 1
+            # the cached extremes only change when the new node goes past them
+            if self.min_node is None or key < self.min_node.key:
+                self.min_node = current
+            if self.max_node is None or key > self.max_node.key:
+                self.max_node = current
         elif key < current.key:
             current.left = self.insert_aux(current.left, key, item)
         elif key > current.key:
@@ -82,6 +145,20 @@ class AVLTree(BinarySearchTree, Generic[K, I]):
 
         return current
 
+    def __delitem__(self, key: K) -> None:
+        """
+        Deletes the item at a certain key in relation to the root,
+        refreshing the cached minimum and maximum if either was removed.
+
+        Complexity: see delete_aux(self, current: AVLTreeNode, key: K) -> AVLTreeNode
+        """
+        # the extremes have at most one child, so deleting their key always removes their node
+        removes_extreme = self.min_node is not None and \
+            (key == self.min_node.key or key == self.max_node.key)
+        BinarySearchTree.__delitem__(self, key)
+        if removes_extreme:
+            self.update_extremes()
+
     def delete_aux(self, current: AVLTreeNode, key: K) -> AVLTreeNode:
         """
             Attempts to delete an item from the tree, it uses the Key to
@@ -113,6 +190,8 @@ class AVLTree(BinarySearchTree, Generic[K, I]):
             succ = self.get_successor(current)
             current.key  = succ.key
             current.item = succ.item
+            if succ is self.max_node:  # the maximum moves into current
+                self.max_node = current
             current.right = self.delete_aux(current.right, succ.key)
 
         current.height = 1 + max(self.get_height(current.left),self.get_height(current.right))
@@ -120,6 +199,81 @@ class AVLTree(BinarySearchTree, Generic[K, I]):
 
         return current
 
+    def pop_max(self) -> AVLTreeNode:
+        """
+            Removes and returns the node having the largest key in the tree.
+            The node is found and unlinked in a single descent, and the tree
+            is rebalanced along the same spine on the way back up.
+
+            :complexity: O(D) where D is the depth of the tree
+            :raises ValueError: if the tree is empty
+        """
+        if self.root is None:
+            raise ValueError('Popping from an empty tree')
+        self.root, popped = self.pop_max_aux(self.root)
+        if self.root is None:
+            self.min_node = None
+        return popped
+
+    def pop_max_aux(self, current: AVLTreeNode) -> tuple[AVLTreeNode, AVLTreeNode]:
+        """
+            Removes the node having the largest key in the sub-tree of current.
+            Returns the new root of the sub-tree and the removed node.
+
+            The new maximum is found on the way: it is the largest node of the
+            left sub-tree of the removed node if there is one (a single leaf in
+            an AVL tree), and otherwise the frame above it. Rotations on the way
+            back up do not change which node is the maximum, so it is cached
+            in max_node without another descent.
+
+            :complexity: O(D) where D is the depth of the sub-tree
+        """
+        if current.right is None:  # base case: current is the maximum
+            self.length -= 1
+            self.max_node = None if current.left is None else self.get_maximal(current.left)
+            return current.left, current
+
+        current.right, popped = self.pop_max_aux(current.right)
+        if self.max_node is None:
+            self.max_node = current
+        current.height = 1 + max(self.get_height(current.left), self.get_height(current.right))
+        return self.rebalance(current), popped
+
+    def pop_min(self) -> AVLTreeNode:
+        """
+            Removes and returns the node having the smallest key in the tree.
+            The node is found and unlinked in a single descent, and the tree
+            is rebalanced along the same spine on the way back up.
+
+            :complexity: O(D) where D is the depth of the tree
+            :raises ValueError: if the tree is empty
+        """
+        if self.root is None:
+            raise ValueError('Popping from an empty tree')
+        self.root, popped = self.pop_min_aux(self.root)
+        if self.root is None:
+            self.max_node = None
+        return popped
+
+    def pop_min_aux(self, current: AVLTreeNode) -> tuple[AVLTreeNode, AVLTreeNode]:
+        """
+            Removes the node having the smallest key in the sub-tree of current.
+            Returns the new root of the sub-tree and the removed node. The new
+            minimum is cached in min_node on the way, as in pop_max_aux.
+
+            :complexity: O(D) where D is the depth of the sub-tree
+        """
+        if current.left is None:  # base case: current is the minimum
+            self.length -= 1
+            self.min_node = None if current.right is None else self.get_minimal(current.right)
+            return current.right, current
+
+        current.left, popped = self.pop_min_aux(current.left)
+        if self.min_node is None:
+            self.min_node = current
+        current.height = 1 + max(self.get_height(current.left), self.get_height(current.right))
+        return self.rebalance(current), popped
+
     def left_rotate(self, current: AVLTreeNode) -> AVLTreeNode:
         """
             Perform left rotation of the sub-tree.
@@ -223,6 +377,281 @@ class AVLTree(BinarySearchTree, Generic[K, I]):
 
         return current
 
+    def clear(self) -> None:
+        """
+            Makes the tree empty.
+            :complexity: O(1)
+        """
+        self.root = None
+        self.length = 0
+        self.min_node = None
+        self.max_node = None
+
+    def update_height(self, current: AVLTreeNode) -> None:
+        """
+            Recomputes the height of current from the heights of its children.
+            :complexity: O(1)
+        """
+        current.height = 1 + max(self.get_height(current.left), self.get_height(current.right))
+
+    @classmethod
+    def join(cls, left: AVLTree[K, I], key: K, right: AVLTree[K, I], item: I = None) -> AVLTree[K, I]:
+        """
+            Creates a tree holding every key of left, then key, then every
+            key of right. All keys of left must be smaller than key and all
+            keys of right larger. The nodes of left and right are reused,
+            so both trees are left empty.
+
+            :complexity: O(|h(left) - h(right)| + 1), i.e. O(log N)
+            :raises ValueError: if the keys are not in order
+        """
+        if (not left.is_empty() and not left.peek_max().key < key) or \
+                (not right.is_empty() and not key < right.peek_min().key):
+            raise ValueError('Joining trees with overlapping keys')
+
+        tree = cls()
+        tree.root = tree.join_nodes(left.root, tree.create_node(key, item), right.root)
+        tree.length = len(left) + len(right) + 1
+        tree.update_extremes()
+        left.clear()
+        right.clear()
+        return tree
+
+    def join_nodes(self, left: AVLTreeNode, middle: AVLTreeNode, right: AVLTreeNode) -> AVLTreeNode:
+        """
+            Joins the sub-trees left and right using the detached node middle,
+            whose key lies between them. Returns the root of the joined sub-tree.
+
+            :complexity: O(|h(left) - h(right)| + 1)
+        """
+        left_height, right_height = self.get_height(left), self.get_height(right)
+        if left_height > right_height + 1:
+            return self.join_right(left, middle, right)
+        if right_height > left_height + 1:
+            return self.join_left(left, middle, right)
+        middle.left = left
+        middle.right = right
+        self.update_height(middle)
+        return middle
+
+    def join_right(self, left: AVLTreeNode, middle: AVLTreeNode, right: AVLTreeNode) -> AVLTreeNode:
+        """
+            Joins when left is taller: walks down the right spine of left
+            until the heights match, attaches there and rebalances upwards.
+
+            :complexity: O(h(left) - h(right))
+        """
+        if self.get_height(left.right) <= self.get_height(right) + 1:
+            middle.left = left.right
+            middle.right = right
+            self.update_height(middle)
+            left.right = middle
+        else:
+            left.right = self.join_right(left.right, middle, right)
+        self.update_height(left)
+        return self.rebalance(left)
+
+    def join_left(self, left: AVLTreeNode, middle: AVLTreeNode, right: AVLTreeNode) -> AVLTreeNode:
+        """
+            Joins when right is taller: walks down the left spine of right
+            until the heights match, attaches there and rebalances upwards.
+
+            :complexity: O(h(right) - h(left))
+        """
+        if self.get_height(right.left) <= self.get_height(left) + 1:
+            middle.left = left
+            middle.right = right.left
+            self.update_height(middle)
+            right.left = middle
+        else:
+            right.left = self.join_left(left, middle, right.left)
+        self.update_height(right)
+        return self.rebalance(right)
+
+    def split(self, key: K) -> tuple[AVLTree[K, I], AVLTree[K, I]]:
+        """
+            Splits the tree into a tree of the keys smaller than key and a
+            tree of the keys greater than or equal to key. The key does not
+            need to be in the tree. The nodes are reused, so this tree is
+            left empty.
+
+            :complexity: O(log N) to split, plus O(min(|left|, |right|)) to
+            count the smaller part, where N is the number of nodes
+        """
+        left_root, found, right_root = self.split_aux(self.root, key)
+        if found is not None:
+            right_root = self.join_nodes(None, found, right_root)
+
+        left, right = type(self)(), type(self)()
+        left.root, right.root = left_root, right_root
+        left.length = self.count_left(left_root, right_root, len(self))
+        right.length = len(self) - left.length
+        left.update_extremes()
+        right.update_extremes()
+        self.clear()
+        return left, right
+
+    def split_aux(self, current: AVLTreeNode, key: K) -> tuple[AVLTreeNode, AVLTreeNode, AVLTreeNode]:
+        """
+            Splits the sub-tree of current into the sub-tree of keys smaller
+            than key, the detached node holding key (or None) and the
+            sub-tree of keys larger than key.
+
+            :complexity: O(CompK * D) where D is the depth of the sub-tree
+        """
+        if current is None:
+            return None, None, None
+
+        left, right = current.left, current.right
+        if key == current.key:
+            current.left = current.right = None
+            self.update_height(current)
+            return left, current, right
+        elif key < current.key:
+            smaller, found, larger = self.split_aux(left, key)
+            return smaller, found, self.join_nodes(larger, current, right)
+        else:  # key > current.key
+            smaller, found, larger = self.split_aux(right, key)
+            return self.join_nodes(left, current, smaller), found, larger
+
+    def count_left(self, left: AVLTreeNode, right: AVLTreeNode, total: int) -> int:
+        """
+            Returns the number of nodes in the sub-tree left, given that left
+            and right hold total nodes between them. Both sub-trees are walked
+            in step, so only the smaller one is walked to its end.
+
+            :complexity: O(min(|left|, |right|))
+        """
+        left_nodes, right_nodes = self.iter_nodes(left), self.iter_nodes(right)
+        seen = 0
+        while True:
+            if next(left_nodes, None) is None:
+                return seen
+            if next(right_nodes, None) is None:
+                return total - seen
+            seen += 1
+
+    def iter_nodes(self, current: AVLTreeNode) -> Iterator[AVLTreeNode]:
+        """
+            Generates the nodes of the sub-tree of current in key order.
+            :complexity: O(N) for the full traversal, where N is the number of nodes
+        """
+        stack = []
+        while current is not None or stack:
+            while current is not None:
+                stack.append(current)
+                current = current.left
+            current = stack.pop()
+            yield current
+            current = current.right
+
+    def union(self, other: AVLTree[K, I]) -> None:
+        """
+            Merges every key of other into this tree. Where both trees have
+            the same key, the item from other is kept. The nodes of other are
+            reused, so other is left empty.
+
+            :complexity: O(M * log(N / M + 1)) where M <= N are the sizes of the trees
+        """
+        self.length += len(other)
+        self.root = self.union_aux(self.root, other.root)
+        self.update_extremes()
+        other.clear()
+
+    def union_aux(self, current: AVLTreeNode, other: AVLTreeNode) -> AVLTreeNode:
+        """
+            Returns the root of the union of the sub-trees current and other,
+            preferring the items of other for keys found in both.
+
+            :complexity: see union(self, other: AVLTree[K, I]) -> None
+        """
+        if current is None:
+            return other
+        if other is None:
+            return current
+
+        smaller, found, larger = self.split_aux(current, other.key)
+        middle = other
+        if found is not None:
+            # keep this tree's node, so only other's duplicate is dropped
+            found.item = other.item
+            middle = found
+            self.length -= 1
+        other_left, other_right = other.left, other.right
+        return self.join_nodes(self.union_aux(smaller, other_left), middle, self.union_aux(larger, other_right))
+
+    def get_many(self, sorted_keys: list[K]) -> list[I]:
+        """
+            Returns the items at the given keys, which must be in ascending
+            order. The search path of the previous key is kept on a stack
+            together with the upper bound of every sub-tree on it, and each
+            search restarts from the deepest sub-tree that can hold the next
+            key instead of from the root, so nearby keys share their descent.
+
+            :complexity: O(CompK * M * log(N / M + 1)) where M is the number of keys
+            and N the number of nodes
+            :raises KeyError: if one of the keys is not in the tree
+        """
+        items = []
+        path = []  # (node, upper bound of its sub-tree or None)
+        for key in sorted_keys:
+            # leave the sub-trees whose keys are all smaller than key
+            while path and path[-1][1] is not None and not key < path[-1][1]:
+                path.pop()
+            current, high = path.pop() if path else (self.root, None)
+            while current is not None and key != current.key:
+                path.append((current, high))
+                if key < current.key:
+                    high = current.key
+                    current = current.left
+                else:
+                    current = current.right
+            if current is None:
+                raise KeyError('Key not found: {0}'.format(key))
+            path.append((current, high))
+            items.append(current.item)
+        return items
+
+    def update(self, pairs: Iterable[tuple[K, I]]) -> None:
+        """
+            Inserts a batch of (key, item) pairs. Keys already in the tree have
+            their item replaced, and the last pair wins for keys repeated in the
+            batch. The batch is sorted, built into a balanced sub-tree in one
+            pass and merged in with union, so the tree is rebalanced along the
+            merge paths only instead of after every single insertion.
+
+            :complexity: O(M * log M) to sort the batch, plus the complexity of
+            union(self, other: AVLTree[K, I]) -> None, where M is the size of the batch
+        """
+        keys, items = [], []
+        for key, item in sorted(pairs, key=lambda pair: pair[0]):
+            if keys and keys[-1] == key:
+                items[-1] = item
+            else:
+                keys.append(key)
+                items.append(item)
+
+        batch = type(self)()
+        batch.root = batch.build_aux(keys, items, 0, len(keys))
+        batch.length = len(keys)
+        self.union(batch)
+
+    def build_aux(self, keys: list[K], items: list[I], lo: int, hi: int) -> AVLTreeNode:
+        """
+            Returns the root of a perfectly balanced sub-tree holding the
+            sorted keys[lo:hi] and their items.
+
+            :complexity: O(hi - lo)
+        """
+        if lo == hi:
+            return None
+        middle = (lo + hi) // 2
+        current = self.create_node(keys[middle], items[middle])
+        current.left = self.build_aux(keys, items, lo, middle)
+        current.right = self.build_aux(keys, items, middle + 1, hi)
+        self.update_height(current)
+        return current
+
     def range_between(self, i: int, j: int) -> List:
         """
         Returns a sorted list of all elements in the tree between the ith and jth indices, inclusive.
@@ -0,0 +1,449 @@
+""" Benchmarks
+
+Timing comparisons for the data structures used by the game.
+Run with `python benchmark.py [name ...]`. With no names given,
+every benchmark is run in turn.
+"""
+
+from __future__ import annotations
+
+__docformat__ = 'reStructuredText'
+
+from bisect import bisect_left
+import sys
+import time
+import timeit
+import tracemalloc
+
+from array_avl import ArrayAVLTree
+from avl import AVLTree
+from block_map import SortedBlockMap
+from dary_heap import DaryHeap
+from heap import MaxHeap
+from linked_stack import LinkedStack, Node
+from persistent_avl import PersistentAVLTree
+from queue_adt import ArrayQueue
+from skip_list import SkipList
+from splay_tree import SplayTree
+from stack_adt import ArrayStack
+from treap import Treap
+from node import AVLTreeNode
+from random_gen import RandomGen
+
+BENCHMARKS = {}
+
+
+def benchmark(func):
+    """ Registers a benchmark function under its own name. """
+    BENCHMARKS[func.__name__] = func
+    return func
+
+
+def best_time(stmt, number: int = 1, repeat: int = 5) -> float:
+    """ Returns the best wall-clock time in seconds of running stmt number times. """
+    return min(timeit.repeat(stmt, number=number, repeat=repeat))
+
+
+def best_time_on(setup, stmt, repeat: int = 5) -> float:
+    """
+    Returns the best time in seconds of running stmt once on a fresh value
+    from setup. The result of stmt is kept alive until the clock has been
+    read, so freeing large structures is not counted.
+    """
+    times = []
+    for _ in range(repeat):
+        value = setup()
+        start = time.perf_counter()
+        result = stmt(value)
+        times.append(time.perf_counter() - start)
+        del result
+    return min(times)
+
+
+def report(label: str, seconds: float) -> None:
+    """ Prints a single benchmark line in milliseconds. """
+    print('    {0:<44}{1:>10.2f} ms'.format(label, seconds * 1000))
+
+
+def random_keys(n: int, seed: int = 16) -> list[int]:
+    """ Returns n distinct keys in a reproducible shuffled order. """
+    RandomGen.set_seed(seed)
+    keys = list(range(n))
+    RandomGen.random_shuffle(keys)
+    return keys
+
+
+def build_avl(keys: list) -> AVLTree:
+    """ Builds an AVL tree mapping every key to itself. """
+    tree = AVLTree()
+    for key in keys:
+        tree[key] = key
+    return tree
+
+
+@benchmark
+def tree_scans(n: int = 100000) -> None:
+    """ Full in-order scans: key iterator plus lookups against the item generators. """
+    tree = build_avl(random_keys(n))
+    print('tree_scans: full scan of an AVL tree with {0} nodes'.format(n))
+    report('[(k, tree[k]) for k in tree]', best_time(lambda: [(k, tree[k]) for k in tree]))
+    report('list(tree.items())', best_time(lambda: list(tree.items())))
+    report('list(tree.values())', best_time(lambda: list(tree.values())))
+    report('list(tree.reversed())', best_time(lambda: list(tree.reversed())))
+    report('list(tree.iter_from(n // 2))', best_time(lambda: list(tree.iter_from(n // 2))))
+
+
+@benchmark
+def tree_extremes(n: int = 5000, lookups: int = 100000) -> None:
+    """ Repeatedly asking a day's trader tree for its best price. """
+    tree = build_avl(random_keys(n))
+    print('tree_extremes: {0} maximum lookups on a tree of {1} traders'.format(lookups, n))
+
+    def walk():
+        for _ in range(lookups):
+            tree.get_maximal(tree.get_root())
+
+    def cached():
+        for _ in range(lookups):
+            tree.peek_max()
+
+    report('tree.get_maximal(tree.get_root())', best_time(walk))
+    report('tree.peek_max()', best_time(cached))
+
+
+@benchmark
+def tree_merge(n: int = 100000, deltas: int = 1000) -> None:
+    """ Merging a day's new entries into a large standing tree. """
+    keys = random_keys(n + deltas)
+    standing_keys, delta_keys = keys[:n], keys[n:]
+    print('tree_merge: {0} new keys into a standing tree of {1} nodes'.format(deltas, n))
+
+    def inserts(tree):
+        for key in delta_keys:
+            tree[key] = key
+        return tree
+
+    def union(trees):
+        trees[0].union(trees[1])
+        return trees
+
+    report('individual inserts, scattered keys', best_time_on(lambda: build_avl(standing_keys), inserts, repeat=3))
+    report('union, scattered keys', best_time_on(lambda: (build_avl(standing_keys), build_avl(delta_keys)), union, repeat=3))
+
+    # a day's keys usually follow on from the standing ones, e.g. new days or prices above the range
+    standing_keys, delta_keys = [key for key in keys if key < n], [key for key in keys if key >= n]
+    report('individual inserts, trailing keys', best_time_on(lambda: build_avl(standing_keys), inserts, repeat=3))
+    report('union, trailing keys', best_time_on(lambda: (build_avl(standing_keys), build_avl(delta_keys)), union, repeat=3))
+    report('split off the oldest 1%', best_time_on(lambda: build_avl(standing_keys), lambda tree: tree.split(n // 100), repeat=3))
+
+
+class DictAVLTreeNode(AVLTreeNode):
+    """ AVL node with an instance dictionary, i.e. the node layout before __slots__. """
+
+
+class DictAVLTree(AVLTree):
+    """ AVL tree built from dictionary-backed nodes, for comparison. """
+
+    def create_node(self, key, item) -> DictAVLTreeNode:
+        return DictAVLTreeNode(key, item)
+
+
+class DictNode(Node):
+    """ Stack node with an instance dictionary, i.e. the node layout before __slots__. """
+
+
+class DictLinkedStack(LinkedStack):
+    """ Linked stack built from dictionary-backed nodes, for comparison. """
+
+    def push(self, item) -> None:
+        new_node = DictNode(item)
+        new_node.link = self.top
+        self.top = new_node
+        self.length += 1
+
+
+def bytes_per_element(build, n: int) -> float:
+    """ Returns the traced memory held by build() per element. """
+    tracemalloc.start()
+    structure = build()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del structure
+    return size / n
+
+
+def fill_stack(stack_type, n: int):
+    """ Pushes n integers onto a new stack of the given type. """
+    stack = stack_type()
+    for i in range(n):
+        stack.push(i)
+    return stack
+
+
+@benchmark
+def node_memory(n: int = 100000) -> None:
+    """ Memory and insert time of dictionary-backed against slotted nodes. """
+    keys = random_keys(n)
+    print('node_memory: {0} keys'.format(n))
+    for label, tree_type in [('dict nodes', DictAVLTree), ('slotted nodes', AVLTree)]:
+        def build():
+            tree = tree_type()
+            for key in keys:
+                tree[key] = None
+            return tree
+        print('    AVLTree, {0}: {1:.1f} bytes per node'.format(label, bytes_per_element(build, n)))
+        report('AVLTree inserts, {0}'.format(label), best_time(build, repeat=3))
+    for label, stack_type in [('dict nodes', DictLinkedStack), ('slotted nodes', LinkedStack)]:
+        print('    LinkedStack, {0}: {1:.1f} bytes per node'.format(
+            label, bytes_per_element(lambda: fill_stack(stack_type, n), n)))
+        report('LinkedStack pushes, {0}'.format(label), best_time(lambda: fill_stack(stack_type, n), repeat=3))
+
+
+@benchmark
+def array_tree(n: int = 100000) -> None:
+    """ Memory and speed of the struct-of-arrays AVL tree against the node-based one. """
+    keys = random_keys(n)
+    print('array_tree: {0} keys'.format(n))
+    for label, tree_type in [('AVLTree', AVLTree), ('ArrayAVLTree', ArrayAVLTree)]:
+        def build():
+            tree = tree_type()
+            for key in keys:
+                tree[key] = None
+            return tree
+        print('    {0}: {1:.1f} bytes per node'.format(label, bytes_per_element(build, n)))
+        report('{0} inserts'.format(label), best_time(build, repeat=3))
+        tree = build()
+        report('{0} lookups'.format(label), best_time(lambda: [tree[key] for key in keys], repeat=3))
+        report('{0} full scan'.format(label), best_time(lambda: list(tree.items()), repeat=3))
+
+
+@benchmark
+def tree_snapshots(n: int = 10000, days: int = 30, changes: int = 100) -> None:
+    """ Keeping every day's tree: deep copies against persistent snapshots. """
+    keys = random_keys(n + days * changes)
+    print('tree_snapshots: {0} days of {1} inserts on a tree of {2} nodes'.format(days, changes, n))
+
+    def deep_copies():
+        tree = build_avl(keys[:n])
+        history = []
+        for day in range(days):
+            for key in keys[n + day * changes:n + (day + 1) * changes]:
+                tree[key] = key
+            history.append(build_avl(list(tree)))
+        return history
+
+    def snapshots():
+        tree = PersistentAVLTree()
+        for key in keys[:n]:
+            tree[key] = key
+        history = []
+        for day in range(days):
+            for key in keys[n + day * changes:n + (day + 1) * changes]:
+                tree[key] = key
+            history.append(tree.snapshot())
+        return history
+
+    for label, run in [('rebuilt copy per day', deep_copies), ('persistent snapshot per day', snapshots)]:
+        print('    {0}: {1:.0f} KiB retained'.format(label, bytes_per_element(run, 1024)))
+        report(label, best_time(run, repeat=1))
+
+
+@benchmark
+def block_map(sizes: tuple = (100, 1000, 10000, 100000)) -> None:
+    """ Insert-heavy and scan-heavy workloads: AVLTree against SortedBlockMap. """
+    print('block_map: per-workload time at growing sizes')
+    for n in sizes:
+        keys = random_keys(n)
+        repeat = 3 if n >= 10000 else 5
+        number = max(1, 10000 // n)
+        for label, map_type in [('AVLTree', AVLTree), ('SortedBlockMap', SortedBlockMap)]:
+            def build():
+                ordered = map_type()
+                for key in keys:
+                    ordered[key] = key
+                return ordered
+            ordered = build()
+            report('n={0:<7}{1} inserts'.format(n, label), best_time(build, number=number, repeat=repeat) / number)
+            report('n={0:<7}{1} scan'.format(n, label), best_time(lambda: list(ordered.items()), number=number, repeat=repeat) / number)
+
+
+def trader_prices(n: int, seed: int = 16) -> list[float]:
+    """ Returns n distinct trader buy prices drawn like Trader.generate_deal does. """
+    RandomGen.set_seed(seed)
+    prices = []
+    seen = set()
+    while len(prices) < n:
+        price = round(2 + 8 * RandomGen.random_float(), 4)
+        if price not in seen:
+            seen.add(price)
+            prices.append(price)
+    return prices
+
+
+@benchmark
+def skip_list(traders: int = 2000, days: int = 10) -> None:
+    """ The pop-max-heavy pattern of Player.select_food_and_caves: AVLTree against SkipList. """
+    prices = trader_prices(traders)
+    print('skip_list: {0} days of {1} trader prices, each popped from the top'.format(days, traders))
+
+    for label, map_type in [('AVLTree', AVLTree), ('SkipList', SkipList)]:
+        def run():
+            RandomGen.set_seed(16)
+            for _ in range(days):
+                book = map_type()
+                for price in prices:
+                    book[price] = price
+                while not book.is_empty():
+                    book.pop_max()
+        report(label, best_time(run, repeat=3))
+
+
+def game_trace(traders: int, players: int, lookups: int, seed: int = 16) -> list[tuple]:
+    """
+        Returns one day of trader book accesses in the shape of a multiplayer
+        game: every trader price is inserted, each player looks up prices with
+        a heavy skew towards the best ones (the i-th best is chosen with weight
+        1 / i), then the best traders are taken off the book one at a time.
+    """
+    prices = trader_prices(traders, seed)
+    ranked = sorted(prices, reverse=True)
+    cumulative, total = [], 0.0
+    for rank in range(1, traders + 1):
+        total += 1 / rank
+        cumulative.append(total)
+
+    trace = [('set', price) for price in prices]
+    RandomGen.set_seed(seed)
+    for _ in range(players * lookups):
+        trace.append(('get', ranked[bisect_left(cumulative, total * RandomGen.random_float())]))
+    trace.extend([('pop', None)] * (traders // 10))
+    return trace
+
+
+def replay(tree, trace: list[tuple]) -> None:
+    """ Replays a trace through the BinarySearchTree interface. """
+    for operation, key in trace:
+        if operation == 'get':
+            tree[key]
+        elif operation == 'set':
+            tree[key] = key
+        else:  # pop the best trader
+            del tree[tree.get_maximal(tree.root).key]
+
+
+@benchmark
+def skewed_access(traders: int = 5000, players: int = 100, lookups: int = 50) -> None:
+    """ Self-adjusting trees against AVLTree on a skewed game access trace. """
+    trace = game_trace(traders, players, lookups)
+    print('skewed_access: {0} traders, {1} skewed lookups, {2} pops'.format(traders, players * lookups, traders // 10))
+
+    for label, tree_type in [('AVLTree', AVLTree), ('Treap', Treap), ('SplayTree', SplayTree)]:
+        def run():
+            RandomGen.set_seed(16)
+            replay(tree_type(), trace)
+        report(label, best_time(run, repeat=3))
+
+
+@benchmark
+def tree_batches(n: int = 100000, batch: int = 10000) -> None:
+    """ Batched lookups and insertions against one key at a time. """
+    keys = random_keys(n + batch)
+    standing_keys, new_keys = keys[:n], keys[n:]
+    lookups = sorted(standing_keys[:batch])
+    pairs = [(key, key) for key in new_keys]
+    tree = build_avl(standing_keys)
+    print('tree_batches: {0} keys against a tree of {1} nodes'.format(batch, n))
+
+    report('loop of __getitem__, sorted keys', best_time(lambda: [tree[key] for key in lookups]))
+    report('get_many', best_time(lambda: tree.get_many(lookups)))
+
+    def inserts(tree):
+        for key, item in pairs:
+            tree[key] = item
+        return tree
+
+    def update(tree):
+        tree.update(pairs)
+        return tree
+
+    report('loop of __setitem__', best_time_on(lambda: build_avl(standing_keys), inserts, repeat=3))
+    report('update', best_time_on(lambda: build_avl(standing_keys), update, repeat=3))
+
+
+@benchmark
+def heap_arity(sizes: tuple = (1000, 10000, 100000)) -> None:
+    """ Choosing d for DaryHeap: heapify and drain, then a stream of add/get_max pairs. """
+    print('heap_arity: MaxHeap against DaryHeap with d = 2, 4 and 8')
+    for n in sizes:
+        prices = [RandomGen.random() for _ in range(n)]
+        stream = [RandomGen.random() for _ in range(n)]
+        heaps = [('MaxHeap', lambda: MaxHeap.heapify(prices))]
+        heaps += [('DaryHeap d={0}'.format(d), lambda d=d: DaryHeap.heapify(prices, d)) for d in (2, 4, 8)]
+        for label, build in heaps:
+            def drain(heap):
+                for _ in range(n):
+                    heap.get_max()
+                return heap
+
+            def churn(heap):
+                for price in stream:
+                    heap.add(price)
+                    heap.get_max()
+                return heap
+
+            report('n={0:<7}{1} heapify'.format(n, label), best_time(build, repeat=3))
+            report('n={0:<7}{1} drain'.format(n, label), best_time_on(build, drain, repeat=3))
+            report('n={0:<7}{1} add + get_max'.format(n, label), best_time_on(build, churn, repeat=3))
+
+
+@benchmark
+def stack_throughput(sizes: tuple = (1000, 10000, 100000)) -> None:
+    """ Push/pop throughput and memory of ArrayStack and ArrayQueue against LinkedStack. """
+    print('stack_throughput: n pushes followed by n pops, and a stream of push/pop pairs')
+    for n in sizes:
+        stacks = [('LinkedStack', LinkedStack), ('ArrayStack', ArrayStack)]
+        for label, stack_type in stacks:
+            print('    n={0:<7}{1}: {2:.1f} bytes per element'.format(
+                n, label, bytes_per_element(lambda: fill_stack(stack_type, n), n)))
+            def fill_and_drain():
+                stack = fill_stack(stack_type, n)
+                for _ in range(n):
+                    stack.pop()
+
+            def churn():
+                stack = stack_type()
+                for i in range(n):
+                    stack.push(i)
+                    stack.pop()
+
+            report('n={0:<7}{1} push + drain'.format(n, label), best_time(fill_and_drain, repeat=3))
+            report('n={0:<7}{1} push/pop pairs'.format(n, label), best_time(churn, repeat=3))
+
+        def queue_fill_and_drain():
+            queue = ArrayQueue()
+            for i in range(n):
+                queue.append(i)
+            for _ in range(n):
+                queue.serve()
+
+        report('n={0:<7}ArrayQueue append + serve'.format(n), best_time(queue_fill_and_drain, repeat=3))
+
+
+
+@benchmark
+def random_batches(sizes: tuple = (100, 10000, 100000)) -> None:
+    """ n scalar RandomGen calls against one batched call returning a typed array. """
+    print('random_batches: scalar calls against randoms, randints and random_floats')
+    for n in sizes:
+        report('n={0:<8}random x n'.format(n), best_time(lambda: [RandomGen.random() for _ in range(n)], repeat=3))
+        report('n={0:<8}randoms(n)'.format(n), best_time(lambda: RandomGen.randoms(n), repeat=3))
+        report('n={0:<8}randint x n'.format(n), best_time(lambda: [RandomGen.randint(1, 10) for _ in range(n)], repeat=3))
+        report('n={0:<8}randints(n)'.format(n), best_time(lambda: RandomGen.randints(1, 10, n), repeat=3))
+        report('n={0:<8}random_float x n'.format(n), best_time(lambda: [RandomGen.random_float() for _ in range(n)], repeat=3))
+        report('n={0:<8}random_floats(n)'.format(n), best_time(lambda: RandomGen.random_floats(n), repeat=3))
+
+
+if __name__ == '__main__':
+    names = sys.argv[1:] or list(BENCHMARKS)
+    for name in names:
+        BENCHMARKS[name]()
@@ -0,0 +1,323 @@
+""" Sorted-block ordered map.
+
+An ordered map stored as a list of short sorted blocks of keys, with a
+parallel list of item blocks and the largest key of every block kept in
+a separate list. Finding a key is a binary search over the block maxima
+followed by one over a single block, both done by the C-level bisect
+module, so a lookup touches a few short arrays instead of chasing one
+node object per level as AVLTree does.
+"""
+
+from __future__ import annotations
+
+__docformat__ = 'reStructuredText'
+
+from bisect import bisect_left
+from typing import TypeVar, Generic, Iterator, List
+from node import TreeNode
+
+K = TypeVar('K')
+I = TypeVar('I')
+
+
+class SortedBlockMap(Generic[K, I]):
+    """ Ordered map with the interface of AVLTree, stored in sorted blocks.
+
+        Blocks hold between LOAD // 2 and 2 * LOAD keys (except when the
+        whole map is smaller). A block that grows past 2 * LOAD is split
+        in half and one that shrinks below LOAD // 2 is merged into a
+        neighbour, so there are O(N / LOAD) blocks.
+
+        Methods that return nodes in AVLTree (get_minimal, get_maximal,
+        peek_min, peek_max, pop_min and pop_max) return a detached TreeNode
+        holding the key and item.
+    """
+
+    LOAD = 64
+
+    def __init__(self) -> None:
+        """
+            Initialises an empty map.
+            :complexity: O(1)
+        """
+        self.key_blocks = []
+        self.item_blocks = []
+        self.maxes = []
+        self.length = 0
+
+    def __len__(self) -> int:
+        """
+            Returns the number of keys in the map.
+            :complexity: O(1)
+        """
+        return self.length
+
+    def is_empty(self) -> bool:
+        """
+            Checks to see if the map is empty
+            :complexity: O(1)
+        """
+        return self.length == 0
+
+    def locate(self, key: K) -> tuple[int, int]:
+        """
+            Returns the block index and the position inside that block where
+            key is or would be inserted. Keys beyond the last block map to the
+            end of the last block.
+
+            :complexity: O(CompK * log N)
+        """
+        block = bisect_left(self.maxes, key)
+        if block == len(self.maxes):
+            block -= 1
+        return block, bisect_left(self.key_blocks[block], key)
+
+    def __contains__(self, key: K) -> bool:
+        """
+            Checks to see if the key is in the map
+            :complexity: O(CompK * log N)
+        """
+        if self.length == 0:
+            return False
+        block, position = self.locate(key)
+        keys = self.key_blocks[block]
+        return position < len(keys) and keys[position] == key
+
+    def __getitem__(self, key: K) -> I:
+        """
+            Returns the item stored at key.
+            :complexity: O(CompK * log N)
+            :raises KeyError: if the key is not in the map
+        """
+        if self.length > 0:
+            block, position = self.locate(key)
+            keys = self.key_blocks[block]
+            if position < len(keys) and keys[position] == key:
+                return self.item_blocks[block][position]
+        raise KeyError('Key not found: {0}'.format(key))
+
+    def __setitem__(self, key: K, item: I) -> None:
+        """
+            Inserts the item at key.
+
+            :complexity: O(CompK * log N + LOAD) to search and shift one block
+            :raises ValueError: if the key is already in the map
+        """
+        if self.length == 0:
+            self.key_blocks.append([key])
+            self.item_blocks.append([item])
+            self.maxes.append(key)
+            self.length = 1
+            return
+
+        block, position = self.locate(key)
+        keys = self.key_blocks[block]
+        if position < len(keys) and keys[position] == key:
+            raise ValueError('Inserting duplicate item')
+        keys.insert(position, key)
+        self.item_blocks[block].insert(position, item)
+        self.maxes[block] = keys[-1]
+        self.length += 1
+
+        if len(keys) > 2 * self.LOAD:
+            self.split_block(block)
+
+    def __delitem__(self, key: K) -> None:
+        """
+            Deletes the item at key.
+
+            :complexity: O(CompK * log N + LOAD) to search and shift one block
+            :raises ValueError: if the key is not in the map
+        """
+        if self.length > 0:
+            block, position = self.locate(key)
+            keys = self.key_blocks[block]
+            if position < len(keys) and keys[position] == key:
+                self.remove_at(block, position)
+                return
+        raise ValueError('Deleting non-existent item')
+
+    def remove_at(self, block: int, position: int) -> tuple[K, I]:
+        """
+            Removes and returns the key and item at a position of a block,
+            merging the block into a neighbour if it becomes too small.
+
+            :complexity: O(LOAD + N / LOAD)
+        """
+        keys, items = self.key_blocks[block], self.item_blocks[block]
+        key, item = keys.pop(position), items.pop(position)
+        self.length -= 1
+
+        if not keys:
+            del self.key_blocks[block]
+            del self.item_blocks[block]
+            del self.maxes[block]
+        else:
+            self.maxes[block] = keys[-1]
+            if len(keys) < self.LOAD // 2 and len(self.key_blocks) > 1:
+                self.merge_block(block)
+        return key, item
+
+    def split_block(self, block: int) -> None:
+        """
+            Splits a block that has grown too large into two halves.
+            :complexity: O(LOAD + N / LOAD)
+        """
+        keys, items = self.key_blocks[block], self.item_blocks[block]
+        half = len(keys) // 2
+        self.key_blocks.insert(block + 1, keys[half:])
+        self.item_blocks.insert(block + 1, items[half:])
+        del keys[half:]
+        del items[half:]
+        self.maxes[block] = keys[-1]
+        self.maxes.insert(block + 1, self.key_blocks[block + 1][-1])
+
+    def merge_block(self, block: int) -> None:
+        """
+            Merges a block that has become too small into its neighbour,
+            splitting the result again if it is too large.
+            :complexity: O(LOAD + N / LOAD)
+        """
+        if block == len(self.key_blocks) - 1:
+            block -= 1
+        self.key_blocks[block].extend(self.key_blocks[block + 1])
+        self.item_blocks[block].extend(self.item_blocks[block + 1])
+        self.maxes[block] = self.maxes[block + 1]
+        del self.key_blocks[block + 1]
+        del self.item_blocks[block + 1]
+        del self.maxes[block + 1]
+        if len(self.key_blocks[block]) > 2 * self.LOAD:
+            self.split_block(block)
+
+    def get_minimal(self, current=None) -> TreeNode:
+        """
+            Returns a detached node holding the smallest key and its item.
+            current is accepted so that AVLTree call sites such as
+            get_minimal(get_root()) keep working, and is ignored.
+            :complexity: O(1)
+            :raises ValueError: if the map is empty
+        """
+        return self.peek_min()
+
+    def get_maximal(self, current=None) -> TreeNode:
+        """
+            Returns a detached node holding the largest key and its item.
+            current is accepted for AVLTree compatibility and ignored.
+            :complexity: O(1)
+            :raises ValueError: if the map is empty
+        """
+        return self.peek_max()
+
+    def get_root(self) -> None:
+        """
+            Present for AVLTree compatibility; a block map has no root node.
+            :complexity: O(1)
+        """
+        return None
+
+    def peek_min(self) -> TreeNode:
+        """
+            Returns a detached node holding the smallest key and its item.
+            :complexity: O(1)
+            :raises ValueError: if the map is empty
+        """
+        if self.length == 0:
+            raise ValueError('Peeking into an empty map')
+        return TreeNode(self.key_blocks[0][0], self.item_blocks[0][0])
+
+    def peek_max(self) -> TreeNode:
+        """
+            Returns a detached node holding the largest key and its item.
+            :complexity: O(1)
+            :raises ValueError: if the map is empty
+        """
+        if self.length == 0:
+            raise ValueError('Peeking into an empty map')
+        return TreeNode(self.key_blocks[-1][-1], self.item_blocks[-1][-1])
+
+    def pop_min(self) -> TreeNode:
+        """
+            Removes the smallest key and returns a detached node holding it and its item.
+            :complexity: O(LOAD + N / LOAD)
+            :raises ValueError: if the map is empty
+        """
+        if self.length == 0:
+            raise ValueError('Popping from an empty map')
+        return TreeNode(*self.remove_at(0, 0))
+
+    def pop_max(self) -> TreeNode:
+        """
+            Removes the largest key and returns a detached node holding it and its item.
+            :complexity: O(1) unless the last block has to be merged
+            :raises ValueError: if the map is empty
+        """
+        if self.length == 0:
+            raise ValueError('Popping from an empty map')
+        last = len(self.key_blocks) - 1
+        return TreeNode(*self.remove_at(last, len(self.key_blocks[last]) - 1))
+
+    def __iter__(self) -> Iterator[K]:
+        """
+            Generates the keys in ascending order.
+            :complexity: O(N)
+        """
+        for keys in self.key_blocks:
+            yield from keys
+
+    def items(self) -> Iterator[tuple[K, I]]:
+        """
+            Generates the (key, item) pairs in ascending key order.
+            :complexity: O(N)
+        """
+        for keys, items in zip(self.key_blocks, self.item_blocks):
+            yield from zip(keys, items)
+
+    def values(self) -> Iterator[I]:
+        """
+            Generates the items in ascending key order.
+            :complexity: O(N)
+        """
+        for items in self.item_blocks:
+            yield from items
+
+    def reversed(self) -> Iterator[tuple[K, I]]:
+        """
+            Generates the (key, item) pairs in descending key order.
+            :complexity: O(N)
+        """
+        for block in range(len(self.key_blocks) - 1, -1, -1):
+            keys, items = self.key_blocks[block], self.item_blocks[block]
+            for position in range(len(keys) - 1, -1, -1):
+                yield keys[position], items[position]
+
+    def iter_from(self, key: K) -> Iterator[tuple[K, I]]:
+        """
+            Generates the (key, item) pairs in ascending key order, starting
+            at the smallest key greater than or equal to key.
+            :complexity: O(CompK * log N) to find the start, then O(1) per pair
+        """
+        if self.length == 0:
+            return
+        block, position = self.locate(key)
+        keys, items = self.key_blocks[block], self.item_blocks[block]
+        for offset in range(position, len(keys)):
+            yield keys[offset], items[offset]
+        for block in range(block + 1, len(self.key_blocks)):
+            yield from zip(self.key_blocks[block], self.item_blocks[block])
+
+    def range_between(self, i: int, j: int) -> List:
+        """
+            Returns a sorted list of all keys in the map between the ith and jth indices, inclusive.
+            :complexity: O(N / LOAD + j - i)
+        """
+        ranged_list = []
+        if j < self.length:
+            start = 0
+            for keys in self.key_blocks:
+                end = start + len(keys)
+                if end > i:
+                    ranged_list.extend(keys[max(i - start, 0):j - start + 1])
+                if end > j:
+                    break
+                start = end
+        return ranged_list
@@ -0,0 +1,102 @@
+"""
+    Bit-based implementation of Set ADT for small non-negative integers.
+"""
+
+from __future__ import annotations
+from typing import Iterator
+from set import *
+
+
+class BitSet(Set[int]):
+    """Implementation of the set ADT as the bits of a Python int.
+
+    Attributes:
+        * bits (int): bit i is set if and only if i is in the set
+
+    Suited to dense universes of small integers, such as material, cave
+    or player indices. Union, intersection and difference are single
+    bitwise operations on whole machine words, and the size of the set
+    is a popcount. Python ints grow as needed, so the set is never full;
+    capacity is accepted for compatibility with the other sets.
+    """
+
+    def __init__(self, capacity: int = 1) -> None:
+        """ Initialization. """
+        Set.__init__(self)
+
+    def __len__(self) -> int:
+        """ Returns the number of elements in the set.
+        :complexity: O(U / w) popcount, where U is the largest element and w the word size
+        """
+        return self.bits.bit_count()
+
+    def is_empty(self) -> bool:
+        """ True if the set is empty. """
+        return self.bits == 0
+
+    def clear(self) -> None:
+        """ Makes the set empty. """
+        self.bits = 0
+
+    def __contains__(self, item: int) -> bool:
+        """ True if the set contains the item. Anything that is not a
+        non-negative int is never in the set.
+        """
+        return isinstance(item, int) and item >= 0 and (self.bits >> item) & 1 == 1
+
+    def __iter__(self) -> Iterator[int]:
+        """ Iterates over the elements in increasing order, jumping from
+        one set bit to the next.
+        :complexity: O(N * U / w) where N is the number of elements
+        """
+        bits = self.bits
+        while bits:
+            lowest = bits & -bits
+            yield lowest.bit_length() - 1
+            bits ^= lowest
+
+    def add(self, item: int) -> None:
+        """ Adds an element to the set.
+        :raises ValueError: if item is negative
+        """
+        if item < 0:
+            raise ValueError('BitSet elements must be non-negative, got {0}'.format(item))
+        self.bits |= 1 << item
+
+    def remove(self, item: int) -> None:
+        """ Removes an element from the set.
+        :pre: the element should be present in the set
+        :raises KeyError: if no such element is found.
+        """
+        if item not in self:
+            raise KeyError(item)
+        self.bits ^= 1 << item
+
+    @classmethod
+    def from_bits(cls, bits: int) -> BitSet:
+        """ Creates a set whose elements are the set bits of bits. """
+        res = cls()
+        res.bits = bits
+        return res
+
+    def union(self, other: BitSet) -> BitSet:
+        """ Creates a new set equal to the union with another one.
+        :complexity: O(U / w)
+        """
+        return BitSet.from_bits(self.bits | other.bits)
+
+    def intersection(self, other: BitSet) -> BitSet:
+        """ Creates a new set equal to the intersection with another one.
+        :complexity: O(U / w)
+        """
+        return BitSet.from_bits(self.bits & other.bits)
+
+    def difference(self, other: BitSet) -> BitSet:
+        """ Creates a new set equal to the difference with another one.
+        :complexity: O(U / w)
+        """
+        return BitSet.from_bits(self.bits & ~other.bits)
+
+    def __str__(self):
+        """ Magic method constructing a string representation of the set object. """
+        return '{' + ', '.join(str(item) for item in self) + '}'
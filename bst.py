@@ -8,9 +8,10 @@ from __future__ import annotations
 __author__ = 'Brendon Taylor, modified by Alexey Ignatiev, further modified by Jackson Goerner'
 __docformat__ = 'reStructuredText'
 
-from typing import TypeVar, Generic
+from typing import TypeVar, Generic, Iterator
 from linked_stack import LinkedStack
 from node import TreeNode
+import operator
 import sys
 
 
@@ -65,8 +66,147 @@ class BSTInOrderIterator:
         return result.key
 
 
-class BinarySearchTree(Generic[K, I]):
-    """ Basic binary search tree. """
+class TreeStatistics:
+    """ Operation counters shared by the search trees.
+
+        Counters are off by default. Setting COLLECT_STATISTICS turns them
+        on for every tree created afterwards, and enable_statistics() turns
+        them on for a single tree. They are installed as wrappers around
+        the recursive methods of the tree, so trees that do not collect
+        statistics run exactly the same code as before.
+    """
+
+    COLLECT_STATISTICS = False
+
+    # link standing for an empty sub-tree, as passed to the wrapped methods
+    NIL = None
+
+    # counters read by statistics(); instances only get their own copies
+    # once enable_statistics() or reset_statistics() is called
+    statistics_enabled = False
+    comparison_count = 0
+    visit_total = 0
+    operation_count = 0
+    depth_max = 0
+    left_rotation_count = 0
+    right_rotation_count = 0
+
+    def statistics(self) -> tuple:
+        """
+            Gets statistics for the tree since they were last reset
+
+            Returns a tuple containing:
+                comparison_count - total number of comparisons of the key with the nodes
+                    a search, insertion or deletion descends through, the CompK of the
+                    complexities: one or two per node, depending on the branch taken
+                visit_total - total number of nodes entered by searches, insertions, deletions and pops
+                operation_count - number of those operations, so that visit_total / operation_count
+                    is the number of nodes visited per operation
+                depth_max - depth of the deepest node reached, the root being at depth 1
+                left_rotation_count - total number of left rotations
+                right_rotation_count - total number of right rotations
+
+            The batch and set operations of the trees that have them (get_many,
+            update, join, split and union) are not counted, apart from the
+            rotations they make on this tree.
+
+            :complexity: O(1)
+        """
+        return (self.comparison_count, self.visit_total, self.operation_count, self.depth_max,
+                self.left_rotation_count, self.right_rotation_count)
+
+    def reset_statistics(self) -> None:
+        """
+            Sets all counters back to zero.
+            :complexity: O(1)
+        """
+        self.comparison_count = 0
+        self.visit_total = 0
+        self.operation_count = 0
+        self.depth_max = 0
+        self.left_rotation_count = 0
+        self.right_rotation_count = 0
+        self.depth = 0
+
+    def enable_statistics(self) -> None:
+        """
+            Starts counting from zero. Trees extend this to install the
+            wrappers around their own methods.
+            :complexity: O(1)
+        """
+        self.statistics_enabled = True
+        self.counted_methods = []
+        self.reset_statistics()
+
+    def disable_statistics(self) -> None:
+        """
+            Removes the counting wrappers. The counters keep their last values.
+            :complexity: O(1)
+        """
+        if not self.statistics_enabled:
+            return
+        for name in self.counted_methods:
+            delattr(self, name)
+        self.counted_methods = []
+        self.statistics_enabled = False
+
+    def count_descent(self, name: str, first=None) -> None:
+        """
+            Wraps the recursive method called name, whose first argument is the
+            current node, so that it counts the nodes it enters and their depth.
+            The outermost call of a recursion is counted as one operation.
+            first is the comparison the method makes first at every node,
+            operator.eq or operator.lt, with the key as its second argument. A
+            node costs one comparison when it holds and two otherwise, as the
+            method then makes a second one to pick a branch. None means the
+            method compares no keys.
+
+            :complexity: O(1)
+        """
+        method = getattr(self, name)
+        key_of = self.get_key
+
+        def counted(current, *args):
+            self.depth += 1
+            if self.depth == 1:
+                self.operation_count += 1
+            if current != self.NIL:
+                self.visit_total += 1
+                if first is not None:
+                    self.comparison_count += 1 if first(args[0], key_of(current)) else 2
+                if self.depth > self.depth_max:
+                    self.depth_max = self.depth
+            try:
+                return method(current, *args)
+            finally:
+                self.depth -= 1
+
+        setattr(self, name, counted)
+        self.counted_methods.append(name)
+
+    def count_rotations(self) -> None:
+        """
+            Wraps left_rotate and right_rotate of trees that have them so
+            that they are counted.
+            :complexity: O(1)
+        """
+        left_rotate, right_rotate = self.left_rotate, self.right_rotate
+
+        def counted_left_rotate(current):
+            self.left_rotation_count += 1
+            return left_rotate(current)
+
+        def counted_right_rotate(current):
+            self.right_rotation_count += 1
+            return right_rotate(current)
+
+        self.left_rotate = counted_left_rotate
+        self.right_rotate = counted_right_rotate
+        self.counted_methods.extend(['left_rotate', 'right_rotate'])
+
+
+class BinarySearchTree(TreeStatistics, Generic[K, I]):
+    """ Basic binary search tree. Operation counters come from TreeStatistics. """
 
     def __init__(self) -> None:
         """
@@ -76,6 +216,27 @@ class BinarySearchTree(Generic[K, I]):
 
         self.root = None
         self.length = 0
+        if self.COLLECT_STATISTICS:
+            self.enable_statistics()
+
+    def enable_statistics(self) -> None:
+        """
+            Starts counting the operations on this tree from zero.
+            :complexity: O(1)
+        """
+        if self.statistics_enabled:
+            return
+        TreeStatistics.enable_statistics(self)
+        self.count_descent('get_tree_node_by_key_aux', operator.eq)
+        self.count_descent('insert_aux', operator.lt)
+        self.count_descent('delete_aux', operator.lt)
+
+    def get_key(self, current: TreeNode) -> K:
+        """
+            Returns the key of a node.
+            :complexity: O(1)
+        """
+        return current.key
 
     def is_empty(self) -> bool:
         """
@@ -114,6 +275,78 @@ class BinarySearchTree(Generic[K, I]):
         """
         return BSTInOrderIterator(self.root)
 
+    def items(self) -> Iterator[tuple[K, I]]:
+        """
+        Generate the (key, item) pairs of the tree in ascending key order.
+        Uses a plain list as the traversal stack, so no stack nodes are
+        allocated and no second lookup is needed to fetch the items.
+
+        Complexity: O(N) for the full traversal, where N is the number of nodes
+        """
+        stack = []
+        current = self.root
+        while current is not None or stack:
+            while current is not None:
+                stack.append(current)
+                current = current.left
+            current = stack.pop()
+            yield current.key, current.item
+            current = current.right
+
+    def values(self) -> Iterator[I]:
+        """
+        Generate the items of the tree in ascending key order.
+
+        Complexity: see items(self) -> Iterator[tuple[K, I]]
+        """
+        for _, item in self.items():
+            yield item
+
+    def reversed(self) -> Iterator[tuple[K, I]]:
+        """
+        Generate the (key, item) pairs of the tree in descending key order.
+
+        Complexity: O(N) for the full traversal, where N is the number of nodes
+        """
+        stack = []
+        current = self.root
+        while current is not None or stack:
+            while current is not None:
+                stack.append(current)
+                current = current.right
+            current = stack.pop()
+            yield current.key, current.item
+            current = current.left
+
+    def iter_from(self, key: K) -> Iterator[tuple[K, I]]:
+        """
+        Generate the (key, item) pairs of the tree in ascending key order,
+        starting at the smallest key that is greater than or equal to key.
+        The key itself does not need to be in the tree.
+
+        :complexity best: O(CompK * D) to find the start, then O(1) amortised per pair
+        :complexity worst: O(CompK * D + N) when the whole tree is generated
+        where D is the depth of the tree and N is the number of nodes
+        CompK is the complexity of comparing the keys
+        """
+        # descend towards key, only keeping the nodes that are still to be visited
+        stack = []
+        current = self.root
+        while current is not None:
+            if key <= current.key:
+                stack.append(current)
+                current = current.left
+            else:
+                current = current.right
+
+        while stack:
+            current = stack.pop()
+            yield current.key, current.item
+            current = current.right
+            while current is not None:
+                stack.append(current)
+                current = current.left
+
     def __getitem__(self, key: K) -> I:
         """
             Attempts to get an item in the tree, it uses the Key to attempt to find it
@@ -157,6 +390,15 @@ class BinarySearchTree(Generic[K, I]):
         """
         self.root = self.insert_aux(self.root, key, item)
 
+    def create_node(self, key: K, item: I) -> TreeNode:
+        """
+        Creates a new node for the tree. Subclasses that need a different
+        node type override this.
+
+        Complexity: O(1)
+        """
+        return TreeNode(key, item)
+
     def insert_aux(self, current: TreeNode, key: K, item: I) -> TreeNode:
         """
             Attempts to insert an item into the tree, it uses the Key to insert it
@@ -167,7 +409,7 @@ class BinarySearchTree(Generic[K, I]):
             CompK is the complexity of comparing the keys
         """
         if current is None:  # base case: at the leaf
-            current = TreeNode(key, item)
+            current = self.create_node(key, item)
             self.length += 1
         elif key < current.key:
             current.left = self.insert_aux(current.left, key, item)
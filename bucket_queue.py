@@ -0,0 +1,144 @@
+""" Bucket queue for small integer keys.
+
+Keys are integers in a range fixed at construction, such as the hunger
+bars (1 to 500) or prices (1 to 50) of Food. Every key has its own
+bucket in an array, so adding is an index and an append, with no key
+comparisons, and the highest non-empty bucket is tracked so the maximum
+is found by stepping down over empty buckets only.
+"""
+
+from __future__ import annotations
+
+__docformat__ = 'reStructuredText'
+
+from typing import Generic, TypeVar
+from node import TreeNode
+
+I = TypeVar('I')
+
+
+class BucketQueue(Generic[I]):
+    """ Max priority queue for integer keys between lo and hi inclusive.
+
+        A key can hold several items; each bucket is a stack, so the item
+        added last is the first one to leave. peek_max and pop_max return a detached TreeNode
+        holding the key and item, as the AVLTree-compatible maps do.
+
+        Finding the maximum steps down from the highest bucket used so
+        far, and each step passes an empty bucket. As long as no key above
+        the current maximum is added back, every bucket is passed at most
+        once, so a run of pops costs O(hi - lo + number of pops) in total,
+        which is O(1) amortised per pop when the queue is drained.
+    """
+
+    def __init__(self, lo: int, hi: int) -> None:
+        """
+            Initialises an empty queue with one bucket for every key from lo to hi.
+            :complexity: O(hi - lo)
+            :raises ValueError: if hi is smaller than lo
+        """
+        if hi < lo:
+            raise ValueError('Empty key range')
+        self.lo = lo
+        self.hi = hi
+        self.buckets = [[] for _ in range(hi - lo + 1)]
+        self.top = -1  # index of the highest bucket that may be non-empty
+        self.length = 0
+
+    def __len__(self) -> int:
+        """
+            Returns the number of items in the queue, counting every item of a key.
+            :complexity: O(1)
+        """
+        return self.length
+
+    def is_empty(self) -> bool:
+        """
+            Checks to see if the queue is empty
+            :complexity: O(1)
+        """
+        return self.length == 0
+
+    def bucket(self, key: int) -> list:
+        """
+            Returns the bucket of key.
+            :complexity: O(1)
+            :raises ValueError: if key is outside the range of the queue
+        """
+        if not self.lo <= key <= self.hi:
+            raise ValueError('Key {0} outside range {1} to {2}'.format(key, self.lo, self.hi))
+        return self.buckets[key - self.lo]
+
+    def __contains__(self, key: int) -> bool:
+        """
+            Checks to see if there is an item at key. Keys outside the range are never present.
+            :complexity: O(1)
+        """
+        return self.lo <= key <= self.hi and len(self.buckets[key - self.lo]) > 0
+
+    def __getitem__(self, key: int) -> I:
+        """
+            Returns the newest item at key.
+            :complexity: O(1)
+            :raises KeyError: if there is no item at key
+        """
+        if key not in self:
+            raise KeyError('Key not found: {0}'.format(key))
+        return self.buckets[key - self.lo][-1]
+
+    def __setitem__(self, key: int, item: I) -> None:
+        """
+            Adds item at key.
+            :complexity: O(1) amortised
+            :raises ValueError: if key is outside the range of the queue
+        """
+        self.bucket(key).append(item)
+        if key - self.lo > self.top:
+            self.top = key - self.lo
+        self.length += 1
+
+    def __delitem__(self, key: int) -> None:
+        """
+            Removes the newest item at key.
+            :complexity: O(1)
+            :raises ValueError: if there is no item at key
+        """
+        if key not in self:
+            raise ValueError('Deleting non-existent item')
+        self.buckets[key - self.lo].pop()
+        self.length -= 1
+
+    def find_top(self) -> int:
+        """
+            Moves top down to the highest non-empty bucket and returns it.
+            :complexity: O(1) amortised, see the class documentation
+            :raises ValueError: if the queue is empty
+        """
+        if self.length == 0:
+            self.top = -1
+            raise ValueError('Peeking into an empty queue')
+        while not self.buckets[self.top]:
+            self.top -= 1
+        return self.top
+
+    def peek_max(self) -> TreeNode:
+        """
+            Returns a detached node holding the largest key and its newest item.
+            :complexity: see find_top(self) -> int
+            :raises ValueError: if the queue is empty
+        """
+        top = self.find_top()
+        return TreeNode(top + self.lo, self.buckets[top][-1])
+
+    def pop_max(self) -> TreeNode:
+        """
+            Removes the newest item of the largest key and returns a detached
+            node holding them.
+            :complexity: see find_top(self) -> int
+            :raises ValueError: if the queue is empty
+        """
+        if self.length == 0:
+            raise ValueError('Popping from an empty queue')
+        top = self.find_top()
+        self.length -= 1
+        return TreeNode(top + self.lo, self.buckets[top].pop())
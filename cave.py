@@ -106,17 +106,20 @@ class Cave:
     Sets cave in a certain format
     """
     
-    def __init__(self, name: str, material: Material, quantity: float=0) -> None:
+    def __init__(self, name: str, material: Material, quantity: float=0, rng=RandomGen) -> None:
         """
         Initializing Cave class instance variables
 
+        Parameters:
+            rng - The random stream that draws the quantity when none is given
+
         Best and Worst Complexity: O(1) 
         """
         self.name = name
         self.material = material
         self.quantity = quantity
         if self.quantity == 0:
-            self.quantity = round(RandomGen.randint(1, 10), 2)
+            self.quantity = round(rng.randint(1, 10), 2)
 
     def add_quantity(self, amount: float) -> None:
         """
@@ -167,19 +170,20 @@ class Cave:
         return f"{self.name} {self.quantity} {self.material}"
 
     @classmethod
-    def random_cave(cls, material_list: list[Material]) -> Cave:
+    def random_cave(cls, material_list: list[Material], rng=RandomGen) -> Cave:
         """
         Randomizes a cave and choose a material from the list provided
 
         Parameters:
             material_list - A list of materials to choose from when creating a cave
+            rng - The random stream to draw from, RandomGen's default stream unless given
 
         Best and Worst Complexity: O(1) 
         """
-        random_name = RandomGen.random_choice(CAVE_NAMES) # gets the name of the cave
-        random_material = RandomGen.random_choice(material_list) # gets the material the cave stores
+        random_name = rng.random_choice(CAVE_NAMES) # gets the name of the cave
+        random_material = rng.random_choice(material_list) # gets the material the cave stores
 
-        return cls(random_name, random_material)
+        return cls(random_name, random_material, rng=rng)
 
 
 if __name__ == "__main__":
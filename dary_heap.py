@@ -0,0 +1,143 @@
+""" d-ary heap with a configurable order.
+
+A generalisation of the MaxHeap in heap.py: every node has up to d
+children instead of two, and the order is given by a key function, a
+comparator, or both. A larger d makes the tree shallower (log_d n
+levels), so additions rise through fewer levels, while removals compare
+up to d children per level; the children of a node sit next to each
+other in the array.
+"""
+
+from __future__ import annotations
+
+__docformat__ = 'reStructuredText'
+
+from operator import gt
+from typing import Any, Callable, Generic, Iterable, TypeVar
+
+T = TypeVar('T')
+
+
+class DaryHeap(Generic[T]):
+    """ Heap with d children per node, stored in a list from index 0.
+
+        The element at the top is the one whose priority comes first
+        according to comparator(a, b), which returns True when a must be
+        above b. The priority of an element is key(element), or the element
+        itself without a key, and the default comparator is >, which makes
+        a max-heap. The priorities are computed once per element.
+    """
+
+    def __init__(self, d: int = 4, key: Callable[[T], Any] = None,
+                 comparator: Callable[[Any, Any], bool] = None) -> None:
+        """
+            :complexity: O(1)
+            :raises ValueError: if d is smaller than 2
+        """
+        if d < 2:
+            raise ValueError('A heap needs at least 2 children per node')
+        self.d = d
+        self.key = key
+        self.before = gt if comparator is None else comparator
+        self.elements = []
+        self.priorities = []
+
+    @classmethod
+    def heapify(cls, items: Iterable[T], d: int = 4, key: Callable[[T], Any] = None,
+                comparator: Callable[[Any, Any], bool] = None) -> DaryHeap[T]:
+        """
+            Builds a heap holding items by sinking every internal node,
+            from the last one up to the root.
+            :complexity: O(d * n)
+        """
+        heap = cls(d, key, comparator)
+        heap.elements = list(items)
+        heap.priorities = heap.elements[:] if key is None else [key(element) for element in heap.elements]
+        for k in range((len(heap.elements) - 2) // d, -1, -1):
+            heap.sink(k)
+        return heap
+
+    def __len__(self) -> int:
+        return len(self.elements)
+
+    def is_empty(self) -> bool:
+        return len(self.elements) == 0
+
+    def rise(self, k: int) -> None:
+        """
+            Rise the element at index k to its correct position.
+            :complexity: O(log_d n)
+        """
+        elements, priorities, before, d = self.elements, self.priorities, self.before, self.d
+        element, priority = elements[k], priorities[k]
+        while k > 0:
+            parent = (k - 1) // d
+            if not before(priority, priorities[parent]):
+                break
+            elements[k], priorities[k] = elements[parent], priorities[parent]
+            k = parent
+        elements[k], priorities[k] = element, priority
+
+    def sink(self, k: int) -> None:
+        """
+            Make the element at index k sink to its correct position.
+            :complexity: O(d * log_d n)
+        """
+        elements, priorities, before, d = self.elements, self.priorities, self.before, self.d
+        element, priority = elements[k], priorities[k]
+        length = len(elements)
+        while True:
+            first = d * k + 1
+            if first >= length:
+                break
+            best = first
+            for child in range(first + 1, min(first + d, length)):
+                if before(priorities[child], priorities[best]):
+                    best = child
+            if not before(priorities[best], priority):
+                break
+            elements[k], priorities[k] = elements[best], priorities[best]
+            k = best
+        elements[k], priorities[k] = element, priority
+
+    def add(self, element: T) -> None:
+        """
+            Adds element to the heap.
+            :complexity: O(log_d n) amortised
+        """
+        self.elements.append(element)
+        self.priorities.append(element if self.key is None else self.key(element))
+        self.rise(len(self.elements) - 1)
+
+    def extend(self, items: Iterable[T]) -> None:
+        """
+            Adds every element of items.
+            :complexity: O(m * log_d (n + m)) for m new elements
+        """
+        for element in items:
+            self.add(element)
+
+    def peek(self) -> T:
+        """
+            Returns the top element without removing it.
+            :complexity: O(1)
+            :raises IndexError: if the heap is empty
+        """
+        if not self.elements:
+            raise IndexError
+        return self.elements[0]
+
+    def get_max(self) -> T:
+        """
+            Remove (and return) the top element, the maximum for the default order.
+            :complexity: O(d * log_d n)
+            :raises IndexError: if the heap is empty
+        """
+        if not self.elements:
+            raise IndexError
+        top = self.elements[0]
+        element, priority = self.elements.pop(), self.priorities.pop()
+        if self.elements:
+            self.elements[0], self.priorities[0] = element, priority
+            self.sink(0)
+        return top
@@ -141,15 +141,18 @@ class Food:
         return f"{self.name} {self.price} {self.hunger_bars}"
 
     @classmethod
-    def random_food(cls) -> Food:
+    def random_food(cls, rng=RandomGen) -> Food:
         """
         Randomizes a food name, hunger bars and price
 
+        Parameters:
+            rng - The random stream to draw from, RandomGen's default stream unless given
+
         Best and Worst Complexity: O(1) 
         """
-        hunger_bars = RandomGen.randint(1, 500)
-        price = RandomGen.randint(1, 50)
-        return cls(RandomGen.random_choice(FOOD_NAMES), hunger_bars, price)
+        hunger_bars = rng.randint(1, 500)
+        price = rng.randint(1, 50)
+        return cls(rng.random_choice(FOOD_NAMES), hunger_bars, price)
     
 
 if __name__ == "__main__":
@@ -8,6 +8,7 @@ as well as simulating days and verifying that player choices are correct
 from __future__ import annotations
 from abc import abstractmethod
 from hash_table import LinearProbeTable
+from hset import HSet
 from node import TreeNode
 
 from player import Player, PLAYER_NAMES
@@ -17,7 +18,7 @@ from cave import Cave
 from food import FOOD_NAMES, Food
 from random_gen import RandomGen
 from avl import AVLTree
-from heap import MaxHeap
+from heap import MaxHeap, TopK
 from linked_stack import LinkedStack
 
 class Game:
@@ -34,10 +35,16 @@ class Game:
     MIN_FOOD = 2
     MAX_FOOD = 5
 
-    def __init__(self) -> None:
+    def __init__(self, rng=RandomGen) -> None:
         """
             Instantiates a Game object
+
+            Parameters:
+                - rng: the random stream all game objects are generated from. RandomGen's
+                  default stream unless given; pass a RandomStream to run games side
+                  by side without them perturbing each other
         """
+        self.rng = rng
         self.materials = AVLTree()
         self.traders = AVLTree()
 
@@ -45,15 +52,15 @@ class Game:
         """
             Initialise all game objects: Materials, Caves, Traders.
         """
-        N_MATERIALS = RandomGen.randint(self.MIN_MATERIALS, self.MAX_MATERIALS)
+        N_MATERIALS = self.rng.randint(self.MIN_MATERIALS, self.MAX_MATERIALS)
         self.generate_random_materials(N_MATERIALS)
         print("Materials:\n\t", end="")
         print("\n\t".join(map(str, self.get_materials())))
-        N_CAVES = RandomGen.randint(self.MIN_CAVES, self.MAX_CAVES)
+        N_CAVES = self.rng.randint(self.MIN_CAVES, self.MAX_CAVES)
         self.generate_random_caves(N_CAVES)
         print("Caves:\n\t", end="")
         print("\n\t".join(map(str, self.get_caves())))
-        N_TRADERS = RandomGen.randint(self.MIN_TRADERS, self.MAX_TRADERS)
+        N_TRADERS = self.rng.randint(self.MIN_TRADERS, self.MAX_TRADERS)
         self.generate_random_traders(N_TRADERS)
         print("Traders:\n\t", end="")
         print("\n\t".join(map(str, self.get_traders())))
@@ -145,15 +152,15 @@ class Game:
             :complexity: O(N) where N is amount
         """
         materials_generated = []
-        material_names = []
-        material_mining_times = []
+        material_names = HSet(amount)
+        material_mining_times = HSet(amount)
         number = 0
         while number < amount:
-            material_to_add = Material.random_material()
+            material_to_add = Material.random_material(self.rng)
             if material_to_add.get_name() not in material_names and material_to_add.get_mining_rate() not in material_mining_times:
                 materials_generated.append(material_to_add)
-                material_names.append(material_to_add.get_name())
-                material_mining_times.append(material_to_add.get_mining_rate())
+                material_names.add(material_to_add.get_name())
+                material_mining_times.add(material_to_add.get_mining_rate())
                 number += 1
         self.set_materials(materials_generated)
 
@@ -169,13 +176,13 @@ class Game:
             :complexity: O(N) where N is amount
         """
         random_caves = []
-        cave_names = []
+        cave_names = HSet(amount)
         number = 0
         while number < amount:
-            cave_to_add = Cave.random_cave(self.materials)
+            cave_to_add = Cave.random_cave(self.materials, self.rng)
             if cave_to_add.get_name() not in cave_names:
                 random_caves.append(cave_to_add)
-                cave_names.append(cave_to_add.get_name())
+                cave_names.add(cave_to_add.get_name())
                 number += 1
 
         self.set_caves(random_caves)
@@ -195,22 +202,34 @@ class Game:
         """
         random_traders = []
         for _ in range(amount):
-            trader_type = RandomGen.random_choice([RandomTrader(Trader),RangeTrader(Trader),HardTrader(Trader)])
-            trader = trader_type.random_trader()
+            trader_type = self.rng.random_choice([RandomTrader(Trader),RangeTrader(Trader),HardTrader(Trader)])
+            trader = trader_type.random_trader(self.rng)
             random_traders.append(trader)
             trader.set_all_materials(self.materials)
         self.set_traders(random_traders)
 
+    def reset_tree_statistics(self) -> None:
+        """
+            Starts the tree statistics of a new day. The trees of the players
+            are rebuilt every day and start from zero anyway, while the
+            material trees of the traders are kept from one day to the next.
+
+            :complexity: O(T) where T is the number of traders
+        """
+        for trader in self.traders:
+            if trader.materials.statistics_enabled:
+                trader.materials.reset_statistics()
+
     def finish_day(self):
         """
         DO NOT CHANGE
         Affects test results.
         """
         for cave in self.get_caves():
-            if cave.quantity > 0 and RandomGen.random_chance(0.2):
-                cave.remove_quantity(RandomGen.random_float() * cave.quantity)
+            if cave.quantity > 0 and self.rng.random_chance(0.2):
+                cave.remove_quantity(self.rng.random_float() * cave.quantity)
             else:
-                cave.add_quantity(round(RandomGen.random_float() * 10, 2))
+                cave.add_quantity(round(self.rng.random_float() * 10, 2))
             cave.quantity = round(cave.quantity, 2)
 
 class SoloGame(Game):
@@ -222,7 +241,7 @@ class SoloGame(Game):
             based on the game's random generation.
         """
         super().initialise_game()
-        self.player = Player.random_player()
+        self.player = Player.random_player(self.rng)
         self.player.set_materials(self.get_materials())
         self.player.set_caves(self.get_caves())
         self.player.set_traders(self.get_traders())
@@ -254,6 +273,7 @@ class SoloGame(Game):
 
             :complexity: O(n) where n is the self.traders or food_num
         """
+        self.reset_tree_statistics()
         # 1. Traders make deals    
         # Each trader from the trader list will generate a deal
         for trader in self.traders:
@@ -262,13 +282,13 @@ class SoloGame(Game):
         print("Traders Deals:\n\t", end="")
         print("\n\t".join(map(str, self.get_traders())))
         # 2. Food is offered
-        food_num = RandomGen.randint(self.MIN_FOOD, self.MAX_FOOD)
+        food_num = self.rng.randint(self.MIN_FOOD, self.MAX_FOOD)
         foods = []
         for _ in range(food_num):
-            foods.append(Food.random_food())
+            foods.append(Food.random_food(self.rng))
         print("\nFoods:\n\t", end="")
         print("\n\t".join(map(str, foods)))
-        self.player.set_foods(foods)
+        self.player.set_foods(foods, self.rng)
         # 3. Select one food item to purchase
         food, balance, caves = self.player.select_food_and_caves()
         print(food, balance, caves)
@@ -326,11 +346,14 @@ class MultiplayerGame(Game):
     MIN_PLAYERS = 2
     MAX_PLAYERS = 5
 
-    def __init__(self) -> None:
+    def __init__(self, rng=RandomGen) -> None:
         """
             Instantiates a MultiplayerGame object
+
+            Parameters:
+                - rng: the random stream all game objects are generated from
         """
-        super().__init__()
+        super().__init__(rng)
         self.players = []
         for player in self.players:
             self.player = player
@@ -351,7 +374,7 @@ class MultiplayerGame(Game):
             based on the game's random generation.
         """
         super().initialise_game()
-        N_PLAYERS = RandomGen.randint(self.MIN_PLAYERS, self.MAX_PLAYERS)
+        N_PLAYERS = self.rng.randint(self.MIN_PLAYERS, self.MAX_PLAYERS)
         self.generate_random_players(N_PLAYERS)
         for player in self.players:
             player.set_materials(self.get_materials())
@@ -370,16 +393,16 @@ class MultiplayerGame(Game):
             :complexity: O(N) where N is amount
         """
         self.players_generated = []
-        player_names = []
-        players_balance = []
+        player_names = HSet(amount)
+        players_balance = HSet(amount)
         number = 0
         #add the players as much as am
         while number < amount:
-            player_to_add = Player.random_player()
+            player_to_add = Player.random_player(self.rng)
             if player_to_add.get_name() not in player_names and player_to_add.get_balance() not in players_balance:
                 self.players_generated.append(player_to_add)
-                player_names.append(player_to_add.get_name())
-                players_balance.append(player_to_add.get_balance())
+                player_names.add(player_to_add.get_name())
+                players_balance.add(player_to_add.get_balance())
                 number += 1
 
     def initialise_with_data(self, materials: list[Material], caves: list[Cave], traders: list[Trader], player_names: list[int], emerald_info: list[float]):
@@ -406,6 +429,7 @@ class MultiplayerGame(Game):
         print("\n\t".join(map(str, self.players)))
 
     def simulate_day(self):
+        self.reset_tree_statistics()
         # 1. Traders make deals
         self.trader_material_list = []
         for trader in self.traders:
@@ -415,7 +439,7 @@ class MultiplayerGame(Game):
         print("Traders Deals:\n\t", end="")
         print("\n\t".join(map(str, self.get_traders())))
         # 2. Food is offered
-        offered_food = Food.random_food()
+        offered_food = Food.random_food(self.rng)
         print(f"\nFoods:\n\t{offered_food}")
         # 3. Each player selects a cave - The game does this instead.
         foods, balances, caves = self.select_for_players(offered_food)
@@ -426,10 +450,10 @@ class MultiplayerGame(Game):
         """
             1. Check whether each player can afford the food. If they can afford, add it to food_list
             and if not, add None to food_list.
-            2. Create an AVLTree object that checks for traders that will have the highest buy price
-            and append the cave that has that material to the AVLTree
-            3. Then, push all the values from smallest to largest to a LinkedStack so that players will mine
-            in decreasing order of profit
+            2. Offer each cave whose material a trader buys to a TopK selector keyed by profit,
+            which keeps only the P most profitable caves
+            3. Then, push the selected caves from smallest to largest profit to a LinkedStack so that
+            players will mine in decreasing order of profit
             
             Parameters:
                 - food: the food in which a player will buy if the player can afford it
@@ -439,7 +463,7 @@ class MultiplayerGame(Game):
                 - profit_list: a list of balances that each player obtains from entering caves
                 - caves_list: a list of caves that each player visited respectively
 
-            :complexity: O(M + T + C + P)
+            :complexity: O(M + T + C * log P + P)
             where C is amount of caves, 
             P is the amount of player,
             T is the amount of trader,
@@ -457,9 +481,9 @@ class MultiplayerGame(Game):
             else:
                 food_list.append(None)
         
-        # initialize list of key and avl
+        # initialize list of key and the selector of the best cave for each player
         emeralds_key = []
-        emeralds_avl = AVLTree()
+        best_caves = TopK(len(self.players), key=lambda entry: entry[0])
         # calculate profit according to price of material and quantity
         for cave in self.caves: # O(C)
             material_in_cave = cave.get_material() 
@@ -468,15 +492,13 @@ class MultiplayerGame(Game):
                 index = self.trader_material_list.index(material_in_cave) # O(M)
                 profit = self.traders[index].get_buy_price() * quantity_in_cave
                 # if profit not already in list of key
-                # add profit and cave to avl followed by appending profit to key list
+                # offer profit and cave to the selector followed by appending profit to key list
                 if profit not in emeralds_key: # O(T)
-                    emeralds_avl.__setitem__(profit, cave)
+                    best_caves.add((profit, cave)) # O(log P)
                     emeralds_key.append(profit)
         
-        # Create a max heap to store all emerald values and append each value from emerald_keys
-        balance_heap = MaxHeap(len(emeralds_key)) 
-        for value in emeralds_key: # O(T)
-            balance_heap.add(value)
+        # Create a max heap to store all emerald values from emerald_keys
+        balance_heap = MaxHeap.heapify(emeralds_key) # O(T)
         
         # Get the items off the heap and append them to self.expected_balances
         max_item = balance_heap.get_max()
@@ -485,11 +507,10 @@ class MultiplayerGame(Game):
 
         # initialize cave linked stack
         cave_stack = LinkedStack()
-        # while the balance is not empty
-        while emeralds_avl.is_empty() == False:
+        # while the selector is not empty
+        while len(best_caves) > 0:
             # get lowest balance
-            the_smallest = emeralds_avl.get_minimal(emeralds_avl.get_root())
-            emeralds_avl.__delitem__(the_smallest.key)
+            the_smallest = best_caves.get_min()
             cave_stack.push(the_smallest)
         
         profit_list = []
@@ -498,7 +519,7 @@ class MultiplayerGame(Game):
         # and deduct the hunger bars it took
         for player in self.players: # O(P)
             if cave_stack.is_empty() == False:
-                big_cave = cave_stack.pop().item
+                big_cave = cave_stack.pop()[1]
                 cave_list.append((big_cave, big_cave.get_quantity()))
                 number_of_hunger_bars = big_cave.get_material().get_mining_rate() * big_cave.get_quantity()
                 if player.get_hunger_bars() >= number_of_hunger_bars:
@@ -179,6 +179,27 @@ class LinearProbeTable(Generic[T]):
 
         self.table[position] = (key, data)
 
+    def __delitem__(self, key: str) -> None:
+        """
+            Deletes the (key, data) pair. The rest of the cluster after it is
+            inserted again, so that no key is cut off from its hash position
+            by the new empty slot.
+            :complexity best: O(K) the next slot is empty
+            :complexity worst: O(K * N) the whole table is one cluster
+            :raises KeyError: when the key doesn't exist
+        """
+        position = self._linear_probe(key, False)
+        self.table[position] = None
+        self.count -= 1
+
+        position = (position + 1) % len(self.table)
+        while self.table[position] is not None:
+            (moved_key, moved_data) = self.table[position]
+            self.table[position] = None
+            self.count -= 1
+            self[moved_key] = moved_data
+            position = (position + 1) % len(self.table)
+
     def is_empty(self):
         """
             Returns whether the hash table is empty
@@ -232,3 +253,35 @@ class LinearProbeTable(Generic[T]):
                 (key, value) = item
                 result += "(" + str(key) + "," + str(value) + ")\n"
         return result
+
+
+class HashableProbeTable(LinearProbeTable[T]):
+    """
+        Linear Probe Table for keys of any hashable type, hashed with
+        Python's hash() rather than the first character of a string key.
+    """
+
+    def hash(self, key) -> int:
+        """
+            Hash a key for insertion into the hashtable.
+            Best and Worst Complexity: O(K) where K is the cost of hashing the key
+        """
+        return hash(key) % self.tablesize
+
+    def _rehash(self) -> None:
+        """
+            Resizes the table and reinserts all pairs into a HashableProbeTable,
+            keeping the keys as they are instead of converting them to strings.
+
+            :best and worst complexity: O(N) where N is length of self.table
+        """
+        self.rehash_count += 1
+        self.tablesize = next(self.iterator)
+
+        new_hash = HashableProbeTable(self.expected_size, self.tablesize)
+        for item in range(len(self.table)):
+            if self.table[item] is not None:
+                new_hash[self.table[item][0]] = self.table[item][1]
+
+        self.count = new_hash.count
+        self.table = new_hash.table
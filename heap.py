@@ -3,23 +3,54 @@ from __future__ import annotations
 __author__ = "Brendon Taylor, modified by Jackson Goerner"
 __docformat__ = 'reStructuredText'
 
-from typing import Generic
+from typing import Any, Callable, Generic, Iterable
 from referential_array import ArrayR, T
 
 
 class MaxHeap(Generic[T]):
+    """ Binary max-heap stored in an ArrayR from index 1.
+
+        max_size is only the initial capacity: the array doubles in size
+        whenever an element is added to a full heap.
+    """
     MIN_CAPACITY = 1
 
-    def __init__(self, max_size: int) -> None:
+    def __init__(self, max_size: int = MIN_CAPACITY) -> None:
         self.length = 0
         self.the_array = ArrayR(max(self.MIN_CAPACITY, max_size) + 1)
 
+    @classmethod
+    def heapify(cls, items: Iterable[T]) -> MaxHeap[T]:
+        """ Builds a heap holding items by sinking every internal node,
+            from the last one up to the root.
+            :complexity: O(n) comparisons, where n is the number of items
+        """
+        items = list(items)
+        heap = cls(len(items))
+        for k, item in enumerate(items, 1):
+            heap.the_array[k] = item
+        heap.length = len(items)
+        for k in range(heap.length // 2, 0, -1):
+            heap.sink(k)
+        return heap
+
     def __len__(self) -> int:
         return self.length
 
     def is_full(self) -> bool:
+        """ True when the next add will have to grow the array. """
         return self.length + 1 == len(self.the_array)
 
+    def grow(self, capacity: int) -> None:
+        """ Moves the elements into an array that holds capacity elements.
+            :pre: capacity >= self.length
+            :complexity: O(capacity)
+        """
+        new_array = ArrayR(capacity + 1)
+        for k in range(1, self.length + 1):
+            new_array[k] = self.the_array[k]
+        self.the_array = new_array
+
     def rise(self, k: int) -> None:
         """
         Rise element at index k to its correct position
@@ -34,14 +65,67 @@ class MaxHeap(Generic[T]):
     def add(self, element: T) -> bool:
         """
         Swaps elements while rising
+        :complexity: O(log n), amortised over the doubling of the array
         """
         if self.is_full():
-            raise IndexError
+            self.grow(2 * (len(self.the_array) - 1))
 
         self.length += 1
         self.the_array[self.length] = element
         self.rise(self.length)
 
+    def extend(self, items: Iterable[T]) -> None:
+        """ Adds every element of items. A batch larger than the heap is
+            appended as it is and the whole heap is rebuilt bottom-up, which
+            is cheaper than rising every new element.
+            :complexity: O(min(m log(n + m), n + m)) for m new elements
+        """
+        items = list(items)
+        if self.length + len(items) + 1 > len(self.the_array):
+            self.grow(max(self.length + len(items), 2 * (len(self.the_array) - 1)))
+        if len(items) <= self.length:
+            for item in items:
+                self.add(item)
+            return
+
+        for item in items:
+            self.length += 1
+            self.the_array[self.length] = item
+        for k in range(self.length // 2, 0, -1):
+            self.sink(k)
+
+    def peek(self) -> T:
+        """ Returns the maximum element without removing it.
+            :complexity: O(1)
+        """
+        if self.length == 0:
+            raise IndexError
+        return self.the_array[1]
+
+    def pushpop(self, element: T) -> T:
+        """ Adds element, then removes and returns the maximum, in a single
+            sink instead of a rise followed by a sink.
+            :complexity: O(log n)
+        """
+        if self.length == 0 or element >= self.the_array[1]:
+            return element
+        max_elt = self.the_array[1]
+        self.the_array[1] = element
+        self.sink(1)
+        return max_elt
+
+    def replace(self, element: T) -> T:
+        """ Removes and returns the maximum, then adds element, in a single
+            sink. The returned element may be smaller than element.
+            :complexity: O(log n)
+        """
+        if self.length == 0:
+            raise IndexError
+        max_elt = self.the_array[1]
+        self.the_array[1] = element
+        self.sink(1)
+        return max_elt
+
     def largest_child(self, k: int) -> int:
         """
         Returns the index of k's child with greatest value.
@@ -57,7 +141,7 @@ class MaxHeap(Generic[T]):
     def sink(self, k: int) -> None:
         """ Make the element at index k sink to the correct position.
             :pre: 1 <= k <= self.length
-            :complexity: ???
+            :complexity: O(log n)
         """
         item = self.the_array[k]
 
@@ -83,12 +167,278 @@ class MaxHeap(Generic[T]):
         return max_elt
 
 
+class TopK(Generic[T]):
+    """ Keeps the k largest elements added to it, by key(element).
+
+        The elements are held in a min-heap of size k, so the smallest of
+        the current best k is at the root and a new element only has to
+        beat that one to get in. The priority of an element is computed
+        once when it is added and kept in a parallel array, so key is not
+        called again while the heap is reordered.
+    """
+
+    def __init__(self, k: int, key: Callable[[T], Any] = None) -> None:
+        """ Creates an empty selector of the k largest elements, compared by
+            key(element), or by the elements themselves if key is None.
+            :complexity: O(k) to allocate the arrays
+        """
+        self.k = k
+        self.length = 0
+        self.key = key
+        self.the_array = ArrayR(max(1, k) + 1)
+        self.priorities = ArrayR(max(1, k) + 1)
+
+    def __len__(self) -> int:
+        return self.length
+
+    def priority_of(self, element: T):
+        """ Returns the priority of element: key(element), or the element
+            itself if there is no key. Called once per element offered.
+            :complexity: O(1) plus the cost of key
+        """
+        return element if self.key is None else self.key(element)
+
+    def sink(self, k: int) -> None:
+        """ Make the element at index k sink to the correct position of the min-heap.
+            :complexity: O(log k)
+        """
+        item, priority = self.the_array[k], self.priorities[k]
+        while 2 * k <= self.length:
+            child = 2 * k
+            if child < self.length and self.priorities[child + 1] < self.priorities[child]:
+                child += 1
+            if self.priorities[child] >= priority:
+                break
+            self.the_array[k], self.priorities[k] = self.the_array[child], self.priorities[child]
+            k = child
+        self.the_array[k], self.priorities[k] = item, priority
+
+    def add(self, element: T) -> bool:
+        """ Offers element and returns whether it is among the best k so far.
+            Once k elements are held, an element that is not larger than the
+            smallest of them is rejected with one comparison.
+            :complexity: O(log k)
+        """
+        if self.k <= 0:
+            return False
+        priority = self.priority_of(element)
+        if self.length < self.k:
+            self.length += 1
+            k = self.length
+            while k > 1 and priority < self.priorities[k // 2]:
+                self.the_array[k], self.priorities[k] = self.the_array[k // 2], self.priorities[k // 2]
+                k = k // 2
+            self.the_array[k], self.priorities[k] = element, priority
+            return True
+        if priority <= self.priorities[1]:
+            return False
+        self.the_array[1], self.priorities[1] = element, priority
+        self.sink(1)
+        return True
+
+    def peek(self) -> T:
+        """ Returns the smallest of the best k elements, the one the next
+            element has to beat.
+            :complexity: O(1)
+        """
+        if self.length == 0:
+            raise IndexError
+        return self.the_array[1]
+
+    def get_min(self) -> T:
+        """ Remove (and return) the smallest of the best k elements.
+            :complexity: O(log k)
+        """
+        if self.length == 0:
+            raise IndexError
+        min_elt = self.the_array[1]
+        self.the_array[1], self.priorities[1] = self.the_array[self.length], self.priorities[self.length]
+        self.the_array[self.length] = self.priorities[self.length] = None
+        self.length -= 1
+        if self.length > 0:
+            self.sink(1)
+        return min_elt
+
+    def largest(self) -> list[T]:
+        """ Removes the best k elements and returns them from largest to smallest.
+            :complexity: O(k log k)
+        """
+        elements = [self.get_min() for _ in range(self.length)]
+        elements.reverse()
+        return elements
+
+
+class HeapHandle(Generic[T]):
+    """ Entry of an IndexedMaxHeap. It remembers its position in the heap
+        array, so that the entry can be found again in O(1) to change its
+        priority or remove it.
+    """
+
+    __slots__ = ('element', 'priority', 'index')
+
+    def __init__(self, element: T, priority, index: int) -> None:
+        self.element = element
+        self.priority = priority
+        self.index = index
+
+
+class IndexedMaxHeap(Generic[T]):
+    """ Max-heap of elements ordered by key(element), where adding an
+        element returns a handle through which its priority can later be
+        raised, lowered or the element removed in O(log n).
+
+        The priority is computed once when the element is added; after the
+        element changes, call update(handle) to recompute it.
+    """
+    MIN_CAPACITY = 1
+
+    def __init__(self, max_size: int = MIN_CAPACITY, key: Callable[[T], Any] = None) -> None:
+        """ Creates an empty heap ordered by key(element), or by the elements
+            themselves if key is None. max_size is only the initial capacity.
+            :complexity: O(max_size) to allocate the array
+        """
+        self.length = 0
+        self.key = key
+        self.the_array = ArrayR(max(self.MIN_CAPACITY, max_size) + 1)
+
+    def __len__(self) -> int:
+        return self.length
+
+    def __contains__(self, handle: HeapHandle[T]) -> bool:
+        """ True if handle is an entry of this heap that has not been removed. """
+        return 0 < handle.index <= self.length and self.the_array[handle.index] is handle
+
+    def priority_of(self, element: T):
+        """ Returns the priority of element: key(element), or the element
+            itself if there is no key. Stored in the handle when the element
+            is added or updated.
+            :complexity: O(1) plus the cost of key
+        """
+        return element if self.key is None else self.key(element)
+
+    def place(self, handle: HeapHandle[T], k: int) -> None:
+        """ Stores handle at index k and records the index in the handle.
+            :complexity: O(1)
+        """
+        self.the_array[k] = handle
+        handle.index = k
+
+    def rise(self, k: int) -> None:
+        """ Rise the entry at index k to its correct position.
+            :complexity: O(log n)
+        """
+        handle = self.the_array[k]
+        while k > 1 and handle.priority > self.the_array[k // 2].priority:
+            self.place(self.the_array[k // 2], k)
+            k = k // 2
+        self.place(handle, k)
+
+    def sink(self, k: int) -> None:
+        """ Sink the entry at index k to its correct position.
+            :complexity: O(log n)
+        """
+        handle = self.the_array[k]
+        while 2 * k <= self.length:
+            child = 2 * k
+            if child < self.length and self.the_array[child + 1].priority > self.the_array[child].priority:
+                child += 1
+            if self.the_array[child].priority <= handle.priority:
+                break
+            self.place(self.the_array[child], k)
+            k = child
+        self.place(handle, k)
+
+    def add(self, element: T) -> HeapHandle[T]:
+        """ Adds element and returns its handle.
+            :complexity: O(log n), amortised over the doubling of the array
+        """
+        if self.length + 1 == len(self.the_array):
+            new_array = ArrayR(2 * self.length + 1)
+            for k in range(1, self.length + 1):
+                new_array[k] = self.the_array[k]
+            self.the_array = new_array
+        self.length += 1
+        handle = HeapHandle(element, self.priority_of(element), self.length)
+        self.the_array[self.length] = handle
+        self.rise(self.length)
+        return handle
+
+    def peek(self) -> T:
+        """ Returns the element with the highest priority without removing it. """
+        if self.length == 0:
+            raise IndexError
+        return self.the_array[1].element
+
+    def get_max(self) -> T:
+        """ Remove (and return) the element with the highest priority.
+            :complexity: O(log n)
+        """
+        if self.length == 0:
+            raise IndexError
+        return self.remove(self.the_array[1])
+
+    def remove(self, handle: HeapHandle[T]) -> T:
+        """ Removes the entry of handle and returns its element. The last
+            entry takes its place and then rises or sinks as needed.
+            :complexity: O(log n)
+            :raises ValueError: if handle is not in the heap
+        """
+        if handle not in self:
+            raise ValueError('Handle is not in the heap')
+        k = handle.index
+        last = self.the_array[self.length]
+        self.the_array[self.length] = None
+        self.length -= 1
+        handle.index = 0
+        if last is not handle:
+            self.place(last, k)
+            self.rise(k)
+            self.sink(last.index)
+        return handle.element
+
+    def increase_key(self, handle: HeapHandle[T], priority=None) -> None:
+        """ Raises the priority of handle to priority, or to the key of its
+            element if priority is not given.
+            :complexity: O(log n)
+            :raises ValueError: if handle is not in the heap or the priority would decrease
+        """
+        if handle not in self:
+            raise ValueError('Handle is not in the heap')
+        priority = self.priority_of(handle.element) if priority is None else priority
+        if priority < handle.priority:
+            raise ValueError('Increasing key of {0} to a lower priority'.format(handle.element))
+        handle.priority = priority
+        self.rise(handle.index)
+
+    def decrease_key(self, handle: HeapHandle[T], priority=None) -> None:
+        """ Lowers the priority of handle to priority, or to the key of its
+            element if priority is not given.
+            :complexity: O(log n)
+            :raises ValueError: if handle is not in the heap or the priority would increase
+        """
+        if handle not in self:
+            raise ValueError('Handle is not in the heap')
+        priority = self.priority_of(handle.element) if priority is None else priority
+        if priority > handle.priority:
+            raise ValueError('Decreasing key of {0} to a higher priority'.format(handle.element))
+        handle.priority = priority
+        self.sink(handle.index)
+
+    def update(self, handle: HeapHandle[T], priority=None) -> None:
+        """ Sets the priority of handle, in either direction.
+            :complexity: O(log n)
+            :raises ValueError: if handle is not in the heap
+        """
+        if handle not in self:
+            raise ValueError('Handle is not in the heap')
+        handle.priority = self.priority_of(handle.element) if priority is None else priority
+        self.rise(handle.index)
+        self.sink(handle.index)
+
+
 if __name__ == '__main__':
     items = [ int(x) for x in input('Enter a list of numbers: ').strip().split() ]
-    heap = MaxHeap(len(items))
+    heap = MaxHeap.heapify(items)
 
-    for item in items:
-        heap.add(item)
-        
     while(len(heap) > 0):
         print(heap.get_max())
\ No newline at end of file
@@ -0,0 +1,114 @@
+"""
+    Hash-based implementation of Set ADT.
+"""
+
+from __future__ import annotations
+from typing import Iterator
+from set import *
+from hash_table import HashableProbeTable
+
+
+class HSet(Set[T]):
+    """Implementation of the set ADT on a linear probe hash table.
+
+    Attributes:
+        * capacity (int): number of elements the table is first sized for
+        * table (HashableProbeTable[T]): hash table whose keys are the elements of the set
+
+    Membership, adding and removing take O(1) expected time, so union,
+    intersection and difference are O(n + m) instead of the O(n * m) of
+    ASet. The table rehashes into a larger one as elements are added,
+    so the set never becomes full.
+    """
+
+    MIN_CAPACITY = 1
+
+    def __init__(self, capacity: int = 1) -> None:
+        """ Initialization. """
+        self.capacity = max(self.MIN_CAPACITY, capacity)
+        Set.__init__(self)
+
+    def __len__(self) -> int:
+        """ Returns the number of elements in the set. """
+        return len(self.table)
+
+    def is_empty(self) -> bool:
+        """ True if the set is empty. """
+        return len(self) == 0
+
+    def clear(self) -> None:
+        """ Makes the set empty.
+        The table is sized so that capacity elements fit before the first
+        rehash, which happens once the table is half full.
+        :complexity: O(capacity)
+        """
+        self.table = HashableProbeTable(2 * self.capacity + 3)
+
+    def __contains__(self, item: T) -> bool:
+        """ True if the set contains the item.
+        :complexity: O(1) expected
+        """
+        return item in self.table
+
+    def __iter__(self) -> Iterator[T]:
+        """ Iterates over the elements of the set in no particular order.
+        :complexity: O(N) where N is the size of the table
+        """
+        return iter(self.table.keys())
+
+    def add(self, item: T) -> None:
+        """ Adds an element to the set. Note that an element already
+        present in the set is not added again.
+        :complexity: O(1) expected, amortised over rehashing
+        """
+        self.table[item] = True
+
+    def remove(self, item: T) -> None:
+        """ Removes an element from the set.
+        :pre: the element should be present in the set
+        :raises KeyError: if no such element is found.
+        """
+        del self.table[item]
+
+    def union(self, other: HSet[T]) -> HSet[T]:
+        """ Creates a new set equal to the union with another one,
+        i.e. the result set should contains the elements of self and other.
+        :complexity: O(n + m) expected
+        """
+        res = HSet(len(self) + len(other))
+        for the_set in [self, other]:
+            for item in the_set:
+                res.add(item)
+        return res
+
+    def intersection(self, other: HSet[T]) -> HSet[T]:
+        """ Creates a new set equal to the intersection with another one,
+        i.e. the result set should contain the elements that are both in
+        self *and* other. Only the smaller set is iterated over.
+        :complexity: O(min(n, m)) expected
+        """
+        smaller, larger = (self, other) if len(self) <= len(other) else (other, self)
+        res = HSet(len(smaller))
+        for item in smaller:
+            if item in larger:
+                res.add(item)
+        return res
+
+    def difference(self, other: HSet[T]) -> HSet[T]:
+        """ Creates a new set equal to the difference with another one,
+        i.e. the result set should contain the elements of self that
+        *are not* in other.
+        :complexity: O(n) expected
+        """
+        res = HSet(len(self))
+        for item in self:
+            if item not in other:
+                res.add(item)
+        return res
+
+    def __str__(self):
+        """ Magic method constructing a string representation of the set object. """
+        elems = []
+        for item in self:
+            elems.append(str(item) if type(item) != str else "'{0}'".format(item))
+        return '{' + ', '.join(elems) + '}'
@@ -13,6 +13,8 @@ class Node(Generic[T]):
             link (Node[T]): reference to the next node
     """
 
+    __slots__ = ('item', 'link')
+
     def __init__(self, item: T = None) -> None:
         """ Object initializer. """
         self.item = item
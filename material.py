@@ -136,13 +136,16 @@ class Material:
         return f"{self.name} {self.mining_rate}"
 
     @classmethod
-    def random_material(cls):
+    def random_material(cls, rng=RandomGen):
         """
         Randomizes a material and it's mining rate
 
+        Parameters:
+            rng - The random stream to draw from, RandomGen's default stream unless given
+
         Best and Worst Complexity: O(1) 
         """
-        return cls(RandomGen.random_choice(RANDOM_MATERIAL_NAMES),round(2 + 25 * RandomGen.random_float(), 2))
+        return cls(rng.random_choice(RANDOM_MATERIAL_NAMES),round(2 + 25 * rng.random_float(), 2))
 
 if __name__ == "__main__":
     print(Material.random_material())
@@ -11,7 +11,12 @@ __docformat__ = 'reStructuredText'
 
 
 class TreeNode(Generic[K, I]):
-    """ Node class represent BST nodes. """
+    """ Node class represent BST nodes.
+        Nodes use __slots__ rather than an instance dictionary, since
+        large trees are made almost entirely of nodes.
+    """
+
+    __slots__ = ('key', 'item', 'left', 'right')
 
     def __init__(self, key: K, item: I = None) -> None:
         """
@@ -37,6 +42,8 @@ class AVLTreeNode(TreeNode, Generic[K, I]):
     """ Node class for AVL trees.
     """
 
+    __slots__ = ('height',)
+
     def __init__(self, key: K, item: I = None) -> None:
         """
             Initialises the node with a key and optional item
@@ -46,3 +53,56 @@ class AVLTreeNode(TreeNode, Generic[K, I]):
 
         super(AVLTreeNode, self).__init__(key, item)
         self.height = 1
+
+
+class ParentAVLTreeNode(AVLTreeNode, Generic[K, I]):
+    """ Node class for AVL trees that also link every node to its parent.
+    """
+
+    __slots__ = ('parent',)
+
+    def __init__(self, key: K, item: I = None) -> None:
+        """
+            Initialises the node with a key and optional item
+            and sets the left, right and parent pointers to None
+            :complexity: O(1)
+        """
+
+        super(ParentAVLTreeNode, self).__init__(key, item)
+        self.parent = None
+
+
+class SkipListNode(Generic[K, I]):
+    """ Node class for skip lists. forward[i] is the next node on level i
+        and backward is the previous node on the bottom level.
+    """
+
+    __slots__ = ('key', 'item', 'forward', 'backward')
+
+    def __init__(self, key: K, item: I = None, level: int = 1) -> None:
+        """
+            Initialises the node with a key, optional item and level,
+            with all links set to None
+            :complexity: O(level)
+        """
+        self.key = key
+        self.item = item
+        self.forward = [None] * level
+        self.backward = None
+
+
+class TreapNode(TreeNode, Generic[K, I]):
+    """ Node class for treaps: a BST node with a heap-ordered priority.
+    """
+
+    __slots__ = ('priority',)
+
+    def __init__(self, key: K, item: I = None, priority: int = 0) -> None:
+        """
+            Initialises the node with a key, optional item and priority
+            and sets the left and right pointers to None
+            :complexity: O(1)
+        """
+
+        super(TreapNode, self).__init__(key, item)
+        self.priority = priority
@@ -0,0 +1,404 @@
+""" AVL Tree with parent links and cursors.
+
+Every node also refers to its parent, which lets a cursor step to the
+next or previous key by walking the tree locally instead of restarting
+from the root with an explicit stack.
+"""
+
+from __future__ import annotations
+
+__docformat__ = 'reStructuredText'
+
+from avl import AVLTree
+from typing import TypeVar, Generic
+from node import ParentAVLTreeNode
+
+K = TypeVar('K')
+I = TypeVar('I')
+
+
+class AVLCursor(Generic[K, I]):
+    """ A position in a ParentAVLTree that can move forward and backward.
+
+        The cursor remembers the key it is positioned at. If the tree is
+        modified and that key is removed, the next move re-locates the
+        cursor from the remembered key, so iteration can be resumed after
+        any mutation.
+    """
+
+    def __init__(self, tree: ParentAVLTree[K, I], node: ParentAVLTreeNode) -> None:
+        """
+        Positions the cursor at node. A node of None means past the end.
+
+        Complexity: O(1)
+        """
+        self.tree = tree
+        self.node = node
+        self.key = None if node is None else node.key
+
+    def is_valid(self) -> bool:
+        """
+        Checks whether the cursor is positioned at a key of the tree.
+
+        Complexity: O(1)
+        """
+        return self.node is not None
+
+    def is_stale(self) -> bool:
+        """
+        Checks whether the node under the cursor was removed or given a
+        different key by a mutation of the tree.
+
+        Complexity: O(1)
+        """
+        return self.node.height == 0 or self.node.key != self.key
+
+    def get_key(self) -> K:
+        """
+        Returns the key the cursor is positioned at.
+
+        Complexity: O(1)
+        :raises IndexError: if the cursor is past the end of the tree
+        """
+        if self.node is None:
+            raise IndexError('Cursor is past the end of the tree')
+        return self.key
+
+    def get_item(self) -> I:
+        """
+        Returns the item stored at the cursor's key.
+
+        :complexity best: O(1) when the cursor's node is still in the tree
+        :complexity worst: O(CompK * D) when the key has to be looked up again
+        :raises IndexError: if the cursor is past the end of the tree
+        :raises KeyError: if the cursor's key has been deleted
+        """
+        if self.node is None:
+            raise IndexError('Cursor is past the end of the tree')
+        if self.is_stale():
+            return self.tree[self.key]
+        return self.node.item
+
+    def next(self) -> bool:
+        """
+        Moves the cursor to the next larger key.
+        Returns whether the cursor is still positioned at a key.
+
+        :complexity best: O(1) amortised over a full scan of the tree
+        :complexity worst: O(CompK * D) when the cursor's key was removed
+        where D is the depth of the tree
+        :raises IndexError: if the cursor is past the end of the tree
+        """
+        if self.node is None:
+            raise IndexError('Cursor is past the end of the tree')
+        if self.is_stale():
+            self.move_to(self.tree.ceiling_node(self.key, strict=True))
+        else:
+            self.move_to(self.tree.next_node(self.node))
+        return self.is_valid()
+
+    def prev(self) -> bool:
+        """
+        Moves the cursor to the next smaller key.
+        Returns whether the cursor is still positioned at a key.
+
+        :complexity best: O(1) amortised over a full scan of the tree
+        :complexity worst: O(CompK * D) when the cursor's key was removed
+        where D is the depth of the tree
+        :raises IndexError: if the cursor is past the end of the tree
+        """
+        if self.node is None:
+            raise IndexError('Cursor is past the end of the tree')
+        if self.is_stale():
+            self.move_to(self.tree.floor_node(self.key, strict=True))
+        else:
+            self.move_to(self.tree.prev_node(self.node))
+        return self.is_valid()
+
+    def move_to(self, node: ParentAVLTreeNode) -> None:
+        """
+        Positions the cursor at node, remembering its key.
+
+        Complexity: O(1)
+        """
+        self.node = node
+        if node is not None:
+            self.key = node.key
+
+
+class ParentAVLTree(AVLTree, Generic[K, I]):
+    """ AVL tree whose nodes keep a link to their parent.
+
+        Parent links are kept correct through insertion, deletion and both
+        rotations. Nodes removed from the tree get a height of 0, which is
+        never the height of a node in the tree, so cursors can tell they
+        need to re-locate themselves.
+    """
+
+    def create_node(self, key: K, item: I) -> ParentAVLTreeNode:
+        """
+        Creates a new parent-linked node for the tree.
+
+        Complexity: O(1)
+        """
+        return ParentAVLTreeNode(key, item)
+
+    def adopt(self, current: ParentAVLTreeNode) -> ParentAVLTreeNode:
+        """
+        Points the parent links of current's children back at current.
+        Returns current so it can wrap the result of a recursive call.
+
+        Complexity: O(1)
+        """
+        if current is not None:
+            if current.left is not None:
+                current.left.parent = current
+            if current.right is not None:
+                current.right.parent = current
+        return current
+
+    def set_root(self, root: ParentAVLTreeNode) -> None:
+        """
+        Sets the root of the tree and clears its parent link.
+
+        Complexity: O(1)
+        """
+        self.root = root
+        if root is not None:
+            root.parent = None
+
+    def update_height(self, current: ParentAVLTreeNode) -> None:
+        """
+        Recomputes the height of current and points its children back at it.
+        Used by join and split, which relink children before updating heights.
+
+        Complexity: O(1)
+        """
+        AVLTree.update_height(self, current)
+        self.adopt(current)
+
+    @classmethod
+    def join(cls, left: ParentAVLTree[K, I], key: K, right: ParentAVLTree[K, I], item: I = None) -> ParentAVLTree[K, I]:
+        """
+        Joins left, key and right into a new tree with a detached root.
+
+        Complexity: see AVLTree.join
+        """
+        tree = super().join(left, key, right, item)
+        tree.set_root(tree.root)
+        return tree
+
+    def split(self, key: K) -> tuple[ParentAVLTree[K, I], ParentAVLTree[K, I]]:
+        """
+        Splits the tree around key, detaching the roots of both parts.
+
+        Complexity: see AVLTree.split
+        """
+        left, right = AVLTree.split(self, key)
+        left.set_root(left.root)
+        right.set_root(right.root)
+        return left, right
+
+    def union(self, other: AVLTree[K, I]) -> None:
+        """
+        Merges every key of other into this tree and detaches the new root.
+
+        Complexity: see AVLTree.union
+        """
+        AVLTree.union(self, other)
+        self.set_root(self.root)
+
+    def __setitem__(self, key: K, item: I) -> None:
+        """
+        Sets the item at a key in terms of root
+
+        Complexity: see insert_aux(self, current: ParentAVLTreeNode, key: K, item: I) -> ParentAVLTreeNode
+        """
+        AVLTree.__setitem__(self, key, item)
+        self.set_root(self.root)
+
+    def insert_aux(self, current: ParentAVLTreeNode, key: K, item: I) -> ParentAVLTreeNode:
+        """
+        Inserts the item into the sub-tree of current and fixes the parent
+        links of the children of the returned sub-tree root.
+
+        Complexity: see AVLTree.insert_aux
+        """
+        return self.adopt(AVLTree.insert_aux(self, current, key, item))
+
+    def __delitem__(self, key: K) -> None:
+        """
+        Deletes the item at a certain key in relation to the root
+
+        Complexity: see delete_aux(self, current: ParentAVLTreeNode, key: K) -> ParentAVLTreeNode
+        """
+        AVLTree.__delitem__(self, key)
+        self.set_root(self.root)
+
+    def delete_aux(self, current: ParentAVLTreeNode, key: K) -> ParentAVLTreeNode:
+        """
+        Deletes the key from the sub-tree of current and fixes the parent
+        links of the children of the returned sub-tree root. The node that
+        is actually unlinked is marked as removed.
+
+        Complexity: see AVLTree.delete_aux
+        """
+        # a node with at most one child is unlinked rather than overwritten by its successor
+        unlinked = current is not None and key == current.key and \
+            (current.left is None or current.right is None)
+        new_root = AVLTree.delete_aux(self, current, key)
+        if unlinked:
+            current.height = 0
+        return self.adopt(new_root)
+
+    def pop_max(self) -> ParentAVLTreeNode:
+        """
+        Removes and returns the node having the largest key in the tree.
+
+        Complexity: see AVLTree.pop_max
+        """
+        popped = AVLTree.pop_max(self)
+        self.set_root(self.root)
+        popped.height = 0
+        return popped
+
+    def pop_max_aux(self, current: ParentAVLTreeNode) -> tuple[ParentAVLTreeNode, ParentAVLTreeNode]:
+        """
+        Removes the node having the largest key in the sub-tree of current
+        and fixes the parent links of the children of the new sub-tree root.
+
+        Complexity: see AVLTree.pop_max_aux
+        """
+        new_root, popped = AVLTree.pop_max_aux(self, current)
+        return self.adopt(new_root), popped
+
+    def pop_min(self) -> ParentAVLTreeNode:
+        """
+        Removes and returns the node having the smallest key in the tree.
+
+        Complexity: see AVLTree.pop_min
+        """
+        popped = AVLTree.pop_min(self)
+        self.set_root(self.root)
+        popped.height = 0
+        return popped
+
+    def pop_min_aux(self, current: ParentAVLTreeNode) -> tuple[ParentAVLTreeNode, ParentAVLTreeNode]:
+        """
+        Removes the node having the smallest key in the sub-tree of current
+        and fixes the parent links of the children of the new sub-tree root.
+
+        Complexity: see AVLTree.pop_min_aux
+        """
+        new_root, popped = AVLTree.pop_min_aux(self, current)
+        return self.adopt(new_root), popped
+
+    def left_rotate(self, current: ParentAVLTreeNode) -> ParentAVLTreeNode:
+        """
+        Performs a left rotation and fixes the parent links of current and
+        of both its children, since current may have had a child replaced
+        just before rotating. The new root's own parent is fixed by the caller.
+
+        Complexity: O(1)
+        """
+        new_root = AVLTree.left_rotate(self, current)
+        self.adopt(current)
+        current.parent = new_root
+        return new_root
+
+    def right_rotate(self, current: ParentAVLTreeNode) -> ParentAVLTreeNode:
+        """
+        Performs a right rotation and fixes the parent links of current and
+        of both its children, since current may have had a child replaced
+        just before rotating. The new root's own parent is fixed by the caller.
+
+        Complexity: O(1)
+        """
+        new_root = AVLTree.right_rotate(self, current)
+        self.adopt(current)
+        current.parent = new_root
+        return new_root
+
+    def next_node(self, current: ParentAVLTreeNode) -> ParentAVLTreeNode:
+        """
+        Returns the node with the next larger key, or None if current is the maximum.
+
+        :complexity best: O(1) amortised over a full in-order walk
+        :complexity worst: O(D) where D is the depth of the tree
+        """
+        if current.right is not None:
+            return self.get_minimal(current.right)
+        while current.parent is not None and current is current.parent.right:
+            current = current.parent
+        return current.parent
+
+    def prev_node(self, current: ParentAVLTreeNode) -> ParentAVLTreeNode:
+        """
+        Returns the node with the next smaller key, or None if current is the minimum.
+
+        :complexity best: O(1) amortised over a full in-order walk
+        :complexity worst: O(D) where D is the depth of the tree
+        """
+        if current.left is not None:
+            return self.get_maximal(current.left)
+        while current.parent is not None and current is current.parent.left:
+            current = current.parent
+        return current.parent
+
+    def ceiling_node(self, key: K, strict: bool = False) -> ParentAVLTreeNode:
+        """
+        Returns the node with the smallest key greater than or equal to key
+        (strictly greater if strict is set), or None if there is none.
+
+        :complexity: O(CompK * D) where D is the depth of the tree
+        """
+        found = None
+        current = self.root
+        while current is not None:
+            if key < current.key or (not strict and key == current.key):
+                found = current
+                current = current.left
+            else:
+                current = current.right
+        return found
+
+    def floor_node(self, key: K, strict: bool = False) -> ParentAVLTreeNode:
+        """
+        Returns the node with the largest key smaller than or equal to key
+        (strictly smaller if strict is set), or None if there is none.
+
+        :complexity: O(CompK * D) where D is the depth of the tree
+        """
+        found = None
+        current = self.root
+        while current is not None:
+            if key > current.key or (not strict and key == current.key):
+                found = current
+                current = current.right
+            else:
+                current = current.left
+        return found
+
+    def cursor(self, key: K = None) -> AVLCursor[K, I]:
+        """
+        Returns a cursor at the smallest key greater than or equal to key,
+        or at the smallest key of the tree if no key is given.
+
+        :complexity best: O(1) when no key is given
+        :complexity worst: O(CompK * D) where D is the depth of the tree
+        """
+        if key is None:
+            return AVLCursor(self, self.min_node)
+        return AVLCursor(self, self.ceiling_node(key))
+
+    def reverse_cursor(self, key: K = None) -> AVLCursor[K, I]:
+        """
+        Returns a cursor at the largest key smaller than or equal to key,
+        or at the largest key of the tree if no key is given.
+
+        :complexity best: O(1) when no key is given
+        :complexity worst: O(CompK * D) where D is the depth of the tree
+        """
+        if key is None:
+            return AVLCursor(self, self.max_node)
+        return AVLCursor(self, self.floor_node(key))
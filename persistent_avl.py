@@ -0,0 +1,206 @@
+""" Persistent AVL Tree built on the rotations of the standard AVL tree.
+
+Nodes are never modified once they belong to a version of the tree.
+Every update copies the nodes on the path from the root to the change
+(path copying), so the new version shares all other nodes with the old
+ones and a snapshot costs O(log N) memory per change instead of O(N).
+"""
+
+from __future__ import annotations
+
+__docformat__ = 'reStructuredText'
+
+from avl import AVLTree
+from typing import TypeVar, Generic
+from node import AVLTreeNode
+
+K = TypeVar('K')
+I = TypeVar('I')
+
+
+class PersistentAVLTree(AVLTree, Generic[K, I]):
+    """ AVL tree whose versions share structure.
+
+        insert and delete return a new version and leave this one as it
+        was. The usual item assignment, deletion and pops update this
+        version in place, but still copy paths, so earlier snapshots are
+        never affected. join, split and union copy the nodes they relink
+        as well, and keep the versions they are given, so the batch update
+        inherited from AVLTree works too.
+    """
+
+    def snapshot(self) -> PersistentAVLTree[K, I]:
+        """
+        Returns a version of the tree that later updates to this one will
+        not affect.
+
+        Complexity: O(1)
+        """
+        version = type(self)()
+        version.root = self.root
+        version.length = self.length
+        version.min_node = self.min_node
+        version.max_node = self.max_node
+        return version
+
+    def insert(self, key: K, item: I) -> PersistentAVLTree[K, I]:
+        """
+        Returns a new version with item inserted at key.
+
+        Complexity: O(CompK * D) time and O(D) new nodes, where D is the depth of the tree
+        :raises ValueError: if the key is already in the tree
+        """
+        version = self.snapshot()
+        version[key] = item
+        return version
+
+    def delete(self, key: K) -> PersistentAVLTree[K, I]:
+        """
+        Returns a new version without key.
+
+        Complexity: O(CompK * D) time and O(D) new nodes, where D is the depth of the tree
+        :raises ValueError: if the key is not in the tree
+        """
+        version = self.snapshot()
+        del version[key]
+        return version
+
+    def copy_node(self, current: AVLTreeNode) -> AVLTreeNode:
+        """
+        Returns a copy of current that can be modified without affecting
+        the versions sharing current.
+
+        Complexity: O(1)
+        """
+        node = self.create_node(current.key, current.item)
+        node.left = current.left
+        node.right = current.right
+        node.height = current.height
+        return node
+
+    def insert_aux(self, current: AVLTreeNode, key: K, item: I) -> AVLTreeNode:
+        """
+        Inserts into a copy of current, so the original node is left intact.
+
+        Complexity: see AVLTree.insert_aux
+        """
+        if current is not None:
+            current = self.copy_node(current)
+        return AVLTree.insert_aux(self, current, key, item)
+
+    def delete_aux(self, current: AVLTreeNode, key: K) -> AVLTreeNode:
+        """
+        Deletes from a copy of current, so the original node is left intact.
+
+        Complexity: see AVLTree.delete_aux
+        """
+        if current is not None:
+            current = self.copy_node(current)
+        return AVLTree.delete_aux(self, current, key)
+
+    def pop_max_aux(self, current: AVLTreeNode) -> tuple[AVLTreeNode, AVLTreeNode]:
+        """
+        Removes the maximum from a copy of current.
+
+        Complexity: see AVLTree.pop_max_aux
+        """
+        return AVLTree.pop_max_aux(self, self.copy_node(current))
+
+    def pop_min_aux(self, current: AVLTreeNode) -> tuple[AVLTreeNode, AVLTreeNode]:
+        """
+        Removes the minimum from a copy of current.
+
+        Complexity: see AVLTree.pop_min_aux
+        """
+        return AVLTree.pop_min_aux(self, self.copy_node(current))
+
+    def left_rotate(self, current: AVLTreeNode) -> AVLTreeNode:
+        """
+        Performs a left rotation on copies of the two nodes it changes.
+        After a deletion the rotated child can be a node shared with other
+        versions, since rebalancing happens on the side opposite the path.
+
+        Complexity: O(1)
+        """
+        current = self.copy_node(current)
+        current.right = self.copy_node(current.right)
+        return AVLTree.left_rotate(self, current)
+
+    def right_rotate(self, current: AVLTreeNode) -> AVLTreeNode:
+        """
+        Performs a right rotation on copies of the two nodes it changes.
+
+        Complexity: O(1)
+        """
+        current = self.copy_node(current)
+        current.left = self.copy_node(current.left)
+        return AVLTree.right_rotate(self, current)
+
+    @classmethod
+    def join(cls, left: PersistentAVLTree[K, I], key: K, right: PersistentAVLTree[K, I],
+             item: I = None) -> PersistentAVLTree[K, I]:
+        """
+        Returns a new version holding every key of left, then key, then
+        every key of right. Unlike AVLTree.join, left and right are kept:
+        the join works on snapshots of them and copies the nodes it relinks.
+
+        Complexity: see AVLTree.join
+        :raises ValueError: if the keys are not in order
+        """
+        return AVLTree.join.__func__(cls, left.snapshot(), key, right.snapshot(), item)
+
+    def join_right(self, left: AVLTreeNode, middle: AVLTreeNode, right: AVLTreeNode) -> AVLTreeNode:
+        """
+        Joins down the right spine of a copy of left.
+
+        Complexity: see AVLTree.join_right
+        """
+        return AVLTree.join_right(self, self.copy_node(left), middle, right)
+
+    def join_left(self, left: AVLTreeNode, middle: AVLTreeNode, right: AVLTreeNode) -> AVLTreeNode:
+        """
+        Joins down the left spine of a copy of right.
+
+        Complexity: see AVLTree.join_left
+        """
+        return AVLTree.join_left(self, left, middle, self.copy_node(right))
+
+    def split(self, key: K) -> tuple[PersistentAVLTree[K, I], PersistentAVLTree[K, I]]:
+        """
+        Returns new versions holding the keys smaller than key and the keys
+        greater than or equal to key. Unlike AVLTree.split, this version is kept.
+
+        Complexity: see AVLTree.split
+        """
+        return AVLTree.split(self.snapshot(), key)
+
+    def split_aux(self, current: AVLTreeNode, key: K) -> tuple[AVLTreeNode, AVLTreeNode, AVLTreeNode]:
+        """
+        Splits the sub-tree of a copy of current, so the nodes on the
+        search path are relinked as copies.
+
+        Complexity: see AVLTree.split_aux
+        """
+        if current is not None:
+            current = self.copy_node(current)
+        return AVLTree.split_aux(self, current, key)
+
+    def union(self, other: PersistentAVLTree[K, I]) -> None:
+        """
+        Merges every key of other into this version, in place like item
+        assignment. Unlike AVLTree.union, other is kept.
+
+        Complexity: see AVLTree.union
+        """
+        AVLTree.union(self, other.snapshot())
+
+    def union_aux(self, current: AVLTreeNode, other: AVLTreeNode) -> AVLTreeNode:
+        """
+        Merges using a copy of the root of other, which is relinked as the
+        middle of the join.
+
+        Complexity: see AVLTree.union_aux
+        """
+        if current is not None and other is not None:
+            other = self.copy_node(other)
+        return AVLTree.union_aux(self, current, other)
@@ -7,6 +7,7 @@ generated in the game.
 
 from __future__ import annotations
 from avl import AVLTree
+from bucket_queue import BucketQueue
 
 from cave import Cave
 from hash_table import LinearProbeTable
@@ -205,41 +206,51 @@ class Player():
                 # if the trader's buy price exists in the key list, regenerate the deal
                 traders_list[number].generate_deal()
 
-    def set_foods(self, foods_list: list[Food]) -> None:
+    def set_foods(self, foods_list: list[Food], rng=RandomGen) -> None:
         """
-            Sets specific food list for players into an AVL
+            Sets specific food list for players into a bucket queue keyed by hunger bars
 
-            :complexity: O(N) where N is the length of the foods_list
+            Parameters:
+                - rng: the random stream duplicate foods are regenerated from, RandomGen's
+                  default stream unless given
+
+            :complexity: O(N + H) where N is the length of the foods_list
+            and H is the range of their hunger bars (at most 500 for random foods)
         """
-        # we chose to use an AVLTree for convenience of finding the food with the highest hunger bars level
-        self.foods = AVLTree()
+        # hunger bars are small integers, so a bucket queue finds the food with the highest
+        # hunger bars level without comparing keys
+        hunger_bars = [food.get_hunger_bars() for food in foods_list]
+        self.foods = BucketQueue(min(hunger_bars, default=0), max(hunger_bars, default=0))
         self.foods_key_list = [] # used for convenience of accessing values in the tree
         number = 0
         while number < len(foods_list):
             if foods_list[number].get_hunger_bars() not in self.foods_key_list:
-                # if the food's hunger bars doesn't exist in the key list, add food into the tree
-                # we cannot have duplicate keys for AVL as it will cause an error
+                # if the food's hunger bars doesn't exist in the key list, add food into the queue
+                # so that every level of hunger bars is offered by one food only
                 self.foods.__setitem__(foods_list[number].get_hunger_bars(),foods_list[number])
                 self.foods_key_list.append(foods_list[number].get_hunger_bars())
                 number += 1
             else:
                 # if the food's hunger bars exists in the key list, randomize the food
-                foods_list[number].random_food()
+                foods_list[number] = Food.random_food(rng)
 
     @classmethod
-    def random_player(cls) -> Player:
+    def random_player(cls, rng=RandomGen) -> Player:
         """
             Randomly generates a Player object with name from the list of PLAYER_NAMES and
             balance from range MIN_EMERALDS to MAX_EMERALDS
 
+            Parameters:
+                - rng: the random stream to draw from, RandomGen's default stream unless given
+
             Returns:
                 - Player object by passing these values to Player class
 
             :complexity: O(1)
         """
         # randomizes the player name and balance for variety
-        name = RandomGen.random_choice(PLAYER_NAMES)
-        balance = RandomGen.randint(Player.MIN_EMERALDS, Player.MAX_EMERALDS)
+        name = rng.random_choice(PLAYER_NAMES)
+        balance = rng.randint(Player.MIN_EMERALDS, Player.MAX_EMERALDS)
 
         return cls(name, balance)
 
@@ -281,18 +292,18 @@ class Player():
             4. Then, mine all possible material quantity if the player has enough hunger bars.
             5. Steps 2-4 is repeated until the player runs out of hunger bars or there are no more materials that can be mined and sold.
 
-            :complexity: O(T + C + F * log F)
+            :complexity: O(T + C + F + H)
         """      
         # selecting the food to buy
-        # best complexity: O(F)
-        # worst complexity: O(F * log F)
-        # where F is the number of foods there are
+        # best complexity: O(1)
+        # worst complexity: O(F + H)
+        # where F is the number of foods there are and H is the range of their hunger bars
         food_selected = None
         self.original_hunger_bars = self.balance
         while food_selected == None: # loops until the player is able to buy a food
-            food_choice = (self.foods.get_maximal(self.foods.root)) # finds the food with the highest value of hunger bars
+            food_choice = self.foods.peek_max() # finds the food with the highest value of hunger bars
             if self.balance < food_choice.item.get_price(): # if the food is too expensive
-                self.foods.__delitem__(food_choice.key) # deletion of an AVLTreeNode is logN
+                self.foods.__delitem__(food_choice.key) # deletion from a bucket is O(1)
             else: # if the food is purchasable
                 self.balance -= food_choice.item.get_price() # pay the money for the food
                 self.hunger_bars = food_choice.item.get_hunger_bars() # eat the food
@@ -307,8 +318,7 @@ class Player():
         # Keeps looping until hunger bars are depleted
         while self.hunger_bars > 0 and self.traders_list.is_empty() == False: 
             # Gets the best price a trader is selling for
-            trader_best_price = self.traders_list.get_maximal(self.traders_list.root) # O(T)
-            self.traders_list.__delitem__(trader_best_price.key) # O(T)
+            trader_best_price = self.traders_list.pop_max() # O(log T)
             # Gets the material that the trader is selling
             item_to_buy = (trader_best_price.item).get_material_selected() # O(1)
             cave_values = self.caves_list.values() # list of cave objects O(1)
@@ -0,0 +1,159 @@
+"""
+    Queue ADT and a circular array implementation. Defines a generic
+    abstract queue with the usual methods.
+"""
+
+__docformat__ = 'reStructuredText'
+
+from abc import ABC, abstractmethod
+from typing import TypeVar, Generic
+from referential_array import ArrayR
+T = TypeVar('T')
+
+
+class Queue(ABC, Generic[T]):
+    """ Abstract Queue class. """
+    def __init__(self) -> None:
+        """ Object initializer. """
+        self.length = 0
+
+    @abstractmethod
+    def append(self, item: T) -> None:
+        """ Adds an element to the rear of the queue."""
+        pass
+
+    @abstractmethod
+    def serve(self) -> T:
+        """ Deletes and returns the element at the front of the queue."""
+        pass
+
+    def __len__(self) -> int:
+        """ Returns the number of elements in the queue."""
+        return self.length
+
+    def is_empty(self) -> bool:
+        """ Returns True iff the queue is empty. """
+        return len(self) == 0
+
+    @abstractmethod
+    def is_full(self) -> bool:
+        """ Returns True iff the queue is full and no element can be appended. """
+        pass
+
+    def clear(self):
+        """ Clears all elements from the queue. """
+        self.length = 0
+
+
+class ArrayQueue(Queue[T]):
+    """ Double-ended queue in a circular array that grows when needed.
+
+        The elements occupy length consecutive positions starting at front,
+        wrapping around the end of the array, so elements can be added and
+        removed at both ends in O(1) without shifting the others.
+
+        Attributes:
+            length (int): number of elements in the queue (inherited)
+            front (int): position of the first element
+            array (ArrayR[T]): circular array storing the elements
+    """
+
+    MIN_CAPACITY = 1
+
+    def __init__(self, max_capacity: int = MIN_CAPACITY) -> None:
+        """ Object initializer. max_capacity is only the initial size of the array.
+            :complexity: O(max_capacity)
+        """
+        Queue.__init__(self)
+        self.front = 0
+        self.array = ArrayR(max(self.MIN_CAPACITY, max_capacity))
+
+    def clear(self) -> None:
+        """ Resets the queue
+            :complexity: O(1)
+        """
+        Queue.clear(self)
+        self.front = 0
+
+    def is_full(self) -> bool:
+        """ Returns whether the queue is full. The array grows on demand, so never.
+            :complexity: O(1)
+        """
+        return False
+
+    def grow(self) -> None:
+        """ Moves the elements, in order, to the start of an array of twice the size.
+            :complexity: O(n)
+        """
+        new_array = ArrayR(2 * len(self.array))
+        for i in range(self.length):
+            new_array[i] = self.array[(self.front + i) % len(self.array)]
+        self.array = new_array
+        self.front = 0
+
+    def append(self, item: T) -> None:
+        """ Adds an element to the rear of the queue.
+            :complexity: O(1) amortised, O(n) when the array grows
+        """
+        if self.length == len(self.array):
+            self.grow()
+        self.array[(self.front + self.length) % len(self.array)] = item
+        self.length += 1
+
+    def append_left(self, item: T) -> None:
+        """ Adds an element to the front of the queue.
+            :complexity: O(1) amortised, O(n) when the array grows
+        """
+        if self.length == len(self.array):
+            self.grow()
+        self.front = (self.front - 1) % len(self.array)
+        self.array[self.front] = item
+        self.length += 1
+
+    def serve(self) -> T:
+        """ Deletes and returns the element at the front of the queue.
+            :pre: queue is not empty
+            :complexity: O(1)
+            :raises Exception: if the queue is empty
+        """
+        if self.is_empty():
+            raise Exception('Queue is empty')
+        item = self.array[self.front]
+        self.array[self.front] = None
+        self.front = (self.front + 1) % len(self.array)
+        self.length -= 1
+        return item
+
+    def serve_right(self) -> T:
+        """ Deletes and returns the element at the rear of the queue.
+            :pre: queue is not empty
+            :complexity: O(1)
+            :raises Exception: if the queue is empty
+        """
+        if self.is_empty():
+            raise Exception('Queue is empty')
+        self.length -= 1
+        rear = (self.front + self.length) % len(self.array)
+        item = self.array[rear]
+        self.array[rear] = None
+        return item
+
+    def peek(self) -> T:
+        """ Returns the element at the front, without serving it.
+            :pre: queue is not empty
+            :complexity: O(1)
+            :raises Exception: if the queue is empty
+        """
+        if self.is_empty():
+            raise Exception('Queue is empty')
+        return self.array[self.front]
+
+    def peek_right(self) -> T:
+        """ Returns the element at the rear, without serving it.
+            :pre: queue is not empty
+            :complexity: O(1)
+            :raises Exception: if the queue is empty
+        """
+        if self.is_empty():
+            raise Exception('Queue is empty')
+        return self.array[(self.front + self.length - 1) % len(self.array)]
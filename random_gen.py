@@ -4,68 +4,216 @@ Random number generator class. Uses LCG method with some reasonable initialisati
 __author__ = "Jackson Goerner"
 
 import time
+from array import array
 
-class RandomGen():
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+class RandomStream():
     """
-    Class used to generate (seeded) random numbers for interesting outcomes and repeatable tests.
-    
-    Uses LCG method. All methods are O(1) best/worst case time complexity unless stated otherwise.
-    
-    Usage:
+    An independent LCG stream, holding its own seed. Every stream has the same
+    methods, so two games can run side by side without perturbing each other:
     ```
-    RandomGen.set_seed(123)
-    RandomGen.random()           # Random number from 0 to 2^32-1
-    RandomGen.randint(1, 10)     # Random number from 1 to 10
-    RandomGen.random_chance(0.33) # True 33% of the time, False 67% of the time.
+    rng = RandomStream(123)
+    rng.randint(1, 10)           # Same number as RandomGen.randint(1, 10) after RandomGen.set_seed(123)
+    rng.jump(1000)               # Skips 1000 numbers in O(log 1000)
+    rng.split(4)                 # 4 non-overlapping substreams, e.g. one per worker process
     ```
+
+    `randoms`, `randints` and `random_floats` draw n numbers at once into a typed
+    array, giving exactly the numbers of n calls to `random`, `randint` and
+    `random_float`. They are vectorised with NumPy when it is installed.
+    All methods are O(1) best/worst case time complexity unless stated otherwise.
     """
-    
+
     MOD = pow(2, 48)
     A = 25214903917
     C = 11
-    
-    seed = time.time_ns()
-    
-    @classmethod
-    def set_seed(cls, seed=None):
+    INT64_MAX = pow(2, 63) - 1
+
+    def __init__(self, seed=None):
+        """Creates a stream, seeded like `set_seed`."""
+        self.set_seed(seed)
+
+    def set_seed(self, seed=None):
         """Seed all future calls to `random`."""
         seed = time.time_ns() if seed is None else seed
-        cls.seed = seed
+        self.seed = seed
     
-    @classmethod
-    def random(cls):
+    def random(self):
         """Returns a random integer from 0 to 2^32-1"""
-        cls.seed = (cls.A * cls.seed + cls.C) % cls.MOD
-        return cls.seed >> 16
+        self.seed = (self.A * self.seed + self.C) % self.MOD
+        return self.seed >> 16
 
-    @classmethod
-    def random_float(cls):
+    def jump(self, n):
+        """
+        Advances the stream by n steps, as if `random` had been called n times.
+        The step x -> A*x + C is affine, so n steps compose into a single affine
+        map A^n*x + C*(A^(n-1) + ... + 1), built by repeated squaring.
+        :complexity: O(log n)
+        """
+        jump_a, jump_c = 1, 0
+        step_a, step_c = self.A, self.C
+        while n > 0:
+            if n & 1:
+                jump_a, jump_c = jump_a * step_a % self.MOD, (jump_c * step_a + step_c) % self.MOD
+            step_a, step_c = step_a * step_a % self.MOD, (step_c * step_a + step_c) % self.MOD
+            n >>= 1
+        self.seed = (jump_a * self.seed + jump_c) % self.MOD
+
+    def split(self, k, length=None):
+        """
+        Returns k independent RandomStream objects. The ith one starts i*length steps
+        ahead of this stream, so the first `length` numbers of each never overlap.
+        length defaults to an equal share of the full 2^48 period. This stream
+        itself is not advanced, and shares its numbers with the first substream.
+        :complexity: O(k log MOD)
+        """
+        length = self.MOD // k if length is None else length
+        streams = []
+        for i in range(k):
+            stream = RandomStream(self.seed)
+            stream.jump(i * length)
+            streams.append(stream)
+        return streams
+
+    def next_values(self, n):
+        """
+        Advances the stream by n steps and returns the n values `random` would
+        have returned: a list, or a uint64 NumPy array when NumPy is installed.
+        Step i is the affine map of i + 1 steps applied to the current seed. The
+        maps are built by doubling: the maps of steps filled+1 to 2*filled are those
+        of steps 1 to filled composed with that of step filled. uint64 arithmetic
+        wraps modulo 2^64, which is a multiple of MOD, so masking it is exact.
+        :complexity: O(n)
+        """
+        mask = self.MOD - 1
+        if numpy is None or n == 0:
+            multiplier, increment, seed = self.A, self.C, self.seed
+            values = []
+            for _ in range(n):
+                seed = (multiplier * seed + increment) & mask
+                values.append(seed >> 16)
+            self.seed = seed
+            return values
+
+        mask = numpy.uint64(mask)
+        multipliers = numpy.empty(n, dtype=numpy.uint64)
+        increments = numpy.empty(n, dtype=numpy.uint64)
+        multipliers[0], increments[0] = self.A, self.C
+        filled = 1
+        while filled < n:
+            take = min(filled, n - filled)
+            step_a, step_c = multipliers[filled - 1], increments[filled - 1]
+            multipliers[filled:filled + take] = (multipliers[:take] * step_a) & mask
+            increments[filled:filled + take] = (increments[:take] * step_a + step_c) & mask
+            filled += take
+        seeds = (multipliers * numpy.uint64(self.seed % self.MOD) + increments) & mask
+        self.seed = int(seeds[-1])
+        return seeds >> numpy.uint64(16)
+
+    def randoms(self, n):
+        """
+        Returns an array('L') of the next n random integers from 0 to 2^32-1.
+        :complexity: O(n)
+        """
+        values = self.next_values(n)
+        if isinstance(values, list):
+            return array('L', values)
+        return array('L', values.astype('u{0}'.format(array('L').itemsize)).tobytes())
+
+    def randints(self, lo, hi, n):
+        """
+        Returns an array('q') of the next n random integers from `lo` to `hi` inclusive.
+        NumPy only takes the bounds and span when they fit in int64; otherwise the
+        scalar path is used, which raises OverflowError if a result does not fit 'q'.
+        :complexity: O(n)
+        """
+        span = hi - lo + 1
+        values = self.next_values(n)
+        if isinstance(values, list):
+            return array('q', [value % span + lo for value in values])
+        if span > self.INT64_MAX or lo < -self.INT64_MAX - 1 or hi > self.INT64_MAX:
+            return array('q', [value % span + lo for value in values.tolist()])
+        return array('q', ((values % numpy.uint64(span)).astype(numpy.int64) + lo).tobytes())
+
+    def random_floats(self, n):
+        """
+        Returns an array('d') of the next n random floating point numbers in the range 0 to 1.
+        :complexity: O(n)
+        """
+        values = self.next_values(n)
+        if isinstance(values, list):
+            return array('d', [value / (1 << 32) for value in values])
+        return array('d', (values / float(1 << 32)).tobytes())
+
+    def random_float(self):
         """Returns a random floating point integer in the range 0 to 1."""
-        return cls.random() / (1 << 32)
+        return self.random() / (1 << 32)
 
-    @classmethod
-    def randint(cls, lo, hi):
+    def randint(self, lo, hi):
         """Returns a random integer from `lo` to `hi` inclusive on both ends."""
-        return (cls.random() % (hi - lo + 1)) + lo
+        return (self.random() % (hi - lo + 1)) + lo
 
-    @classmethod
-    def random_chance(cls, ratio):
+    def random_chance(self, ratio):
         """Returns random()/2^32 < ratio"""
-        return cls.random_float() < ratio
+        return self.random_float() < ratio
 
-    @classmethod
-    def random_choice(cls, collection) -> None:
+    def random_choice(self, collection) -> None:
         """Returns a random choice from a collection that supports __getitem__ and __len__"""
-        return collection[cls.randint(0, len(collection)-1)]
+        return collection[self.randint(0, len(collection)-1)]
 
-    @classmethod
-    def random_shuffle(cls, collection) -> None:
+    def random_shuffle(self, collection) -> None:
         """
         Randomly shuffles a collection that supports __getitem__, __setitem__ and __len__
         :complexity: O(len(collection))
         """
-        positions = [(RandomGen.random(), i) for i in range(len(collection))]
+        positions = [(self.random(), i) for i in range(len(collection))]
         positions.sort() # I can use inbuilt list sorting here - YOU CANNOT ANYWHERE ELSE! >:D
         tmp = [collection[p[1]] for p in positions]
         for x in range(len(collection)):
             collection[x] = tmp[x]
+
+
+default_stream = RandomStream()
+
+
+class RandomGen():
+    """
+    Class used to generate (seeded) random numbers for interesting outcomes and repeatable tests.
+    
+    Uses LCG method. All methods are O(1) best/worst case time complexity unless stated otherwise.
+    
+    Usage:
+    ```
+    RandomGen.set_seed(123)
+    RandomGen.random()           # Random number from 0 to 2^32-1
+    RandomGen.randint(1, 10)     # Random number from 1 to 10
+    RandomGen.random_chance(0.33) # True 33% of the time, False 67% of the time.
+    ```
+
+    Calls on the class use the module's `default_stream`; its methods are bound
+    here directly, so they cost no more than calls on a stream. Use a
+    `RandomStream` for an independent stream.
+    """
+    
+    MOD = RandomStream.MOD
+    A = RandomStream.A
+    C = RandomStream.C
+
+    set_seed = default_stream.set_seed
+    random = default_stream.random
+    jump = default_stream.jump
+    split = default_stream.split
+    next_values = default_stream.next_values
+    randoms = default_stream.randoms
+    randints = default_stream.randints
+    random_floats = default_stream.random_floats
+    random_float = default_stream.random_float
+    randint = default_stream.randint
+    random_chance = default_stream.random_chance
+    random_choice = default_stream.random_choice
+    random_shuffle = default_stream.random_shuffle
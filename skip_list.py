@@ -0,0 +1,311 @@
+""" Skip list ordered map.
+
+Keys are kept in a sorted linked list with extra express lanes: a node
+of level L is linked into the lists of levels 0 to L - 1. Levels are
+drawn from RandomGen, so the shape of the list is reproducible from the
+seed. Updates only relink neighbours, with no rotations.
+"""
+
+from __future__ import annotations
+
+__docformat__ = 'reStructuredText'
+
+from typing import TypeVar, Generic, Iterator, List
+from node import SkipListNode, TreeNode
+from random_gen import RandomGen
+
+K = TypeVar('K')
+I = TypeVar('I')
+
+
+class SkipList(Generic[K, I]):
+    """ Ordered map with the interface of AVLTree, stored as a skip list.
+
+        Each extra level is taken with probability 1/4, so a search visits
+        O(log N) nodes in expectation. The bottom level is doubly linked,
+        which gives the maximum in O(1) and reverse iteration.
+
+        Methods that return nodes in AVLTree (get_minimal, get_maximal,
+        peek_min, peek_max, pop_min and pop_max) return a detached TreeNode
+        holding the key and item.
+    """
+
+    MAX_LEVEL = 16
+
+    def __init__(self, rng=RandomGen) -> None:
+        """
+            Initialises an empty skip list drawing its levels from rng,
+            RandomGen's default stream unless given.
+            :complexity: O(MAX_LEVEL)
+        """
+        self.rng = rng
+        self.head = SkipListNode(None, None, self.MAX_LEVEL)
+        self.tail = None
+        self.level = 1
+        self.length = 0
+
+    def __len__(self) -> int:
+        """
+            Returns the number of keys in the list.
+            :complexity: O(1)
+        """
+        return self.length
+
+    def is_empty(self) -> bool:
+        """
+            Checks to see if the list is empty
+            :complexity: O(1)
+        """
+        return self.length == 0
+
+    def random_level(self) -> int:
+        """
+            Draws the level of a new node from self.rng, taking two bits of
+            one random number per extra level (a 1/4 chance each).
+            :complexity: O(1)
+        """
+        level = 1
+        bits = self.rng.random()
+        while bits & 3 == 0 and level < self.MAX_LEVEL:
+            level += 1
+            bits >>= 2
+        return level
+
+    def find_predecessors(self, key: K) -> list[SkipListNode]:
+        """
+            Returns, for every level, the last node whose key is smaller than key.
+            :complexity: O(CompK * log N) expected
+        """
+        update = [self.head] * self.MAX_LEVEL
+        current = self.head
+        for level in range(self.level - 1, -1, -1):
+            following = current.forward[level]
+            while following is not None and following.key < key:
+                current = following
+                following = current.forward[level]
+            update[level] = current
+        return update
+
+    def find_node(self, key: K) -> SkipListNode:
+        """
+            Returns the node holding key, or None if there is none.
+            :complexity: O(CompK * log N) expected
+        """
+        current = self.head
+        for level in range(self.level - 1, -1, -1):
+            following = current.forward[level]
+            while following is not None and following.key < key:
+                current = following
+                following = current.forward[level]
+        current = current.forward[0]
+        if current is not None and current.key == key:
+            return current
+        return None
+
+    def __contains__(self, key: K) -> bool:
+        """
+            Checks to see if the key is in the list
+            :complexity: see find_node(self, key: K) -> SkipListNode
+        """
+        return self.find_node(key) is not None
+
+    def __getitem__(self, key: K) -> I:
+        """
+            Returns the item stored at key.
+            :complexity: see find_node(self, key: K) -> SkipListNode
+            :raises KeyError: if the key is not in the list
+        """
+        node = self.find_node(key)
+        if node is None:
+            raise KeyError('Key not found: {0}'.format(key))
+        return node.item
+
+    def __setitem__(self, key: K, item: I) -> None:
+        """
+            Inserts the item at key.
+            :complexity: O(CompK * log N) expected
+            :raises ValueError: if the key is already in the list
+        """
+        update = self.find_predecessors(key)
+        following = update[0].forward[0]
+        if following is not None and following.key == key:
+            raise ValueError('Inserting duplicate item')
+
+        level = self.random_level()
+        if level > self.level:
+            self.level = level
+        node = SkipListNode(key, item, level)
+        for i in range(level):
+            node.forward[i] = update[i].forward[i]
+            update[i].forward[i] = node
+
+        node.backward = None if update[0] is self.head else update[0]
+        if following is None:
+            self.tail = node
+        else:
+            following.backward = node
+        self.length += 1
+
+    def __delitem__(self, key: K) -> None:
+        """
+            Deletes the item at key.
+            :complexity: O(CompK * log N) expected
+            :raises ValueError: if the key is not in the list
+        """
+        update = self.find_predecessors(key)
+        node = update[0].forward[0]
+        if node is None or node.key != key:
+            raise ValueError('Deleting non-existent item')
+        self.unlink(node, update)
+
+    def unlink(self, node: SkipListNode, update: list[SkipListNode]) -> None:
+        """
+            Removes node given its predecessors on every level.
+            :complexity: O(level of node)
+        """
+        for i in range(len(node.forward)):
+            update[i].forward[i] = node.forward[i]
+
+        following = node.forward[0]
+        if following is None:
+            self.tail = node.backward
+        else:
+            following.backward = node.backward
+        while self.level > 1 and self.head.forward[self.level - 1] is None:
+            self.level -= 1
+        self.length -= 1
+
+    def get_minimal(self, current=None) -> TreeNode:
+        """
+            Returns a detached node holding the smallest key and its item.
+            current is accepted so that AVLTree call sites such as
+            get_minimal(get_root()) keep working, and is ignored.
+            :complexity: O(1)
+            :raises ValueError: if the list is empty
+        """
+        return self.peek_min()
+
+    def get_maximal(self, current=None) -> TreeNode:
+        """
+            Returns a detached node holding the largest key and its item.
+            current is accepted for AVLTree compatibility and ignored.
+            :complexity: O(1)
+            :raises ValueError: if the list is empty
+        """
+        return self.peek_max()
+
+    def get_root(self) -> None:
+        """
+            Present for AVLTree compatibility; a skip list has no root node.
+            :complexity: O(1)
+        """
+        return None
+
+    def peek_min(self) -> TreeNode:
+        """
+            Returns a detached node holding the smallest key and its item.
+            :complexity: O(1)
+            :raises ValueError: if the list is empty
+        """
+        if self.length == 0:
+            raise ValueError('Peeking into an empty list')
+        first = self.head.forward[0]
+        return TreeNode(first.key, first.item)
+
+    def peek_max(self) -> TreeNode:
+        """
+            Returns a detached node holding the largest key and its item.
+            :complexity: O(1)
+            :raises ValueError: if the list is empty
+        """
+        if self.length == 0:
+            raise ValueError('Peeking into an empty list')
+        return TreeNode(self.tail.key, self.tail.item)
+
+    def pop_min(self) -> TreeNode:
+        """
+            Removes the smallest key and returns a detached node holding it and its item.
+            The head is its predecessor on every level, so no search is needed.
+            :complexity: O(level of the first node), O(1) expected
+            :raises ValueError: if the list is empty
+        """
+        if self.length == 0:
+            raise ValueError('Popping from an empty list')
+        first = self.head.forward[0]
+        self.unlink(first, [self.head] * len(first.forward))
+        return TreeNode(first.key, first.item)
+
+    def pop_max(self) -> TreeNode:
+        """
+            Removes the largest key and returns a detached node holding it and its item.
+            :complexity: O(CompK * log N) expected, to find the predecessors of the tail
+            :raises ValueError: if the list is empty
+        """
+        if self.length == 0:
+            raise ValueError('Popping from an empty list')
+        last = self.tail
+        self.unlink(last, self.find_predecessors(last.key))
+        return TreeNode(last.key, last.item)
+
+    def __iter__(self) -> Iterator[K]:
+        """
+            Generates the keys in ascending order.
+            :complexity: O(N)
+        """
+        current = self.head.forward[0]
+        while current is not None:
+            yield current.key
+            current = current.forward[0]
+
+    def items(self) -> Iterator[tuple[K, I]]:
+        """
+            Generates the (key, item) pairs in ascending key order.
+            :complexity: O(N)
+        """
+        current = self.head.forward[0]
+        while current is not None:
+            yield current.key, current.item
+            current = current.forward[0]
+
+    def values(self) -> Iterator[I]:
+        """
+            Generates the items in ascending key order.
+            :complexity: O(N)
+        """
+        for _, item in self.items():
+            yield item
+
+    def reversed(self) -> Iterator[tuple[K, I]]:
+        """
+            Generates the (key, item) pairs in descending key order.
+            :complexity: O(N)
+        """
+        current = self.tail
+        while current is not None:
+            yield current.key, current.item
+            current = current.backward
+
+    def iter_from(self, key: K) -> Iterator[tuple[K, I]]:
+        """
+            Generates the (key, item) pairs in ascending key order, starting
+            at the smallest key greater than or equal to key.
+            :complexity: O(CompK * log N) expected to find the start, then O(1) per pair
+        """
+        current = self.find_predecessors(key)[0].forward[0]
+        while current is not None:
+            yield current.key, current.item
+            current = current.forward[0]
+
+    def range_between(self, i: int, j: int) -> List:
+        """
+            Returns a sorted list of all keys in the list between the ith and jth indices, inclusive.
+            :complexity: O(j)
+        """
+        ranged_list = []
+        if j < self.length:
+            for n, key in enumerate(self):
+                if n > j:
+                    break
+                if n >= i:
+                    ranged_list.append(key)
+        return ranged_list
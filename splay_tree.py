@@ -0,0 +1,236 @@
+""" Splay tree implemented on top of the standard BST.
+
+Every lookup, insertion and deletion moves the node it touches to the
+root with a top-down splay, so keys that were used recently are found
+near the root. There is no balance information in the nodes; the cost
+is O(log N) amortised per operation instead of in the worst case.
+"""
+
+from __future__ import annotations
+
+__docformat__ = 'reStructuredText'
+
+from bst import BinarySearchTree, TreeStatistics
+from typing import TypeVar, Generic
+from node import TreeNode
+
+K = TypeVar('K')
+I = TypeVar('I')
+
+
+class SplayTree(BinarySearchTree, Generic[K, I]):
+    """ Self-adjusting binary search tree. """
+
+    def enable_statistics(self) -> None:
+        """
+            Starts counting the operations on this tree from zero. Splaying
+            does not go through the recursive methods of BinarySearchTree, so
+            splay is replaced by counted_splay instead of wrapping them.
+            :complexity: O(1)
+        """
+        if self.statistics_enabled:
+            return
+        TreeStatistics.enable_statistics(self)
+        self.splay = self.counted_splay
+        self.counted_methods.append('splay')
+
+    def splay(self, key: K) -> None:
+        """
+            Brings the node holding key to the root, or the last node on the
+            search path if key is not in the tree. Nodes passed on the way down
+            are hung off a left and a right tree, which are joined under the
+            new root at the end (top-down splaying).
+
+            :complexity: O(CompK * D) where D is the depth of the tree, O(CompK * log N) amortised
+        """
+        current = self.root
+        if current is None:
+            return
+        header = TreeNode(None)
+        left_max = right_min = header
+        while True:
+            if key < current.key:
+                if current.left is None:
+                    break
+                if key < current.left.key:  # zig-zig: rotate right
+                    child = current.left
+                    current.left = child.right
+                    child.right = current
+                    current = child
+                    if current.left is None:
+                        break
+                right_min.left = current  # link current into the right tree
+                right_min = current
+                current = current.left
+            elif key > current.key:
+                if current.right is None:
+                    break
+                if key > current.right.key:  # zig-zig: rotate left
+                    child = current.right
+                    current.right = child.left
+                    child.left = current
+                    current = child
+                    if current.right is None:
+                        break
+                left_max.right = current  # link current into the left tree
+                left_max = current
+                current = current.right
+            else:
+                break
+        left_max.right = current.left
+        right_min.left = current.right
+        current.left = header.right
+        current.right = header.left
+        self.root = current
+
+    def counted_splay(self, key: K) -> None:
+        """
+            Same as splay, but also counts its work. Each splay is one
+            operation, each zig step counts as a rotation in its direction and
+            each zig-zig step as two. The counters are added up in locals and
+            stored once at the end.
+
+            Complexity: see splay(self, key: K) -> None
+        """
+        current = self.root
+        if current is None:
+            return
+        header = TreeNode(None)
+        left_max = right_min = header
+        visits, comparisons, left_rotations, right_rotations = 1, 0, 0, 0
+        while True:
+            comparisons += 1
+            if key < current.key:
+                if current.left is None:
+                    break
+                comparisons += 1
+                if key < current.left.key:  # zig-zig: rotate right
+                    child = current.left
+                    current.left = child.right
+                    child.right = current
+                    current = child
+                    visits += 1
+                    right_rotations += 1
+                    if current.left is None:
+                        break
+                right_min.left = current  # link current into the right tree
+                right_min = current
+                current = current.left
+                visits += 1
+                right_rotations += 1
+            else:
+                comparisons += 1
+                if key > current.key:
+                    if current.right is None:
+                        break
+                    comparisons += 1
+                    if key > current.right.key:  # zig-zig: rotate left
+                        child = current.right
+                        current.right = child.left
+                        child.left = current
+                        current = child
+                        visits += 1
+                        left_rotations += 1
+                        if current.right is None:
+                            break
+                    left_max.right = current  # link current into the left tree
+                    left_max = current
+                    current = current.right
+                    visits += 1
+                    left_rotations += 1
+                else:
+                    break
+        left_max.right = current.left
+        right_min.left = current.right
+        current.left = header.right
+        current.right = header.left
+        self.root = current
+
+        self.operation_count += 1
+        self.visit_total += visits
+        self.comparison_count += comparisons
+        self.depth_max = max(self.depth_max, visits)
+        self.left_rotation_count += left_rotations
+        self.right_rotation_count += right_rotations
+
+    def get_tree_node_by_key(self, key: K) -> TreeNode:
+        """
+            Returns the node holding key, which becomes the root.
+
+            Complexity: see splay(self, key: K) -> None
+            :raises KeyError: if the key is not in the tree
+        """
+        self.splay(key)
+        if self.root is None or self.root.key != key:
+            raise KeyError('Key not found: {0}'.format(key))
+        return self.root
+
+    def __setitem__(self, key: K, item: I) -> None:
+        """
+            Splays the search path for key and puts the new node at the root,
+            above the two halves of the old tree.
+
+            Complexity: see splay(self, key: K) -> None
+            :raises ValueError: if the key is already in the tree
+        """
+        node = self.create_node(key, item)
+        if self.root is not None:
+            self.splay(key)
+            if self.root.key == key:
+                raise ValueError('Inserting duplicate item')
+            if key < self.root.key:
+                node.left = self.root.left
+                node.right = self.root
+                self.root.left = None
+            else:
+                node.right = self.root.right
+                node.left = self.root
+                self.root.right = None
+        self.root = node
+        self.length += 1
+
+    def __delitem__(self, key: K) -> None:
+        """
+            Splays key to the root and removes it. The largest key of the left
+            half is then splayed to the top of that half, where it has no right
+            child and can take the right half.
+
+            Complexity: see splay(self, key: K) -> None
+            :raises ValueError: if the key is not in the tree
+        """
+        self.splay(key)
+        if self.root is None or self.root.key != key:
+            raise ValueError('Deleting non-existent item')
+        right = self.root.right
+        self.root = self.root.left
+        if self.root is None:
+            self.root = right
+        else:
+            self.splay(key)
+            self.root.right = right
+        self.length -= 1
+
+    def get_minimal(self, current: TreeNode) -> TreeNode:
+        """
+            Returns the node with the smallest key in the sub-tree of current.
+            Asked for the whole tree, the node is also splayed to the root,
+            which makes deleting it afterwards O(1).
+
+            :complexity: O(D) where D is the depth of the tree
+        """
+        minimal = super().get_minimal(current)
+        if current is self.root:
+            self.splay(minimal.key)
+        return minimal
+
+    def get_maximal(self, current: TreeNode) -> TreeNode:
+        """
+            Returns the node with the largest key in the sub-tree of current.
+            Asked for the whole tree, the node is also splayed to the root.
+
+            :complexity: O(D) where D is the depth of the tree
+        """
+        maximal = super().get_maximal(current)
+        if current is self.root:
+            self.splay(maximal.key)
+        return maximal
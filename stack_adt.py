@@ -8,6 +8,7 @@ __docformat__ = 'reStructuredText'
 
 from abc import ABC, abstractmethod
 from typing import TypeVar, Generic
+from referential_array import ArrayR
 T = TypeVar('T')
 
 
@@ -47,4 +48,64 @@ class Stack(ABC, Generic[T]):
 
     def clear(self):
         """ Clears all elements from the stack. """
-        self.length = 0
\ No newline at end of file
+        self.length = 0
+
+
+class ArrayStack(Stack[T]):
+    """ Implementation of a stack with an array that grows when needed.
+
+        Attributes:
+            length (int): number of elements in the stack (inherited)
+            array (ArrayR[T]): array storing the elements, the top one at index length - 1
+    """
+
+    MIN_CAPACITY = 1
+
+    def __init__(self, max_capacity: int = MIN_CAPACITY) -> None:
+        """ Object initializer. max_capacity is only the initial size of the array.
+            :complexity: O(max_capacity)
+        """
+        Stack.__init__(self)
+        self.array = ArrayR(max(self.MIN_CAPACITY, max_capacity))
+
+    def is_full(self) -> bool:
+        """ Returns whether the stack is full. The array grows on demand, so never.
+            :complexity: O(1)
+        """
+        return False
+
+    def push(self, item: T) -> None:
+        """ Pushes an element to the top of the stack, doubling the array
+            first if it has no free position left.
+            :complexity: O(1) amortised, O(n) when the array grows
+        """
+        if self.length == len(self.array):
+            new_array = ArrayR(2 * len(self.array))
+            for i in range(self.length):
+                new_array[i] = self.array[i]
+            self.array = new_array
+        self.array[self.length] = item
+        self.length += 1
+
+    def pop(self) -> T:
+        """ Pops the element at the top of the stack.
+            :pre: stack is not empty
+            :complexity: O(1)
+            :raises Exception: if the stack is empty
+        """
+        if self.length == 0:
+            raise Exception('Stack is empty')
+        self.length -= 1
+        item = self.array[self.length]
+        self.array[self.length] = None  # do not keep the popped item alive
+        return item
+
+    def peek(self) -> T:
+        """ Returns the element at the top, without popping it from stack.
+            :pre: stack is not empty
+            :complexity: O(1)
+            :raises Exception: if the stack is empty
+        """
+        if self.length == 0:
+            raise Exception('Stack is empty')
+        return self.array[self.length - 1]
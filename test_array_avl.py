@@ -0,0 +1,241 @@
+from array_avl import ArrayAVLTree
+import math
+import random
+import unittest
+
+
+class TestArrayAVL(unittest.TestCase):
+    """ Testing the struct-of-arrays AVL tree against a plain dictionary. """
+
+    def check_tree(self, tree: ArrayAVLTree, current: int) -> int:
+        """ Checks ordering, stored heights and balance, returning the height. """
+        if current == tree.NIL:
+            return 0
+        left, right = tree.left_array[current], tree.right_array[current]
+        if left != tree.NIL:
+            self.assertLess(tree.get_key(left), tree.get_key(current))
+        if right != tree.NIL:
+            self.assertGreater(tree.get_key(right), tree.get_key(current))
+        left_height, right_height = self.check_tree(tree, left), self.check_tree(tree, right)
+        self.assertIn(right_height - left_height, (-1, 0, 1))
+        self.assertEqual(tree.get_height(current), 1 + max(left_height, right_height))
+        return tree.get_height(current)
+
+    def testRandomOperations(self):
+        for attempt in range(10):
+            with self.subTest(attempt):
+                tree = ArrayAVLTree()
+                expected = {}
+                for _ in range(500):
+                    key = random.randint(0, 200)
+                    choice = random.random()
+                    if key not in expected and choice < 0.6:
+                        tree[key] = str(key)
+                        expected[key] = str(key)
+                    elif key in expected and choice < 0.8:
+                        del tree[key]
+                        del expected[key]
+                    elif expected and choice < 0.9:
+                        node = tree.pop_max()
+                        self.assertEqual((node.key, node.item), max(expected.items()))
+                        del expected[node.key]
+                    elif expected:
+                        node = tree.pop_min()
+                        self.assertEqual((node.key, node.item), min(expected.items()))
+                        del expected[node.key]
+
+                self.check_tree(tree, tree.get_root())
+                self.assertEqual(len(tree), len(expected))
+                self.assertEqual(list(tree.items()), sorted(expected.items()))
+                self.assertEqual(list(tree.reversed()), sorted(expected.items(), reverse=True))
+                self.assertEqual(list(tree.iter_from(100)), [pair for pair in sorted(expected.items()) if pair[0] >= 100])
+                for key in range(0, 200):
+                    self.assertEqual(key in tree, key in expected)
+
+    def testHeight(self):
+        numbers = list(range(1000))
+        random.shuffle(numbers)
+        tree = ArrayAVLTree()
+        for num in numbers:
+            tree[num] = num
+        self.assertLess(tree.get_height(tree.get_root()), 1.440420 * math.log2(len(numbers) + 2) - 0.3277)
+        self.assertEqual(tree.range_between(1, 5), [1, 2, 3, 4, 5])
+
+    def testSlotsAreReused(self):
+        tree = ArrayAVLTree(4)
+        for key in range(100):
+            tree[key] = key
+        slots = len(tree.key_array)
+        for key in range(0, 100, 2):
+            del tree[key]
+        for key in range(100, 150):
+            tree[key] = key
+        self.assertEqual(len(tree.key_array), slots, 'Deleted slots were not reused')
+        self.assertEqual(list(tree), list(range(1, 100, 2)) + list(range(100, 150)))
+
+    def testErrors(self):
+        tree = ArrayAVLTree()
+        tree[1] = 1
+        self.assertRaises(ValueError, tree.__setitem__, 1, 2)
+        self.assertRaises(ValueError, tree.__delitem__, 2)
+        self.assertRaises(KeyError, tree.__getitem__, 2)
+        tree.pop_max()
+        self.assertTrue(tree.is_empty())
+        self.assertRaises(ValueError, tree.pop_min)
+        self.assertRaises(ValueError, tree.peek_max)
+
+
+    def testHandleInterface(self):
+        tree = ArrayAVLTree()
+        for key in (5, 2, 8):
+            tree[key] = str(key)
+        handle = tree.get_minimal(tree.get_root())
+        self.assertIsInstance(handle, int)
+        self.assertEqual((tree.get_key(handle), tree.get_item(handle)), (2, '2'))
+        self.assertEqual(tree.get_key(tree.get_maximal(tree.get_root())), 8)
+
+    def build(self, keys) -> ArrayAVLTree:
+        tree = ArrayAVLTree()
+        for key in keys:
+            tree[key] = key
+        return tree
+
+    def check_pairs(self, tree: ArrayAVLTree, expected: list) -> None:
+        self.check_tree(tree, tree.get_root())
+        self.assertEqual(list(tree.items()), expected)
+        self.assertEqual(len(tree), len(expected))
+        if expected:
+            self.assertEqual(tree.peek_min().key, expected[0][0])
+            self.assertEqual(tree.peek_max().key, expected[-1][0])
+
+    def testPeekMinMax(self):
+        numbers = list(range(1, 200))
+        for attempt in range(10):
+            with self.subTest(attempt):
+                random.shuffle(numbers)
+                tree = ArrayAVLTree()
+                present = []
+                for num in numbers:
+                    tree[num] = num
+                    present.append(num)
+                    self.assertEqual(tree.peek_max().key, max(present))
+
+                random.shuffle(present)
+                while len(present) > 1:
+                    choice = random.random()
+                    if choice < 0.2:
+                        present.remove(tree.pop_max().key)
+                    elif choice < 0.4:
+                        present.remove(tree.pop_min().key)
+                    else:
+                        del tree[present.pop()]
+                    self.assertEqual((tree.peek_min().key, tree.peek_max().key), (min(present), max(present)))
+                    self.assertEqual(tree.min_handle, tree.get_minimal(tree.get_root()))
+                    self.assertEqual(tree.max_handle, tree.get_maximal(tree.get_root()))
+
+                del tree[present.pop()]
+                self.assertRaises(ValueError, tree.peek_min)
+
+    def testJoin(self):
+        for left_size, right_size in [(0, 0), (0, 10), (10, 0), (1, 100), (100, 1), (37, 41)]:
+            with self.subTest((left_size, right_size)):
+                left = self.build(random.sample(range(left_size), left_size))
+                right = self.build(random.sample(range(left_size + 1, left_size + 1 + right_size), right_size))
+                tree = ArrayAVLTree.join(left, left_size, right, 'middle')
+                expected = [(key, key) for key in range(left_size + right_size + 1)]
+                expected[left_size] = (left_size, 'middle')
+                self.check_pairs(tree, expected)
+                self.assertTrue(left.is_empty() and right.is_empty())
+
+        self.assertRaises(ValueError, ArrayAVLTree.join, self.build([1, 5]), 3, self.build([7]))
+
+    def testSplit(self):
+        numbers = list(range(0, 200, 2))
+        for key in [-1, 0, 1, 50, 51, 150, 198, 199, 500]:
+            with self.subTest(key):
+                random.shuffle(numbers)
+                tree = self.build(numbers)
+                left, right = tree.split(key)
+                self.check_pairs(left, [(num, num) for num in sorted(numbers) if num < key])
+                self.check_pairs(right, [(num, num) for num in sorted(numbers) if num >= key])
+                self.assertTrue(tree.is_empty())
+                # the part that kept the arrays reuses the slots of the part copied out
+                left[1000], right[1000] = 'new', 'new'
+                self.assertEqual(left[1000], right[1000])
+
+    def testUnion(self):
+        for attempt in range(10):
+            with self.subTest(attempt):
+                first = random.sample(range(300), random.randint(0, 150))
+                second = random.sample(range(300), random.randint(0, 150))
+                tree = self.build(first)
+                other = ArrayAVLTree()
+                for key in second:
+                    other[key] = -key
+                tree.union(other)
+
+                merged = {key: key for key in first}
+                merged.update({key: -key for key in second})
+                self.check_pairs(tree, sorted(merged.items()))
+                self.assertTrue(other.is_empty())
+
+    def testGetMany(self):
+        numbers = list(range(0, 400, 2))
+        random.shuffle(numbers)
+        tree = self.build(numbers)
+        for attempt in range(10):
+            with self.subTest(attempt):
+                keys = sorted(random.choices(numbers, k=random.randint(0, 50)))
+                self.assertEqual(tree.get_many(keys), [tree[key] for key in keys])
+        with self.assertRaises(KeyError):
+            tree.get_many([0, 2, 3, 4])
+
+    def testUpdate(self):
+        for attempt in range(10):
+            with self.subTest(attempt):
+                first = random.sample(range(300), random.randint(0, 150))
+                tree = self.build(first)
+                pairs = [(random.randint(0, 300), attempt) for _ in range(random.randint(0, 150))]
+                random.shuffle(pairs)
+                pairs.append((150, 'last'))
+                tree.update(pairs)
+
+                expected = {key: key for key in first}
+                expected.update(pairs)
+                self.check_pairs(tree, sorted(expected.items()))
+
+    def testStatistics(self):
+        tree = self.build(range(100))
+        self.assertEqual(tree.statistics(), (0, 0, 0, 0, 0, 0))
+        self.assertNotIn('insert_aux', vars(tree))
+
+        tree.enable_statistics()
+        tree[100] = 100  # ascending insertions only ever rotate left
+        comparisons, visits, operations, depth, left, right = tree.statistics()
+        self.assertEqual(operations, 1)
+        self.assertEqual(comparisons, 2 * visits)  # every node is passed on the right
+        self.assertEqual(depth, visits)
+        self.assertLessEqual(depth, tree.get_height(tree.get_root()))
+        self.assertGreaterEqual(left, 1)
+        self.assertEqual(right, 0)
+
+        root = tree.get_root()
+        tree.reset_statistics()
+        self.assertEqual(tree[tree.get_key(tree.left_array[root])], tree.get_key(tree.left_array[root]))
+        self.assertEqual(tree.statistics(), (3, 2, 1, 2, 0, 0))  # == and < at the root, == below
+
+        tree.reset_statistics()
+        self.assertEqual(tree[tree.get_key(root)], tree.get_key(root))
+        self.assertEqual(tree.statistics(), (1, 1, 1, 1, 0, 0))
+        tree.pop_max()
+        self.assertEqual(tree.statistics()[:3], (1, 1 + tree.get_height(tree.get_root()), 2))
+
+        tree.disable_statistics()
+        tree[-1] = -1
+        self.assertEqual(tree.statistics()[2], 2)
+        self.assertNotIn('insert_aux', vars(tree))
+        self.assertNotIn('find', vars(tree))
+
+
+if __name__ == '__main__':
+    unittest.main()
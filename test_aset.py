@@ -33,6 +33,32 @@ class TestASet(TestSet):
             s.add(capacity)
 
 
+class TestSortedASet(TestSet):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.SetType = SortedASet
+
+    def test_sorted(self):
+        s = self.SetType(2)
+        for i in [5, 3, 9, 1, 3, 7]:
+            s.add(i)
+        self.assertEqual(str(s), '{1, 3, 5, 7, 9}')
+        s.remove(5)
+        self.assertEqual(str(s), '{1, 3, 7, 9}')
+        self.assertEqual(str(self.s1.union(self.s2)), '{3, 5, 6, 7, 8, 9, 10, 15, 16, 17}')
+        self.assertEqual(str(self.s1.intersection(self.s2)), '{5, 10, 15}')
+        self.assertEqual(str(self.s1.difference(self.s2)), '{3, 6, 7, 16}')
+
+    def test_grows(self):
+        s = self.SetType(1)
+        for i in range(100, 0, -1):
+            s.add(i)
+        self.assertEqual(len(s), 100)
+        with self.assertRaises(KeyError):
+            s.remove(0)
+
+
 if __name__ == '__main__':
     testtorun = TestASet()
     suite = unittest.TestLoader().loadTestsFromModule(testtorun)
@@ -140,6 +140,188 @@ class TestAVL(unittest.TestCase):
         self.assertEqual(tree.range_between(1, 5), [2, 3, 4, 5, 6], "Range between failed")
 
 
+    def test_pop_max_min(self):
+        numbers = list(range(1, 200))
+        for attempt in range(10):
+            with self.subTest(attempt):
+                random.shuffle(numbers)
+
+                tree = AVLTree()
+                length = random.randint(10, 199)
+                for num in numbers[:length]:
+                    tree[num] = num
+                expected = sorted(numbers[:length])
+
+                while len(tree) > 0:
+                    if random.random() < 0.5:
+                        node = tree.pop_max()
+                        self.assertEqual((node.key, node.item), (expected[-1], expected[-1]))
+                        expected.pop()
+                    else:
+                        node = tree.pop_min()
+                        self.assertEqual((node.key, node.item), (expected[0], expected[0]))
+                        expected.pop(0)
+                    self.height = {}
+                    self.check_invariant(tree.root)
+                    self.check_heights(tree.root)
+                    self.assertEqual([key for key in tree], expected)
+
+                self.assertTrue(tree.is_empty())
+                self.assertRaises(ValueError, tree.pop_max)
+                self.assertRaises(ValueError, tree.pop_min)
+
+    def test_peek_min_max(self):
+        numbers = list(range(1, 200))
+        for attempt in range(10):
+            with self.subTest(attempt):
+                random.shuffle(numbers)
+
+                tree = AVLTree()
+                present = []
+                for num in numbers:
+                    tree[num] = num
+                    present.append(num)
+                    self.assertEqual(tree.peek_min().key, min(present))
+                    self.assertEqual(tree.peek_max().key, max(present))
+
+                random.shuffle(present)
+                while len(present) > 1:
+                    choice = random.random()
+                    if choice < 0.2:
+                        present.remove(tree.pop_max().key)
+                    elif choice < 0.4:
+                        present.remove(tree.pop_min().key)
+                    else:
+                        del tree[present.pop()]
+                    self.assertEqual(tree.peek_min().key, min(present))
+                    self.assertEqual(tree.peek_max().key, max(present))
+                    self.assertIs(tree.peek_min(), tree.get_minimal(tree.root))
+                    self.assertIs(tree.peek_max(), tree.get_maximal(tree.root))
+
+                del tree[present.pop()]
+                self.assertRaises(ValueError, tree.peek_min)
+                self.assertRaises(ValueError, tree.peek_max)
+
+    def build(self, keys) -> AVLTree:
+        tree = AVLTree()
+        for key in keys:
+            tree[key] = key
+        return tree
+
+    def check_tree(self, tree: AVLTree, expected: list) -> None:
+        self.height = {}
+        self.check_invariant(tree.root)
+        self.check_heights(tree.root)
+        self.assertEqual(list(tree.items()), expected)
+        self.assertEqual(len(tree), len(expected))
+        if expected:
+            self.assertEqual(tree.peek_min().key, expected[0][0])
+            self.assertEqual(tree.peek_max().key, expected[-1][0])
+
+    def test_join(self):
+        for left_size, right_size in [(0, 0), (0, 10), (10, 0), (1, 100), (100, 1), (37, 41)]:
+            with self.subTest((left_size, right_size)):
+                left = self.build(random.sample(range(left_size), left_size))
+                right = self.build(random.sample(range(left_size + 1, left_size + 1 + right_size), right_size))
+                tree = AVLTree.join(left, left_size, right, 'middle')
+                expected = [(key, key) for key in range(left_size + right_size + 1)]
+                expected[left_size] = (left_size, 'middle')
+                self.check_tree(tree, expected)
+                self.assertTrue(left.is_empty() and right.is_empty())
+
+        self.assertRaises(ValueError, AVLTree.join, self.build([1, 5]), 3, self.build([7]))
+
+    def test_split(self):
+        numbers = list(range(0, 200, 2))
+        for key in [-1, 0, 1, 50, 51, 198, 199, 500]:
+            with self.subTest(key):
+                random.shuffle(numbers)
+                tree = self.build(numbers)
+                left, right = tree.split(key)
+                self.check_tree(left, [(num, num) for num in sorted(numbers) if num < key])
+                self.check_tree(right, [(num, num) for num in sorted(numbers) if num >= key])
+                self.assertTrue(tree.is_empty())
+
+    def test_union(self):
+        for attempt in range(10):
+            with self.subTest(attempt):
+                first = random.sample(range(300), random.randint(0, 150))
+                second = random.sample(range(300), random.randint(0, 150))
+                tree = self.build(first)
+                other = AVLTree()
+                for key in second:
+                    other[key] = -key
+                tree.union(other)
+
+                merged = {key: key for key in first}
+                merged.update({key: -key for key in second})
+                self.check_tree(tree, sorted(merged.items()))
+                self.assertTrue(other.is_empty())
+
+    def test_get_many(self):
+        numbers = list(range(0, 400, 2))
+        random.shuffle(numbers)
+        tree = self.build(numbers)
+        for attempt in range(10):
+            with self.subTest(attempt):
+                keys = sorted(random.choices(numbers, k=random.randint(0, 50)))
+                self.assertEqual(tree.get_many(keys), [tree[key] for key in keys])
+        with self.assertRaises(KeyError):
+            tree.get_many([0, 2, 3, 4])
+
+    def test_update(self):
+        for attempt in range(10):
+            with self.subTest(attempt):
+                first = random.sample(range(300), random.randint(0, 150))
+                tree = self.build(first)
+                pairs = [(random.randint(0, 300), attempt) for _ in range(random.randint(0, 150))]
+                random.shuffle(pairs)
+                pairs.append((150, 'last'))
+                tree.update(pairs)
+
+                expected = {key: key for key in first}
+                expected.update(pairs)
+                self.check_tree(tree, sorted(expected.items()))
+
+    def test_statistics(self):
+        tree = AVLTree()
+        for key in range(100):
+            tree[key] = key
+        self.assertEqual(tree.statistics(), (0, 0, 0, 0, 0, 0))
+        self.assertNotIn('insert_aux', vars(tree))
+
+        tree.enable_statistics()
+        tree[100] = 100  # ascending insertions only ever rotate left
+        comparisons, visits, operations, depth, left, right = tree.statistics()
+        self.assertEqual(operations, 1)
+        self.assertEqual(comparisons, 2 * visits)  # every node is passed on the right
+        self.assertEqual(depth, visits)
+        self.assertLessEqual(depth, tree.root.height)
+        self.assertGreaterEqual(left, 1)
+        self.assertEqual(right, 0)
+
+        tree.reset_statistics()
+        self.assertEqual(tree[tree.root.left.key], tree.root.left.key)
+        self.assertEqual(tree.statistics(), (3, 2, 1, 2, 0, 0))  # == and < at the root, == below
+
+        tree.reset_statistics()
+        self.assertEqual(tree[tree.root.key], tree.root.key)
+        self.assertEqual(tree.statistics(), (1, 1, 1, 1, 0, 0))
+        tree.pop_max()
+        self.assertEqual(tree.statistics()[:3], (1, 1 + tree.root.height, 2))
+
+        tree.disable_statistics()
+        tree[-1] = -1
+        self.assertEqual(tree.statistics()[2], 2)
+        self.assertNotIn('insert_aux', vars(tree))
+
+    def check_heights(self, current: AVLTreeNode) -> None:
+        if current is not None:
+            self.assertEqual(current.height, self.get_height(current), 'Stored height is wrong for key {0}'.format(current.key))
+            self.check_balance(current)
+            self.check_heights(current.left)
+            self.check_heights(current.right)
+
 if __name__ == '__main__':
     # seeding the pseudo-random generator
     random.seed(16)
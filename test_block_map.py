@@ -0,0 +1,71 @@
+from block_map import SortedBlockMap
+import random
+import unittest
+
+
+class TestSortedBlockMap(unittest.TestCase):
+    """ Testing the sorted-block map against a plain dictionary. """
+
+    def setUp(self):
+        random.seed(16)
+        self.reset_map()
+
+    def reset_map(self):
+        # small blocks so that splits and merges happen often
+        self.map = SortedBlockMap()
+        self.map.LOAD = 4
+
+    def check_blocks(self, block_map: SortedBlockMap) -> None:
+        for keys, items, largest in zip(block_map.key_blocks, block_map.item_blocks, block_map.maxes):
+            self.assertEqual(len(keys), len(items))
+            self.assertEqual(keys[-1], largest)
+            self.assertLessEqual(len(keys), 2 * block_map.LOAD)
+
+    def testRandomOperations(self):
+        for attempt in range(10):
+            with self.subTest(attempt):
+                self.reset_map()
+                expected = {}
+                for _ in range(600):
+                    key = random.randint(0, 300)
+                    choice = random.random()
+                    if key not in expected and choice < 0.6:
+                        self.map[key] = str(key)
+                        expected[key] = str(key)
+                    elif key in expected and choice < 0.8:
+                        del self.map[key]
+                        del expected[key]
+                    elif expected and choice < 0.9:
+                        node = self.map.pop_max()
+                        self.assertEqual((node.key, node.item), max(expected.items()))
+                        del expected[node.key]
+                    elif expected:
+                        node = self.map.pop_min()
+                        self.assertEqual((node.key, node.item), min(expected.items()))
+                        del expected[node.key]
+                    self.check_blocks(self.map)
+
+                pairs = sorted(expected.items())
+                self.assertEqual(len(self.map), len(expected))
+                self.assertEqual(list(self.map.items()), pairs)
+                self.assertEqual(list(self.map.reversed()), pairs[::-1])
+                self.assertEqual(list(self.map.iter_from(150)), [pair for pair in pairs if pair[0] >= 150])
+                self.assertEqual(self.map.range_between(3, 20), [key for key, _ in pairs[3:21]] if len(pairs) > 20 else [])
+                for key in range(300):
+                    self.assertEqual(key in self.map, key in expected)
+                    if key in expected:
+                        self.assertEqual(self.map[key], expected[key])
+
+    def testAVLInterface(self):
+        for key in [5, 1, 9, 3]:
+            self.map[key] = key * 10
+        self.assertEqual(self.map.get_maximal(self.map.get_root()).item, 90)
+        self.assertEqual(self.map.get_minimal(self.map.get_root()).key, 1)
+        self.assertRaises(ValueError, self.map.__setitem__, 5, 0)
+        self.assertRaises(ValueError, self.map.__delitem__, 4)
+        self.assertRaises(KeyError, self.map.__getitem__, 4)
+        self.assertEqual(self.map.range_between(1, 5), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,36 @@
+"""
+    Unit test for BitSet, implemented via inheritance from TestSet.
+"""
+from test_set import *
+from bset import *
+
+
+class TestBitSet(TestSet):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.SetType = BitSet
+
+    def test_iteration(self):
+        self.assertEqual(list(self.s1), sorted(self.in_s1))
+        self.assertEqual(str(self.s2), '{5, 8, 9, 10, 15, 17}')
+        s = self.SetType(1)
+        s.add(1000)
+        s.add(0)
+        self.assertEqual(list(s), [0, 1000])
+        self.assertEqual(len(s), 2)
+
+    def test_invalid_items(self):
+        s = self.SetType(5)
+        with self.assertRaises(ValueError):
+            s.add(-1)
+        self.assertFalse(-1 in s)
+        self.assertFalse('a' in s)
+        with self.assertRaises(KeyError):
+            s.remove(3)
+
+
+if __name__ == '__main__':
+    testtorun = TestBitSet()
+    suite = unittest.TestLoader().loadTestsFromModule(testtorun)
+    unittest.TextTestRunner().run(suite)
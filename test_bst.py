@@ -115,5 +115,30 @@ class TestBST(unittest.TestCase):
 
             self.assertEqual(array, sorted_array, 'In-Order traversal produces a wrong order: {0}'.format(array))
 
+    def testItems(self):
+        numbers = list(range(1, 100))
+        for attempt in range(10):
+            random.shuffle(numbers)
+
+            tree = BinarySearchTree()
+            length = random.randint(10, 100)
+            for num in numbers[:length]:
+                tree[num] = str(num)
+
+            expected = sorted((num, str(num)) for num in numbers[:length])
+            self.assertEqual(list(tree.items()), expected, 'items() produces a wrong order')
+            self.assertEqual(list(tree.values()), [item for _, item in expected], 'values() produces a wrong order')
+            self.assertEqual(list(tree.reversed()), expected[::-1], 'reversed() produces a wrong order')
+
+    def testIterFrom(self):
+        tree = BinarySearchTree()
+        for num in [50, 20, 80, 10, 30, 70, 90, 60]:
+            tree[num] = num
+
+        self.assertEqual([key for key, _ in tree.iter_from(30)], [30, 50, 60, 70, 80, 90])
+        self.assertEqual([key for key, _ in tree.iter_from(31)], [50, 60, 70, 80, 90])
+        self.assertEqual([key for key, _ in tree.iter_from(0)], [10, 20, 30, 50, 60, 70, 80, 90])
+        self.assertEqual(list(tree.iter_from(91)), [])
+
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,60 @@
+from bucket_queue import BucketQueue
+import random
+import unittest
+
+
+class TestBucketQueue(unittest.TestCase):
+    """ Testing the bucket queue against sorting. """
+
+    def testPopMax(self):
+        for attempt in range(10):
+            with self.subTest(attempt):
+                queue = BucketQueue(1, 500)
+                expected = []
+                for _ in range(300):
+                    if expected and random.random() < 0.4:
+                        node = queue.pop_max()
+                        self.assertEqual(node.key, max(expected))
+                        expected.remove(node.key)
+                        self.assertEqual(node.item, 'food {0}'.format(node.key))
+                    else:
+                        key = random.randint(1, 500)
+                        queue[key] = 'food {0}'.format(key)
+                        expected.append(key)
+                    self.assertEqual(len(queue), len(expected))
+                drained = [queue.pop_max().key for _ in range(len(queue))]
+                self.assertEqual(drained, sorted(expected, reverse=True))
+                self.assertTrue(queue.is_empty())
+
+    def testKeys(self):
+        queue = BucketQueue(10, 20)
+        queue[12] = 'a'
+        queue[12] = 'b'
+        queue[15] = 'c'
+        self.assertIn(12, queue)
+        self.assertNotIn(13, queue)
+        self.assertNotIn(100, queue)
+        self.assertEqual(queue[12], 'b')
+        self.assertEqual((queue.peek_max().key, queue.peek_max().item), (15, 'c'))
+
+        del queue[15]
+        del queue[12]
+        self.assertEqual((queue.peek_max().key, queue.peek_max().item), (12, 'a'))
+        with self.assertRaises(ValueError):
+            del queue[15]
+        with self.assertRaises(KeyError):
+            queue[15]
+        with self.assertRaises(ValueError):
+            queue[21] = 'd'
+
+        queue.pop_max()
+        with self.assertRaises(ValueError):
+            queue.peek_max()
+        with self.assertRaises(ValueError):
+            queue.pop_max()
+        with self.assertRaises(ValueError):
+            BucketQueue(2, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,55 @@
+from dary_heap import DaryHeap
+import random
+import unittest
+
+
+class TestDaryHeap(unittest.TestCase):
+    """ Testing the d-ary heap for every arity and order. """
+
+    def drain(self, heap: DaryHeap) -> list:
+        return [heap.get_max() for _ in range(len(heap))]
+
+    def testOrders(self):
+        for d in [2, 3, 4, 8]:
+            with self.subTest(d):
+                numbers = [random.randint(0, 100) for _ in range(300)]
+                heap = DaryHeap(d)
+                heap.extend(numbers)
+                self.assertEqual(heap.peek(), max(numbers))
+                self.assertEqual(self.drain(heap), sorted(numbers, reverse=True))
+
+                heap = DaryHeap.heapify(numbers, d, comparator=lambda a, b: a < b)
+                self.assertEqual(self.drain(heap), sorted(numbers))
+
+                words = ['{0:03}'.format(number) for number in numbers]
+                heap = DaryHeap.heapify(words, d, key=int)
+                self.assertEqual(self.drain(heap), sorted(words, key=int, reverse=True))
+
+    def testMixedOperations(self):
+        for d in [2, 4, 8]:
+            with self.subTest(d):
+                heap = DaryHeap(d)
+                expected = []
+                for _ in range(1000):
+                    if expected and random.random() < 0.4:
+                        self.assertEqual(heap.get_max(), max(expected))
+                        expected.remove(max(expected))
+                    else:
+                        number = random.randint(0, 1000)
+                        heap.add(number)
+                        expected.append(number)
+                self.assertEqual(len(heap), len(expected))
+                self.assertEqual(self.drain(heap), sorted(expected, reverse=True))
+
+    def testErrors(self):
+        with self.assertRaises(ValueError):
+            DaryHeap(1)
+        heap = DaryHeap()
+        with self.assertRaises(IndexError):
+            heap.get_max()
+        with self.assertRaises(IndexError):
+            heap.peek()
+
+
+if __name__ == '__main__':
+    unittest.main()
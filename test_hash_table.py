@@ -2,7 +2,7 @@
 Tests basic functionality of the hash table methods, such as statistics.
 """
 
-from hash_table import LinearProbeTable
+from hash_table import LinearProbeTable, HashableProbeTable
 import unittest
 
 __author__ = "Jackson Goerner"
@@ -47,6 +47,32 @@ class TestHashTable(unittest.TestCase):
         self.assertGreaterEqual(probe_max, 3)    # Jon: 3  + Whatever rehash caused
         self.assertEqual(rehash, 1)              # 1 rehash
 
+    def test_delete(self):
+        table = LinearProbeTable(10, tablesize_override=FIX_TABLESIZE)
+        table.hash = silly_hash
+        names = "Eva, Amy, Tim, Ron, Jan, Kim, Dot, Ann, Jim, Jon".split(", ")
+        for name in names:
+            table[name] = name + "-value"
+        # Jan starts the cluster that Jim and Jon were probed along
+        for name in ["Jan", "Amy", "Eva"]:
+            del table[name]
+            names.remove(name)
+        self.assertEqual(len(table), len(names))
+        for name in names:
+            self.assertEqual(table[name], name + "-value")
+        self.assertRaises(KeyError, lambda: table["Jan"])
+        with self.assertRaises(KeyError):
+            del table["Jan"]
+
+    def test_hashable_rehash(self):
+        table = HashableProbeTable(7)
+        for key in range(60):
+            table[key] = key * 2
+        self.assertGreater(table.statistics()[3], 0)
+        self.assertEqual(sorted(table.keys()), list(range(60)))
+        for key in range(60):
+            self.assertEqual(table[key], key * 2)
+
 if __name__ == '__main__':
 
     # running all the tests
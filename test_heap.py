@@ -0,0 +1,150 @@
+from heap import MaxHeap, IndexedMaxHeap, TopK
+import random
+import unittest
+
+
+class TestMaxHeap(unittest.TestCase):
+    """ Testing growth and bulk construction of the max heap. """
+
+    def drain(self, heap: MaxHeap) -> list:
+        return [heap.get_max() for _ in range(len(heap))]
+
+    def testGrows(self):
+        heap = MaxHeap(2)
+        numbers = random.sample(range(1000), 100)
+        for number in numbers:
+            heap.add(number)
+        self.assertEqual(len(heap), 100)
+        self.assertEqual(self.drain(heap), sorted(numbers, reverse=True))
+        with self.assertRaises(IndexError):
+            heap.get_max()
+
+    def testHeapify(self):
+        for size in [0, 1, 2, 3, 10, 257]:
+            with self.subTest(size):
+                numbers = [random.randint(0, 50) for _ in range(size)]
+                heap = MaxHeap.heapify(iter(numbers))
+                self.assertEqual(len(heap), size)
+                self.assertEqual(self.drain(heap), sorted(numbers, reverse=True))
+
+    def testExtend(self):
+        for first, second in [(0, 10), (10, 0), (50, 5), (5, 50), (100, 100)]:
+            with self.subTest((first, second)):
+                numbers = [random.randint(0, 500) for _ in range(first + second)]
+                heap = MaxHeap.heapify(numbers[:first])
+                heap.extend(numbers[first:])
+                heap.add(-1)
+                self.assertEqual(self.drain(heap), sorted(numbers + [-1], reverse=True))
+
+
+    def testPushpopReplace(self):
+        numbers = random.sample(range(1000), 50)
+        heap = MaxHeap.heapify(numbers)
+        self.assertEqual(heap.peek(), max(numbers))
+        self.assertEqual(heap.pushpop(5000), 5000)
+        self.assertEqual(heap.pushpop(-1), max(numbers))
+        numbers.remove(max(numbers))
+        self.assertEqual(heap.replace(2000), max(numbers))
+        numbers.remove(max(numbers))
+        self.assertEqual(self.drain(heap), sorted(numbers + [-1, 2000], reverse=True))
+        with self.assertRaises(IndexError):
+            heap.replace(1)
+        with self.assertRaises(IndexError):
+            heap.peek()
+        self.assertEqual(heap.pushpop(1), 1)
+
+
+class TestTopK(unittest.TestCase):
+    """ Testing selection of the k largest elements. """
+
+    def testLargest(self):
+        for k in [0, 1, 5, 50, 200]:
+            with self.subTest(k):
+                numbers = random.sample(range(1000), 100)
+                selector = TopK(k, key=lambda number: -number)
+                for number in numbers:
+                    selector.add(number)
+                self.assertEqual(len(selector), min(k, 100))
+                if k:
+                    self.assertEqual(selector.peek(), sorted(numbers)[min(k, 100) - 1])
+                self.assertEqual(selector.largest(), sorted(numbers)[:k])
+                self.assertEqual(len(selector), 0)
+
+    def testKeyCalledOncePerElement(self):
+        calls = []
+
+        def key(number):
+            calls.append(number)
+            return number
+
+        numbers = random.sample(range(1000), 200)
+        selector = TopK(10, key=key)
+        for number in numbers:
+            selector.add(number)
+        self.assertEqual(selector.largest(), sorted(numbers, reverse=True)[:10])
+        self.assertEqual(len(calls), len(numbers))
+
+
+class TestIndexedMaxHeap(unittest.TestCase):
+    """ Testing priority changes and removals through handles. """
+
+    def check_heap(self, heap: IndexedMaxHeap) -> None:
+        for k in range(1, len(heap) + 1):
+            self.assertEqual(heap.the_array[k].index, k)
+            if k > 1:
+                self.assertLessEqual(heap.the_array[k].priority, heap.the_array[k // 2].priority)
+
+    def testRandomUpdates(self):
+        for attempt in range(10):
+            with self.subTest(attempt):
+                heap = IndexedMaxHeap()
+                handles = {}
+                for name in range(100):
+                    handles[name] = heap.add(random.randint(0, 1000))
+                for _ in range(300):
+                    name = random.choice(list(handles))
+                    handle = handles[name]
+                    choice = random.random()
+                    if choice < 0.3:
+                        heap.increase_key(handle, handle.priority + random.randint(0, 100))
+                    elif choice < 0.6:
+                        heap.decrease_key(handle, handle.priority - random.randint(0, 100))
+                    elif choice < 0.8:
+                        heap.update(handle, random.randint(-500, 1500))
+                    else:
+                        heap.remove(handle)
+                        self.assertNotIn(handle, heap)
+                        del handles[name]
+                    self.check_heap(heap)
+
+                priorities = sorted((handle.priority for handle in handles.values()), reverse=True)
+                drained = []
+                while len(heap) > 0:
+                    self.assertEqual(heap.peek(), heap.the_array[1].element)
+                    drained.append(heap.the_array[1].priority)
+                    heap.get_max()
+                self.assertEqual(drained, priorities)
+
+    def testKeyFunction(self):
+        profits = {'a': 5, 'b': 1, 'c': 3}
+        heap = IndexedMaxHeap(key=profits.get)
+        handles = {name: heap.add(name) for name in profits}
+        self.assertEqual(heap.peek(), 'a')
+
+        profits['b'] = 10
+        heap.increase_key(handles['b'])
+        self.assertEqual(heap.peek(), 'b')
+        profits['b'] = 0
+        with self.assertRaises(ValueError):
+            heap.increase_key(handles['b'])
+        heap.decrease_key(handles['b'])
+        self.assertEqual([heap.get_max() for _ in range(3)], ['a', 'c', 'b'])
+
+        with self.assertRaises(ValueError):
+            heap.remove(handles['a'])
+        with self.assertRaises(IndexError):
+            heap.get_max()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,35 @@
+"""
+    Unit test for HSet, implemented via inheritance from TestSet.
+"""
+from test_set import *
+from hset import *
+
+
+class TestHSet(TestSet):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.SetType = HSet
+
+    def test_grows(self):
+        s = self.SetType(2)
+        for i in range(200):
+            s.add(i)
+        self.assertEqual(len(s), 200)
+        for i in range(0, 200, 2):
+            s.remove(i)
+        self.assertEqual(sorted(s), list(range(1, 200, 2)))
+        for i in range(200):
+            self.assertEqual(i in s, i % 2 == 1)
+
+    def test_remove_exception(self):
+        s = self.SetType(5)
+        s.add('Gold')
+        with self.assertRaises(KeyError):
+            s.remove('Coal')
+
+
+if __name__ == '__main__':
+    testtorun = TestHSet()
+    suite = unittest.TestLoader().loadTestsFromModule(testtorun)
+    unittest.TextTestRunner().run(suite)
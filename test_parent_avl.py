@@ -0,0 +1,111 @@
+from parent_avl import ParentAVLTree
+from node import ParentAVLTreeNode
+import random
+import unittest
+
+
+class TestParentAVL(unittest.TestCase):
+    """ Testing parent links and cursors of the parent-linked AVL tree. """
+
+    def check_parents(self, current: ParentAVLTreeNode) -> None:
+        for child in (current.left, current.right):
+            if child is not None:
+                self.assertIs(child.parent, current, 'Wrong parent for key {0}'.format(child.key))
+                self.check_parents(child)
+
+    def random_tree(self, numbers: list) -> ParentAVLTree:
+        tree = ParentAVLTree()
+        for num in numbers:
+            tree[num] = str(num)
+        return tree
+
+    def testParentLinks(self):
+        numbers = list(range(1, 300))
+        for attempt in range(10):
+            with self.subTest(attempt):
+                random.shuffle(numbers)
+                tree = self.random_tree(numbers)
+                self.assertIsNone(tree.root.parent)
+                self.check_parents(tree.root)
+
+                present = list(numbers)
+                random.shuffle(present)
+                while len(present) > 0:
+                    choice = random.random()
+                    if choice < 0.2:
+                        present.remove(tree.pop_max().key)
+                    elif choice < 0.4:
+                        present.remove(tree.pop_min().key)
+                    else:
+                        del tree[present.pop()]
+                    if tree.root is not None:
+                        self.assertIsNone(tree.root.parent)
+                        self.check_parents(tree.root)
+
+    def testSplitUnionParentLinks(self):
+        numbers = list(range(300))
+        random.shuffle(numbers)
+        tree = self.random_tree(numbers)
+        left, right = tree.split(120)
+        for part in (left, right):
+            self.assertIsNone(part.root.parent)
+            self.check_parents(part.root)
+
+        left.union(right)
+        self.assertIsNone(left.root.parent)
+        self.check_parents(left.root)
+        cursor = left.cursor()
+        keys = [cursor.get_key()]
+        while cursor.next():
+            keys.append(cursor.get_key())
+        self.assertEqual(keys, list(range(300)))
+
+    def testCursorWalks(self):
+        numbers = list(range(1, 200))
+        random.shuffle(numbers)
+        tree = self.random_tree(numbers)
+
+        cursor = tree.cursor()
+        forward = [(cursor.get_key(), cursor.get_item())]
+        while cursor.next():
+            forward.append((cursor.get_key(), cursor.get_item()))
+        self.assertEqual(forward, list(tree.items()))
+        self.assertRaises(IndexError, cursor.next)
+
+        cursor = tree.reverse_cursor()
+        backward = [cursor.get_key()]
+        while cursor.prev():
+            backward.append(cursor.get_key())
+        self.assertEqual(backward, sorted(numbers, reverse=True))
+
+        self.assertEqual(tree.cursor(50).get_key(), 50)
+        self.assertEqual(tree.reverse_cursor(50.5).get_key(), 50)
+        self.assertFalse(tree.cursor(1000).is_valid())
+
+    def testCursorResumesAfterMutation(self):
+        tree = self.random_tree(range(0, 100, 2))
+        cursor = tree.cursor(40)
+
+        # removing the key under the cursor moves it on to the following key
+        del tree[40]
+        tree[41] = '41'
+        self.assertTrue(cursor.next())
+        self.assertEqual(cursor.get_key(), 41)
+
+        # removing keys elsewhere does not disturb the walk
+        for key in range(50, 100, 4):
+            del tree[key]
+        keys = [cursor.get_key()]
+        while cursor.next():
+            keys.append(cursor.get_key())
+        expected = [41] + [key for key in range(42, 100, 2) if key < 50 or (key - 50) % 4 != 0]
+        self.assertEqual(keys, expected)
+
+        cursor = tree.cursor(20)
+        del tree[20]
+        self.assertTrue(cursor.prev())
+        self.assertEqual(cursor.get_key(), 18)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,109 @@
+from persistent_avl import PersistentAVLTree
+import random
+import unittest
+
+
+class TestPersistentAVL(unittest.TestCase):
+    """ Testing that versions of the persistent AVL tree do not affect each other. """
+
+    def check_balanced(self, current) -> int:
+        if current is None:
+            return 0
+        left, right = self.check_balanced(current.left), self.check_balanced(current.right)
+        self.assertIn(right - left, (-1, 0, 1))
+        self.assertEqual(current.height, 1 + max(left, right))
+        return current.height
+
+    def testVersionsAreIndependent(self):
+        for attempt in range(5):
+            with self.subTest(attempt):
+                tree = PersistentAVLTree()
+                expected = {}
+                versions = [(tree, dict(expected))]
+                for _ in range(300):
+                    key = random.randint(0, 100)
+                    if key in expected:
+                        tree = tree.delete(key)
+                        del expected[key]
+                    else:
+                        tree = tree.insert(key, str(key))
+                        expected[key] = str(key)
+                    versions.append((tree, dict(expected)))
+
+                for version, contents in versions:
+                    self.check_balanced(version.root)
+                    self.assertEqual(list(version.items()), sorted(contents.items()))
+                    self.assertEqual(len(version), len(contents))
+                    if contents:
+                        self.assertEqual(version.peek_min().key, min(contents))
+                        self.assertEqual(version.peek_max().key, max(contents))
+
+    def testInPlaceUpdatesKeepSnapshots(self):
+        tree = PersistentAVLTree()
+        for key in range(50):
+            tree[key] = key
+        day_one = tree.snapshot()
+
+        for key in range(0, 50, 3):
+            del tree[key]
+        tree.pop_max()
+        tree.pop_min()
+        tree[100] = 100
+
+        self.assertEqual(list(day_one), list(range(50)))
+        self.assertEqual(list(tree), [key for key in range(2, 49) if key % 3 != 0] + [100])
+        self.check_balanced(day_one.root)
+        self.check_balanced(tree.root)
+
+    def testSharing(self):
+        tree = PersistentAVLTree()
+        for key in range(1000):
+            tree[key] = key
+        new_version = tree.insert(1000, 1000)
+
+        old_nodes = {id(node) for node in tree.iter_nodes(tree.root)}
+        new_nodes = [node for node in new_version.iter_nodes(new_version.root) if id(node) not in old_nodes]
+        self.assertLessEqual(len(new_nodes), 2 * new_version.root.height)
+
+
+    def testBatchOperationsKeepVersions(self):
+        for attempt in range(5):
+            with self.subTest(attempt):
+                first, second = PersistentAVLTree(), PersistentAVLTree()
+                first_keys = random.sample(range(200), 60)
+                second_keys = random.sample(range(100, 300), 60)
+                for key in first_keys:
+                    first[key] = 'first'
+                for key in second_keys:
+                    second[key] = 'second'
+                first_items, second_items = list(first.items()), list(second.items())
+
+                smaller, larger = first.split(100)
+                self.assertEqual(list(smaller), sorted(key for key in first_keys if key < 100))
+                self.assertEqual(list(larger), sorted(key for key in first_keys if key >= 100))
+
+                joined = PersistentAVLTree.join(smaller, 100.5, second.split(101)[1])
+                self.assertEqual(list(joined), list(smaller) + [100.5] + sorted(key for key in second_keys if key >= 101))
+
+                merged = first.snapshot()
+                merged.union(second)
+                expected = dict(first_items)
+                expected.update(second_items)
+                self.assertEqual(list(merged.items()), sorted(expected.items()))
+
+                updated = second.snapshot()
+                updated.update((key, 'update') for key in range(0, 300, 7))
+                expected = dict(second_items)
+                expected.update((key, 'update') for key in range(0, 300, 7))
+                self.assertEqual(list(updated.items()), sorted(expected.items()))
+
+                for version in (smaller, larger, joined, merged, updated):
+                    self.check_balanced(version.root)
+                    self.assertEqual(len(version), len(list(version)))
+                self.assertEqual(list(first.items()), first_items)
+                self.assertEqual(list(second.items()), second_items)
+                self.assertEqual(list(smaller), sorted(key for key in first_keys if key < 100))
+
+
+if __name__ == '__main__':
+    unittest.main()
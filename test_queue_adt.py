@@ -0,0 +1,52 @@
+from queue_adt import ArrayQueue
+from collections import deque
+import random
+import unittest
+
+
+class TestArrayQueue(unittest.TestCase):
+    """ Testing the circular array queue against collections.deque. """
+
+    def testAgainstDeque(self):
+        for attempt in range(10):
+            with self.subTest(attempt):
+                queue = ArrayQueue()
+                expected = deque()
+                for _ in range(500):
+                    operation = random.randrange(4)
+                    if expected and operation == 0:
+                        self.assertEqual(queue.peek(), expected[0])
+                        self.assertEqual(queue.serve(), expected.popleft())
+                    elif expected and operation == 1:
+                        self.assertEqual(queue.peek_right(), expected[-1])
+                        self.assertEqual(queue.serve_right(), expected.pop())
+                    elif operation == 2:
+                        item = random.randint(0, 1000)
+                        queue.append(item)
+                        expected.append(item)
+                    else:
+                        item = random.randint(0, 1000)
+                        queue.append_left(item)
+                        expected.appendleft(item)
+                    self.assertEqual(len(queue), len(expected))
+                drained = [queue.serve() for _ in range(len(queue))]
+                self.assertEqual(drained, list(expected))
+                self.assertTrue(queue.is_empty())
+
+    def testWrapAround(self):
+        queue = ArrayQueue(4)
+        for item in range(3):
+            queue.append(item)
+        queue.serve()
+        queue.serve()
+        for item in range(3, 6):
+            queue.append(item)
+        self.assertEqual(len(queue.array), 4)
+        self.assertEqual([queue.serve() for _ in range(4)], [2, 3, 4, 5])
+        self.assertRaises(Exception, queue.serve)
+        self.assertRaises(Exception, queue.serve_right)
+        self.assertRaises(Exception, queue.peek)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,116 @@
+from random_gen import RandomGen, RandomStream
+from game import MultiplayerGame
+import contextlib
+import io
+import random_gen
+import re
+import unittest
+from unittest import mock
+
+
+class TestRandomGen(unittest.TestCase):
+    """ Testing that RandomStream objects are independent streams matching the default one. """
+
+    def testInstanceMatchesDefaultStream(self):
+        RandomGen.set_seed(123)
+        expected = [RandomGen.random() for _ in range(20)] + [RandomGen.randint(1, 10) for _ in range(20)]
+        rng = RandomStream(123)
+        actual = [rng.random() for _ in range(20)] + [rng.randint(1, 10) for _ in range(20)]
+        self.assertEqual(actual, expected)
+
+    def testStreamsAreIndependent(self):
+        first, second = RandomStream(7), RandomStream(7)
+        drawn = []
+        for _ in range(10):
+            drawn.append(first.random())
+            RandomGen.random()
+            drawn.append(first.randint(1, 100))
+        expected = []
+        for _ in range(10):
+            expected.append(second.random())
+            expected.append(second.randint(1, 100))
+        self.assertEqual(drawn, expected)
+
+    def testJump(self):
+        rng = RandomStream(42)
+        sequence = [rng.random() for _ in range(1000)]
+        for n in (0, 1, 2, 7, 64, 500, 999):
+            with self.subTest(n):
+                jumped = RandomStream(42)
+                jumped.jump(n)
+                self.assertEqual(jumped.random(), sequence[n])
+        RandomGen.set_seed(42)
+        RandomGen.jump(10)
+        self.assertEqual(RandomGen.random(), sequence[10])
+
+        # the generator has full period, so a whole period comes back to the start
+        rng = RandomStream(42)
+        rng.jump(RandomGen.MOD)
+        self.assertEqual(rng.seed, 42)
+
+    def testSplit(self):
+        rng = RandomStream(16)
+        sequence = [rng.random() for _ in range(400)]
+        rng = RandomStream(16)
+        streams = rng.split(4, 100)
+        self.assertEqual(rng.seed, 16)
+        drawn = [[stream.random() for _ in range(100)] for stream in streams]
+        self.assertEqual([number for part in drawn for number in part], sequence)
+
+        seeds = [stream.seed for stream in RandomStream(16).split(8)]
+        self.assertEqual(len(set(seeds)), 8)
+
+    def testBatches(self):
+        backends = [('python', None)] + ([('numpy', random_gen.numpy)] if random_gen.numpy is not None else [])
+        for label, backend in backends:
+            for n in (0, 1, 2, 3, 100, 1025):
+                with self.subTest((label, n)), mock.patch('random_gen.numpy', backend):
+                    rng = RandomStream(16)
+                    expected = [rng.random() for _ in range(n)]
+                    expected += [rng.randint(-5, 20) for _ in range(n)]
+                    expected += [rng.random_float() for _ in range(n)]
+                    batched = RandomStream(16)
+                    actual = list(batched.randoms(n)) + list(batched.randints(-5, 20, n)) + list(batched.random_floats(n))
+                    self.assertEqual(actual, expected)
+                    self.assertEqual(batched.seed, rng.seed)
+
+    def testWideRandints(self):
+        backends = [('python', None)] + ([('numpy', random_gen.numpy)] if random_gen.numpy is not None else [])
+        bounds = [(0, 2 ** 63 - 1), (-2 ** 63, 2 ** 63 - 1), (-2 ** 63, 0), (2 ** 62, 2 ** 63 - 1)]
+        for label, backend in backends:
+            for lo, hi in bounds:
+                with self.subTest((label, lo, hi)), mock.patch('random_gen.numpy', backend):
+                    rng = RandomStream(16)
+                    expected = [rng.randint(lo, hi) for _ in range(50)]
+                    self.assertEqual(list(RandomStream(16).randints(lo, hi, 50)), expected)
+            with self.subTest((label, 'overflow')), mock.patch('random_gen.numpy', backend):
+                self.assertRaises(OverflowError, RandomStream(16).randints, 2 ** 63, 2 ** 64, 5)
+
+    def testShuffle(self):
+        rng = RandomStream(16)
+        RandomGen.set_seed(16)
+        items, expected = list(range(30)), list(range(30))
+        rng.random_shuffle(items)
+        RandomGen.random_shuffle(expected)
+        self.assertEqual(items, expected)
+
+    def testGamesSideBySide(self):
+        def play(game, days):
+            with contextlib.redirect_stdout(io.StringIO()) as output:
+                game.initialise_game()
+                for _ in range(days):
+                    game.simulate_day()
+                    game.finish_day()
+            return re.sub('0x[0-9a-f]+', '', output.getvalue())
+
+        RandomGen.set_seed(16)
+        expected = play(MultiplayerGame(), 3)
+        RandomGen.set_seed(1)
+        first, second = MultiplayerGame(RandomStream(16)), MultiplayerGame(RandomStream(16))
+        play(MultiplayerGame(), 1)
+        self.assertEqual(play(first, 3), expected)
+        self.assertEqual(play(second, 3), expected)
+
+
+if __name__ == '__main__':
+    unittest.main()
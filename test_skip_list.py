@@ -0,0 +1,98 @@
+from skip_list import SkipList
+from random_gen import RandomGen, RandomStream, default_stream
+import random
+import unittest
+
+
+class TestSkipList(unittest.TestCase):
+    """ Testing the skip list against a plain dictionary. """
+
+    def check_links(self, skip_list: SkipList) -> None:
+        for level in range(skip_list.MAX_LEVEL):
+            keys = []
+            current = skip_list.head.forward[level]
+            while current is not None:
+                keys.append(current.key)
+                current = current.forward[level]
+            self.assertEqual(keys, sorted(keys))
+            if level >= skip_list.level:
+                self.assertEqual(keys, [])
+        self.assertEqual([key for key, _ in skip_list.reversed()], list(skip_list)[::-1])
+
+    def testRandomOperations(self):
+        RandomGen.set_seed(16)
+        random.seed(16)
+        for attempt in range(10):
+            with self.subTest(attempt):
+                skip_list = SkipList()
+                expected = {}
+                for _ in range(600):
+                    key = random.randint(0, 300)
+                    choice = random.random()
+                    if key not in expected and choice < 0.6:
+                        skip_list[key] = str(key)
+                        expected[key] = str(key)
+                    elif key in expected and choice < 0.8:
+                        del skip_list[key]
+                        del expected[key]
+                    elif expected and choice < 0.9:
+                        node = skip_list.pop_max()
+                        self.assertEqual((node.key, node.item), max(expected.items()))
+                        del expected[node.key]
+                    elif expected:
+                        node = skip_list.pop_min()
+                        self.assertEqual((node.key, node.item), min(expected.items()))
+                        del expected[node.key]
+
+                self.check_links(skip_list)
+                pairs = sorted(expected.items())
+                self.assertEqual(len(skip_list), len(expected))
+                self.assertEqual(list(skip_list.items()), pairs)
+                self.assertEqual(list(skip_list.iter_from(150)), [pair for pair in pairs if pair[0] >= 150])
+                self.assertEqual(skip_list.range_between(3, 20), [key for key, _ in pairs[3:21]] if len(pairs) > 20 else [])
+                for key in range(300):
+                    self.assertEqual(key in skip_list, key in expected)
+
+    def testReproducibleLevels(self):
+        shapes = []
+        for _ in range(2):
+            RandomGen.set_seed(123)
+            skip_list = SkipList()
+            for key in range(200):
+                skip_list[key] = key
+            current, shape = skip_list.head.forward[0], []
+            while current is not None:
+                shape.append(len(current.forward))
+                current = current.forward[0]
+            shapes.append(shape)
+        self.assertEqual(shapes[0], shapes[1])
+        self.assertGreater(max(shapes[0]), 1)
+
+        # an own stream gives the same shape and leaves the default stream alone
+        RandomGen.set_seed(5)
+        skip_list = SkipList(RandomStream(123))
+        for key in range(200):
+            skip_list[key] = key
+        self.assertEqual([len(node.forward) for node in self.iter_nodes(skip_list)], shapes[0])
+        self.assertEqual(default_stream.seed, 5)
+
+    def iter_nodes(self, skip_list: SkipList):
+        current = skip_list.head.forward[0]
+        while current is not None:
+            yield current
+            current = current.forward[0]
+
+    def testErrors(self):
+        skip_list = SkipList()
+        skip_list[1] = 1
+        self.assertRaises(ValueError, skip_list.__setitem__, 1, 2)
+        self.assertRaises(ValueError, skip_list.__delitem__, 2)
+        self.assertRaises(KeyError, skip_list.__getitem__, 2)
+        self.assertEqual(skip_list.get_maximal(skip_list.get_root()).item, 1)
+        skip_list.pop_max()
+        self.assertTrue(skip_list.is_empty())
+        self.assertRaises(ValueError, skip_list.pop_min)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,91 @@
+from splay_tree import SplayTree
+import random
+import unittest
+
+
+class TestSplayTree(unittest.TestCase):
+    """ Testing that splaying keeps the tree ordered and moves used keys to the root. """
+
+    def check_order(self, current, low=None, high=None) -> int:
+        if current is None:
+            return 0
+        if low is not None:
+            self.assertGreater(current.key, low)
+        if high is not None:
+            self.assertLess(current.key, high)
+        return 1 + self.check_order(current.left, low, current.key) + self.check_order(current.right, current.key, high)
+
+    def testRandomOperations(self):
+        for attempt in range(5):
+            with self.subTest(attempt):
+                tree = SplayTree()
+                expected = {}
+                for _ in range(500):
+                    key = random.randint(0, 150)
+                    if key in expected:
+                        self.assertEqual(tree[key], expected[key])
+                        del tree[key]
+                        del expected[key]
+                    else:
+                        tree[key] = str(key)
+                        expected[key] = str(key)
+                    self.assertEqual(len(tree), len(expected))
+                    self.assertEqual(self.check_order(tree.root), len(expected))
+                self.assertEqual(list(tree.items()), sorted(expected.items()))
+                self.assertNotIn(-1, tree)
+                with self.assertRaises(ValueError):
+                    del tree[-1]
+                if expected:
+                    with self.assertRaises(ValueError):
+                        tree[min(expected)] = None
+
+    def testAccessSplaysToRoot(self):
+        tree = SplayTree()
+        for key in range(100):
+            tree[key] = key
+        self.assertEqual(tree[37], 37)
+        self.assertEqual(tree.root.key, 37)
+
+        maximal = tree.get_maximal(tree.root)
+        self.assertEqual(maximal.key, 99)
+        self.assertIs(tree.root, maximal)
+        del tree[99]
+        self.assertEqual(tree.get_minimal(tree.root).key, 0)
+        self.assertEqual(tree.root.key, 0)
+        self.assertEqual(list(tree), list(range(99)))
+
+
+    def testStatistics(self):
+        tree = SplayTree()
+        tree[0] = 0
+        tree[1] = 1
+        self.assertEqual(tree.statistics(), (0, 0, 0, 0, 0, 0))
+        self.assertNotIn('splay', vars(tree))
+
+        tree.enable_statistics()
+        keys = random.sample(range(1000), 100)
+        for key in keys:
+            tree[key + 2] = key
+        for key in keys:
+            self.assertEqual(tree[key + 2], key)
+        comparisons, visits, operations, depth, left, right = tree.statistics()
+        self.assertEqual(operations, 200)
+        self.assertGreaterEqual(comparisons, visits)
+        self.assertGreaterEqual(visits, operations)
+        self.assertGreater(depth, 1)
+        self.assertLessEqual(depth, len(tree))
+        self.assertGreater(left, 0)
+        self.assertGreater(right, 0)
+
+        tree.reset_statistics()
+        self.assertEqual(tree[tree.root.key], tree.root.item)
+        self.assertEqual(tree.statistics(), (2, 1, 1, 1, 0, 0))
+
+        tree.disable_statistics()
+        tree[-1] = -1
+        self.assertEqual(tree.statistics(), (2, 1, 1, 1, 0, 0))
+        self.assertNotIn('splay', vars(tree))
+
+
+if __name__ == '__main__':
+    unittest.main()
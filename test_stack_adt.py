@@ -0,0 +1,42 @@
+from stack_adt import ArrayStack
+from linked_stack import LinkedStack
+import random
+import unittest
+
+
+class TestArrayStack(unittest.TestCase):
+    """ Testing the array stack against the linked stack. """
+
+    def testAgainstLinkedStack(self):
+        for attempt in range(10):
+            with self.subTest(attempt):
+                stack = ArrayStack()
+                expected = LinkedStack()
+                for _ in range(300):
+                    if not expected.is_empty() and random.random() < 0.4:
+                        self.assertEqual(stack.peek(), expected.peek())
+                        self.assertEqual(stack.pop(), expected.pop())
+                    else:
+                        item = random.randint(0, 1000)
+                        stack.push(item)
+                        expected.push(item)
+                    self.assertEqual(len(stack), len(expected))
+                    self.assertFalse(stack.is_full())
+                while not expected.is_empty():
+                    self.assertEqual(stack.pop(), expected.pop())
+                self.assertTrue(stack.is_empty())
+
+    def testEmpty(self):
+        stack = ArrayStack(4)
+        self.assertRaises(Exception, stack.pop)
+        self.assertRaises(Exception, stack.peek)
+        for item in range(10):
+            stack.push(item)
+        self.assertEqual(len(stack.array), 16)
+        stack.clear()
+        self.assertTrue(stack.is_empty())
+        self.assertRaises(Exception, stack.pop)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,84 @@
+from treap import Treap
+from random_gen import RandomGen, RandomStream, default_stream
+import random
+import unittest
+
+
+class TestTreap(unittest.TestCase):
+    """ Testing the ordering and heap properties of the treap. """
+
+    def check_treap(self, current, low=None, high=None) -> None:
+        if current is None:
+            return
+        if low is not None:
+            self.assertGreater(current.key, low)
+        if high is not None:
+            self.assertLess(current.key, high)
+        for child in (current.left, current.right):
+            if child is not None:
+                self.assertLessEqual(child.priority, current.priority)
+        self.check_treap(current.left, low, current.key)
+        self.check_treap(current.right, current.key, high)
+
+    def testRandomOperations(self):
+        RandomGen.set_seed(16)
+        for attempt in range(5):
+            with self.subTest(attempt):
+                tree = Treap()
+                expected = {}
+                for _ in range(500):
+                    key = random.randint(0, 150)
+                    if key in expected:
+                        self.assertEqual(tree[key], expected[key])
+                        del tree[key]
+                        del expected[key]
+                    else:
+                        tree[key] = str(key)
+                        expected[key] = str(key)
+                    self.assertEqual(len(tree), len(expected))
+                self.check_treap(tree.root)
+                self.assertEqual(list(tree.items()), sorted(expected.items()))
+                self.assertNotIn(-1, tree)
+                with self.assertRaises(ValueError):
+                    del tree[-1]
+                if expected:
+                    with self.assertRaises(ValueError):
+                        tree[min(expected)] = None
+
+    def depth_of(self, tree: Treap, key: int) -> int:
+        depth, current = 0, tree.root
+        while current.key != key:
+            current = current.left if key < current.key else current.right
+            depth += 1
+        return depth
+
+    def testHotKeyRises(self):
+        RandomGen.set_seed(16)
+        tree = Treap()
+        for key in range(1000):
+            tree[key] = key
+        average_depth = sum(self.depth_of(tree, key) for key in range(1000)) / 1000
+
+        for _ in range(50):
+            self.assertEqual(tree[123], 123)
+        self.check_treap(tree.root)
+        self.assertLess(self.depth_of(tree, 123), average_depth)
+
+    def testOwnStream(self):
+        RandomGen.set_seed(16)
+        expected = Treap()
+        for key in range(200):
+            expected[key] = key
+
+        RandomGen.set_seed(5)
+        tree = Treap(RandomStream(16))
+        for key in range(200):
+            tree[key] = key
+        self.assertEqual(default_stream.seed, 5)
+        self.assertEqual([self.depth_of(tree, key) for key in range(200)],
+                         [self.depth_of(expected, key) for key in range(200)])
+        self.assertEqual(tree[50], 50)
+        self.assertEqual(default_stream.seed, 5)
+
+if __name__ == '__main__':
+    unittest.main()
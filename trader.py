@@ -80,29 +80,34 @@ class Trader(ABC):
     Trader ADT class that has 3 different sub-classes
     """
     
-    def __init__(self, name: str = None) -> None:
+    def __init__(self, name: str = None, rng=RandomGen) -> None:
         """
         Initialises variables
 
         Parameters:
             name - Name of the trader
+            rng - The random stream the trader draws its name and deals from
 
         Complexity: O(1)
         """
+        self.rng = rng
         if name == None: 
         # When a trader name is not given, a name is chosen from the original list
-            self.name = RandomGen.random_choice(TRADER_NAMES)
+            self.name = rng.random_choice(TRADER_NAMES)
         else:
             self.name = name
 
     @classmethod
-    def random_trader(cls):
+    def random_trader(cls, rng=RandomGen):
         """
         Randomizes the type of trader
 
+        Parameters:
+            rng - The random stream to draw from, RandomGen's default stream unless given
+
         Complexity: O(1)
         """
-        return cls(RandomGen.random_choice(TRADER_NAMES))
+        return cls(rng.random_choice(TRADER_NAMES), rng)
     
     def set_all_materials(self, mats: list[Material]) -> None:
         """
@@ -176,15 +181,17 @@ class RandomTrader(Trader):
     Trader that randomly selects the material to sell
     """
 
-    def __init__(self, name=None):
+    def __init__(self, name=None, rng=RandomGen):
         """
         Initialises variables
 
         Parameters:
             name - Name of the trader
+            rng - The random stream the trader draws its name and deals from
         """
+        self.rng = rng
         if name == None:
-            self.name = RandomGen.random_choice(TRADER_NAMES)
+            self.name = rng.random_choice(TRADER_NAMES)
         else:
             self.name = name
 
@@ -201,9 +208,9 @@ class RandomTrader(Trader):
         Complexity: O(1)
         """
         # Randomly choose a key and gets the material from the tree node
-        self.material_selected = self.materials.__getitem__(RandomGen.random_choice(self.key_list))
+        self.material_selected = self.materials.__getitem__(self.rng.random_choice(self.key_list))
         # Generates the buy price
-        self.buy_price = round(2 + 8 * RandomGen.random_float(), 2)
+        self.buy_price = round(2 + 8 * self.rng.random_float(), 2)
         # Calls current deal to set the deal
         self.current_deal()
 
@@ -269,15 +276,17 @@ class RangeTrader(Trader):
     Trader that selects the material from a range of mining rates to sell
     """
 
-    def __init__(self, name=None):
+    def __init__(self, name=None, rng=RandomGen):
         """
         Initialises variables
 
         Parameters:
             name - Name of the trader
+            rng - The random stream the trader draws its name and deals from
         """
+        self.rng = rng
         if name == None:
-            self.name = RandomGen.random_choice(TRADER_NAMES)
+            self.name = rng.random_choice(TRADER_NAMES)
         else:
             self.name = name
         self.material_selected = Material("",0)
@@ -297,12 +306,12 @@ class RangeTrader(Trader):
             self.material_selected = self.materials.__getitem__(self.key_list[0])
         else:
             # randomly generates the i and j
-            i = RandomGen.randint(0,self.materials.__len__()-1)
-            j = RandomGen.randint(i,self.materials.__len__()-1)
+            i = self.rng.randint(0,self.materials.__len__()-1)
+            j = self.rng.randint(i,self.materials.__len__()-1)
             # chooses the material from the ranged list
-            self.material_selected = RandomGen.random_choice(self.materials_between(i,j))
+            self.material_selected = self.rng.random_choice(self.materials_between(i,j))
         # Generates the buy price
-        self.buy_price = round(2 + 8 * RandomGen.random_float(), 2)
+        self.buy_price = round(2 + 8 * self.rng.random_float(), 2)
         # Calls current deal to set the deal
         self.current_deal()
     
@@ -387,15 +396,17 @@ class HardTrader(Trader):
     Trader that selects the material with highest mining rate to sell
     """
 
-    def __init__(self, name=None):
+    def __init__(self, name=None, rng=RandomGen):
         """
         Initialises variables
 
         Parameters:
             name - Name of the trader
+            rng - The random stream the trader draws its name and deals from
         """
+        self.rng = rng
         if name == None:
-            self.name = RandomGen.random_choice(TRADER_NAMES)
+            self.name = rng.random_choice(TRADER_NAMES)
         else:
             self.name = name
         self.material_selected = Material("",0)
@@ -410,12 +421,10 @@ class HardTrader(Trader):
 
         Complexity: O(1)
         """
-        # gets the material that has the highest mining rate
-        self.material_selected = (self.materials.get_maximal(self.materials.get_root())).item
-        # deletes the material from the tree
-        self.materials.__delitem__(self.material_selected.get_mining_rate())
+        # removes the material that has the highest mining rate from the tree
+        self.material_selected = self.materials.pop_max().item
         # Generates the buy price
-        self.buy_price = round(2 + 8 * RandomGen.random_float(), 2)
+        self.buy_price = round(2 + 8 * self.rng.random_float(), 2)
         # Calls current deal to set the deal
         self.current_deal()
 
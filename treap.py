@@ -0,0 +1,163 @@
+""" Treap implemented on top of the standard BST.
+
+Every node carries a random priority drawn from RandomGen (the default
+stream, or the stream given to the constructor) and the tree is kept
+heap-ordered on priorities, which makes its shape that of a BST built
+by inserting the keys in random order. A successful lookup draws a
+fresh priority for the node and keeps the larger one, so keys that are
+looked up often drift towards the root.
+"""
+
+from __future__ import annotations
+
+__docformat__ = 'reStructuredText'
+
+from bst import BinarySearchTree
+from typing import TypeVar, Generic
+from node import TreapNode
+from random_gen import RandomGen
+import operator
+
+K = TypeVar('K')
+I = TypeVar('I')
+
+
+class Treap(BinarySearchTree, Generic[K, I]):
+    """ Randomised binary search tree with access-boosted priorities. """
+
+    def __init__(self, rng=RandomGen) -> None:
+        """
+            Initialises an empty treap drawing its priorities from rng,
+            RandomGen's default stream unless given.
+            :complexity: O(1)
+        """
+        self.rng = rng
+        BinarySearchTree.__init__(self)
+
+    def create_node(self, key: K, item: I) -> TreapNode:
+        """
+        Creates a new node with a random priority.
+
+        Complexity: O(1)
+        """
+        return TreapNode(key, item, self.rng.random())
+
+    def enable_statistics(self) -> None:
+        """
+            Starts counting the operations on this tree from zero, including
+            accesses and rotations.
+            :complexity: O(1)
+        """
+        if self.statistics_enabled:
+            return
+        BinarySearchTree.enable_statistics(self)
+        self.count_descent('access_aux', operator.eq)
+        self.count_rotations()
+
+    def left_rotate(self, current: TreapNode) -> TreapNode:
+        """
+            Perform left rotation of the sub-tree: the right child of current
+            becomes the root of the sub-tree. Returns the new root.
+            :complexity: O(1)
+        """
+        new_root = current.right
+        current.right = new_root.left
+        new_root.left = current
+        return new_root
+
+    def right_rotate(self, current: TreapNode) -> TreapNode:
+        """
+            Perform right rotation of the sub-tree: the left child of current
+            becomes the root of the sub-tree. Returns the new root.
+            :complexity: O(1)
+        """
+        new_root = current.left
+        current.left = new_root.right
+        new_root.right = current
+        return new_root
+
+    def insert_aux(self, current: TreapNode, key: K, item: I) -> TreapNode:
+        """
+            Inserts the item as a leaf, then rotates it up while its priority
+            is larger than its parent's.
+
+            :complexity: O(CompK * D) where D is the depth of the tree, O(log N) expected
+            :raises ValueError: if the key is already in the tree
+        """
+        if current is None:  # base case: at the leaf
+            self.length += 1
+            return self.create_node(key, item)
+        elif key < current.key:
+            current.left = self.insert_aux(current.left, key, item)
+            if current.left.priority > current.priority:
+                current = self.right_rotate(current)
+        elif key > current.key:
+            current.right = self.insert_aux(current.right, key, item)
+            if current.right.priority > current.priority:
+                current = self.left_rotate(current)
+        else:  # key == current.key
+            raise ValueError('Inserting duplicate item')
+        return current
+
+    def delete_aux(self, current: TreapNode, key: K) -> TreapNode:
+        """
+            Rotates the node holding key down, always lifting the child with
+            the larger priority, until it has at most one child, then unlinks it.
+
+            :complexity: O(CompK * D) where D is the depth of the tree, O(log N) expected
+            :raises ValueError: if the key is not in the tree
+        """
+        if current is None:  # key not found
+            raise ValueError('Deleting non-existent item')
+        elif key < current.key:
+            current.left = self.delete_aux(current.left, key)
+        elif key > current.key:
+            current.right = self.delete_aux(current.right, key)
+        elif current.left is None:
+            self.length -= 1
+            return current.right
+        elif current.right is None:
+            self.length -= 1
+            return current.left
+        elif current.left.priority > current.right.priority:
+            current = self.right_rotate(current)
+            current.right = self.delete_aux(current.right, key)
+        else:
+            current = self.left_rotate(current)
+            current.left = self.delete_aux(current.left, key)
+        return current
+
+    def get_tree_node_by_key(self, key: K) -> TreapNode:
+        """
+            Returns the node holding key, giving it a chance to move up.
+
+            Complexity: see access_aux(self, current: TreapNode, key: K) -> tuple[TreapNode, TreapNode]
+            :raises KeyError: if the key is not in the tree
+        """
+        self.root, found = self.access_aux(self.root, key)
+        return found
+
+    def access_aux(self, current: TreapNode, key: K) -> tuple[TreapNode, TreapNode]:
+        """
+            Finds the node holding key in the sub-tree of current, raises its
+            priority to a fresh random draw if that is larger, and restores the
+            heap order on the way back up. Returns the new root of the sub-tree
+            and the node found.
+
+            :complexity: O(CompK * D) where D is the depth of the tree, O(log N) expected
+            :raises KeyError: if the key is not in the tree
+        """
+        if current is None:
+            raise KeyError('Key not found: {0}'.format(key))
+        elif key == current.key:
+            current.priority = max(current.priority, self.rng.random())
+            return current, current
+        elif key < current.key:
+            current.left, found = self.access_aux(current.left, key)
+            if current.left.priority > current.priority:
+                current = self.right_rotate(current)
+        else:  # key > current.key
+            current.right, found = self.access_aux(current.right, key)
+            if current.right.priority > current.priority:
+                current = self.left_rotate(current)
+        return current, found